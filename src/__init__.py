@@ -1,3 +1,8 @@
 """Inicialização do pacote Tabela-de-dobra; define a versão do pacote."""
 
+from src.utils.perfil_importacao import ativar_se_configurado
+
 __version__ = "2.7.0"
+
+# CALCULADORA_DOBRA_PERFIL_IMPORTS=1 mede o tempo de importação de cada módulo
+ativar_se_configurado()
@@ -1,6 +1,7 @@
 """Formulário principal do aplicativo de Calculadora de Dobra."""
 
 import logging
+import multiprocessing
 import os
 import signal
 import sys
@@ -93,6 +94,10 @@ class MainWindow(ThemedMainWindow):
         if os.path.exists(ipc_manager.AVISOS_SIGNAL_FILE):
             self.fs_watcher.addPath(ipc_manager.AVISOS_SIGNAL_FILE)
 
+        # Monitora o sinal de escrita em dados (invalidação de cache por versão)
+        if os.path.exists(ipc_manager.DADOS_SIGNAL_FILE):
+            self.fs_watcher.addPath(ipc_manager.DADOS_SIGNAL_FILE)
+
         # Monitora o diretório de comandos (para shutdown imediato)
         if os.path.exists(ipc_manager.COMMAND_DIR):
             self.fs_watcher.addPath(ipc_manager.COMMAND_DIR)
@@ -107,12 +112,15 @@ class MainWindow(ThemedMainWindow):
             if g.AVISOS_WIDGET:
                 # Usa QTimer para garantir execução na thread principal e dar debounce
                 QTimer.singleShot(100, g.AVISOS_WIDGET.refresh)
+        elif path == ipc_manager.DADOS_SIGNAL_FILE:
+            logging.info("Sinal de alteração de dados recebido.")
+            QTimer.singleShot(100, sincronizar_versoes_cache)
 
-            # Re-adiciona o path se o arquivo for recriado
-            if not os.path.exists(path):
-                pass
-            elif path not in self.fs_watcher.files():
-                self.fs_watcher.addPath(path)
+        # Re-adiciona o path se o arquivo for recriado
+        if not os.path.exists(path):
+            pass
+        elif path not in self.fs_watcher.files():
+            self.fs_watcher.addPath(path)
 
     def _on_signal_dir_changed(self, path):
         """Trata alterações nos diretórios monitorados (Comandos)."""
@@ -535,14 +543,29 @@ def configurar_sinais_excecoes():
     signal.signal(signal.SIGTERM, signal_handler)
 
 
+def sincronizar_versoes_cache():
+    """Invalida o cache das tabelas alteradas por outras instâncias."""
+    try:
+        from src.utils.cache_manager import (  # pylint: disable=import-outside-toplevel
+            cache_manager,
+        )
+
+        cache_manager.agendar_sincronizacao_versoes()
+    except (OSError, RuntimeError, ImportError) as e:
+        logging.warning("Erro ao sincronizar versões do cache: %s", e)
+
+
 def system_tick():
     """
     Função chamada periodicamente pelo timer do sistema.
 
     Executa tarefas de manutenção como atualizar heartbeat.
     A verificação de comandos/shutdown agora é feita por FileWatcher (event-driven).
+    As versões de dados também são conferidas aqui, caso o sinal de alteração
+    não seja entregue (ex.: watcher em compartilhamento de rede).
     """
     atualizar_heartbeat_sessao()
+    sincronizar_versoes_cache()
 
 
 def iniciar_timers():
@@ -636,4 +659,6 @@ def main():  # pylint: disable=too-many-locals
 
 
 if __name__ == "__main__":
+    # Necessário para os processos de conversão no executável empacotado
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -0,0 +1,283 @@
+"""Processamento headless de cálculos de dobra em lote.
+
+Permite executar os cálculos de ``src.utils.calculos`` sem a interface gráfica
+(e sem importar o PySide6), lendo trabalhos de um arquivo CSV ou JSON Lines e
+emitindo os resultados de forma contínua, linha a linha.
+
+Cada trabalho contém ``material``, ``espessura``, ``canal``, ``raio_interno``,
+``comprimento`` e as abas (lista ``abas`` em JSON; em CSV, coluna ``abas``
+separada por ``;`` ou colunas ``aba1``, ``aba2``...). Opcionalmente aceita
+``deducao_especifica`` e um ``id`` que é repassado à saída.
+
+Uso:
+    python -m src.calc_batch trabalhos.csv -o resultados.jsonl
+    python -m src.calc_batch - --formato jsonl < trabalhos.jsonl
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+from contextlib import ExitStack
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from src.utils import calculos
+from src.utils.deducao_index import deducao_index
+
+TAMANHO_LOTE_PADRAO = 512
+
+CAMPOS_SAIDA = [
+    "id",
+    "material",
+    "espessura",
+    "canal",
+    "deducao",
+    "observacao",
+    "fator_k",
+    "offset",
+    "aba_minima",
+    "z_minimo",
+    "forca",
+    "total_abas",
+    "blank",
+    "erro",
+]
+
+
+def _para_float(valor: Any) -> float:
+    """Converte valores vindos de CSV/JSON para float (0.0 se vazio)."""
+    if isinstance(valor, (int, float)):
+        return float(valor)
+    return calculos.converter_para_float(valor if isinstance(valor, str) else "")
+
+
+def _extrair_abas(trabalho: Dict[str, Any]) -> List[float]:
+    """Obtém a lista de abas do trabalho, aceitando lista, texto ou colunas."""
+    abas = trabalho.get("abas")
+    if isinstance(abas, (list, tuple)):
+        return [_para_float(v) for v in abas]
+    if isinstance(abas, str) and abas.strip():
+        return [_para_float(v) for v in abas.split(";")]
+
+    colunas = sorted(
+        (
+            k
+            for k in trabalho
+            if isinstance(k, str) and k.startswith("aba") and k[3:].isdigit()
+        ),
+        key=lambda k: int(k[3:]),
+    )
+    return [_para_float(trabalho[k]) for k in colunas]
+
+
+def _calcular_parametros(trabalho: Dict[str, Any]) -> Dict[str, Any]:
+    """Calcula os parâmetros de um trabalho, exceto as medidas de dobra."""
+    material = str(trabalho.get("material") or "").strip()
+    canal = str(trabalho.get("canal") or "").strip()
+    espessura = _para_float(trabalho.get("espessura"))
+    raio_interno = _para_float(trabalho.get("raio_interno"))
+    comprimento = _para_float(trabalho.get("comprimento"))
+    deducao_espec = _para_float(trabalho.get("deducao_especifica"))
+
+    resultado: Dict[str, Any] = {
+        "id": trabalho.get("id"),
+        "material": material,
+        "espessura": espessura,
+        "canal": canal,
+    }
+
+    entrada = (
+        deducao_index.get_deducao(material, espessura, canal)
+        if material and canal and espessura > 0
+        else None
+    )
+    deducao_db = entrada["valor"] if entrada else None
+    resultado["deducao"] = deducao_db
+    resultado["observacao"] = (entrada["observacao"] or "") if entrada else None
+
+    deducao_usada = deducao_espec if deducao_espec > 0 else float(deducao_db or 0.0)
+
+    res_k = calculos.CalculoFatorK().calcular(
+        espessura, raio_interno, deducao_usada, material
+    )
+    resultado["fator_k"] = res_k["fator_k"] if res_k else None
+    resultado["offset"] = res_k["offset"] if res_k else None
+    resultado["aba_minima"] = calculos.CalculoAbaMinima().calcular(canal, espessura)
+    resultado["z_minimo"] = calculos.CalculoZMinimo().calcular(
+        espessura, deducao_usada, canal
+    )
+    res_forca = calculos.CalculoForca().calcular(
+        comprimento, espessura, material, canal
+    )
+    resultado["forca"] = res_forca["forca"] if res_forca else None
+    resultado["_deducao_usada"] = deducao_usada
+    return resultado
+
+
+def _processar_lote(trabalhos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Calcula um lote de trabalhos, com os blanks em uma única passagem."""
+    resultados: List[Dict[str, Any]] = []
+    abas_lote: List[List[float]] = []
+    for trabalho in trabalhos:
+        try:
+            resultado = _calcular_parametros(trabalho)
+            abas = _extrair_abas(trabalho)
+        except (TypeError, ValueError, AttributeError) as e:
+            resultado, abas = {"id": trabalho.get("id"), "erro": str(e)}, []
+        resultados.append(resultado)
+        abas_lote.append(abas)
+
+    largura = max((len(abas) for abas in abas_lote), default=0)
+    if largura == 0:
+        largura = 1
+    matriz = [abas + [0.0] * (largura - len(abas)) for abas in abas_lote]
+    deducoes = [r.pop("_deducao_usada", 0.0) for r in resultados]
+    lote = calculos.CalculoDobraLote().calcular(matriz, deducoes)
+
+    for linha, resultado in enumerate(resultados):
+        if "erro" in resultado:
+            continue
+        valido = bool(lote["valido"][linha])
+        resultado["total_abas"] = float(lote["total_abas"][linha]) if valido else None
+        resultado["blank"] = float(lote["blank_total"][linha]) if valido else None
+    return resultados
+
+
+def processar_trabalhos(
+    trabalhos: Iterable[Dict[str, Any]], tamanho_lote: int = TAMANHO_LOTE_PADRAO
+) -> Iterator[Dict[str, Any]]:
+    """Calcula os trabalhos e produz os resultados à medida que ficam prontos.
+
+    Args:
+        trabalhos: Iterável de dicionários com os dados de cada trabalho.
+        tamanho_lote: Quantidade de trabalhos agrupados por cálculo vetorizado.
+
+    Yields:
+        dict: Resultado de cada trabalho, na mesma ordem da entrada.
+    """
+    iterador = iter(trabalhos)
+    while True:
+        lote = list(islice(iterador, max(1, tamanho_lote)))
+        if not lote:
+            return
+        yield from _processar_lote(lote)
+
+
+def ler_trabalhos(arquivo: TextIO, formato: str) -> Iterator[Dict[str, Any]]:
+    """Lê trabalhos de um arquivo CSV ou JSON Lines sem carregá-lo inteiro."""
+    if formato == "csv":
+        yield from csv.DictReader(arquivo)
+        return
+    for numero, linha in enumerate(arquivo, start=1):
+        linha = linha.strip()
+        if not linha:
+            continue
+        try:
+            trabalho = json.loads(linha)
+        except json.JSONDecodeError as e:
+            logging.error("Linha %d ignorada (JSON inválido): %s", numero, e)
+            continue
+        if not isinstance(trabalho, dict):
+            logging.error(
+                "Linha %d ignorada (esperado um objeto JSON, obtido %s)",
+                numero,
+                type(trabalho).__name__,
+            )
+            continue
+        yield trabalho
+
+
+def escrever_resultados(
+    resultados: Iterable[Dict[str, Any]], saida: TextIO, formato: str
+) -> int:
+    """Escreve os resultados na saída no formato indicado e retorna o total."""
+    total = 0
+    if formato == "csv":
+        writer = csv.DictWriter(saida, fieldnames=CAMPOS_SAIDA, extrasaction="ignore")
+        writer.writeheader()
+        for resultado in resultados:
+            writer.writerow(resultado)
+            total += 1
+        return total
+    for resultado in resultados:
+        saida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+        total += 1
+    return total
+
+
+def _detectar_formato(caminho: str, formato: Optional[str]) -> str:
+    """Define o formato pelo argumento explícito ou pela extensão do arquivo."""
+    if formato:
+        return formato
+    return "csv" if caminho.lower().endswith(".csv") else "jsonl"
+
+
+def parse_arguments(argv=None):
+    """Analisa e processa os argumentos fornecidos via linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Cálculo de dobras em lote, sem interface gráfica."
+    )
+    parser.add_argument(
+        "entrada", help="Arquivo de trabalhos (.csv ou .jsonl); '-' para stdin."
+    )
+    parser.add_argument(
+        "-o", "--saida", default="-", help="Arquivo de saída (padrão: stdout)."
+    )
+    parser.add_argument(
+        "--formato", choices=["csv", "jsonl"], help="Formato da entrada."
+    )
+    parser.add_argument(
+        "--formato-saida",
+        choices=["csv", "jsonl"],
+        help="Formato da saída (padrão: pela extensão, ou jsonl).",
+    )
+    parser.add_argument(
+        "--lote",
+        type=int,
+        default=TAMANHO_LOTE_PADRAO,
+        help=f"Trabalhos por lote vetorizado (padrão: {TAMANHO_LOTE_PADRAO}).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Função principal do processamento em lote."""
+    args = parse_arguments(argv)
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+
+    formato_entrada = _detectar_formato(args.entrada, args.formato)
+    formato_saida = _detectar_formato(args.saida, args.formato_saida)
+
+    if not deducao_index.ensure_loaded():
+        logging.error("Não foi possível carregar as deduções do banco de dados.")
+        return 1
+
+    with ExitStack() as pilha:
+        entrada = (
+            sys.stdin
+            if args.entrada == "-"
+            else pilha.enter_context(
+                open(args.entrada, "r", encoding="utf-8", newline="")
+            )
+        )
+        saida = (
+            sys.stdout
+            if args.saida == "-"
+            else pilha.enter_context(
+                open(args.saida, "w", encoding="utf-8", newline="")
+            )
+        )
+        total = escrever_resultados(
+            processar_trabalhos(ler_trabalhos(entrada, formato_entrada), args.lote),
+            saida,
+            formato_saida,
+        )
+
+    logging.info("%d trabalhos processados.", total)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
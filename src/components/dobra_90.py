@@ -1,6 +1,7 @@
 """Cria e gerencia o frame de dobras com widgets auto-ajustáveis."""
 
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Tuple
 
 from PySide6.QtCore import Qt
@@ -9,6 +10,7 @@ from PySide6.QtWidgets import QGridLayout, QGroupBox, QLabel, QLineEdit
 from src.config import globals as g
 from src.utils.utilitarios import resolver_expressao_no_line_edit
 from src.utils.interface import (
+    atualizar_aba,
     calcular_valores,
     copiar,
     focus_next_entry,
@@ -90,8 +92,9 @@ def configurar_eventos_entry(entry, config: ConfigEntry):
     """
     # Conectar eventos
 
-    # Apenas recalcula enquanto digita, sem resolver a expressão antes do usuário terminar
-    entry.textChanged.connect(calcular_valores)
+    # Apenas recalcula enquanto digita, sem resolver a expressão antes do usuário
+    # terminar; só a coluna desta aba é recalculada
+    entry.textChanged.connect(partial(atualizar_aba, config.w, config.i))
 
     def on_return_pressed():
         resolver_expressao_no_line_edit(entry)
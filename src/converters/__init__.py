@@ -4,9 +4,16 @@ Este módulo centraliza toda a lógica de conversão de arquivos entre diferente
 (DWG, DXF, PDF, TIF), separando a lógica de negócio da interface gráfica.
 """
 
-from src.converters.worker import CONVERSION_HANDLERS, ConversionWorker
+from src.converters.worker import ConversionWorker, get_conversion_handlers
 
 __all__ = [
-    "CONVERSION_HANDLERS",
     "ConversionWorker",
+    "get_conversion_handlers",
 ]
+
+
+def __getattr__(nome: str):
+    """Mantém ``CONVERSION_HANDLERS`` sem verificar dependências na importação."""
+    if nome == "CONVERSION_HANDLERS":
+        return get_conversion_handlers()
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
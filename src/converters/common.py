@@ -6,9 +6,12 @@ eliminando duplicação de código e melhorando manutenibilidade.
 
 import logging
 import os
+import shutil
 import subprocess
 import sys
-from typing import Optional
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from src.utils.utilitarios import run_trusted_command
 
@@ -51,6 +54,13 @@ def get_file_destination(
     return path_destino
 
 
+def obter_nome_destino_dxf(nome_base: str, page_index: int, total_pages: int) -> str:
+    """Determina o nome do DXF de uma página (sufixo ``_pN`` se houver várias)."""
+    if total_pages == 1:
+        return f"{nome_base}.dxf"
+    return f"{nome_base}_p{page_index}.dxf"
+
+
 def extract_error_message(exc: Exception) -> str:
     """Extrai mensagem de erro clara de uma exceção.
 
@@ -158,15 +168,147 @@ def build_subprocess_failure(
     return (False, msg, None)
 
 
-def run_oda_command(command: list[str], description: str):
+# Tempo limite (s) de uma execução do ODA Converter: mínimo e adicional por arquivo
+ODA_TIMEOUT_MINIMO = 300
+ODA_TIMEOUT_POR_ARQUIVO = 60
+
+
+def log_subprocess_output(
+    result: Any, context: str, *, stderr_level: int = logging.DEBUG
+) -> None:
+    """Registra stdout/stderr de um subprocesso concluído."""
+    stdout = getattr(result, "stdout", "")
+    if stdout:
+        logging.debug("%s stdout:\n%s", context, str(stdout).strip())
+
+    stderr = getattr(result, "stderr", "")
+    if stderr:
+        logging.log(stderr_level, "%s stderr:\n%s", context, str(stderr).strip())
+
+
+def run_oda_command(
+    command: list[str], description: str, timeout: int = ODA_TIMEOUT_MINIMO
+):
     """Executa o ODA Converter com parâmetros padrão."""
 
     return run_trusted_command(
         command,
         description=description,
         capture_output=True,
-        timeout=300,
+        timeout=timeout,
         startupinfo=prepare_startupinfo(),
         text=True,
         encoding="utf-8",
     )
+
+
+def _vincular_ou_copiar(origem: str, destino: str) -> None:
+    """Cria um hard link para o arquivo ou, se não for possível, uma cópia."""
+    try:
+        os.link(origem, destino)
+    except OSError:
+        shutil.copy2(origem, destino)
+
+
+def _preparar_entrada_oda(
+    entrada: str, paths: List[str], extensao: str
+) -> List[Tuple[str, str]]:
+    """Coloca os arquivos na pasta de entrada do ODA com um prefixo numérico.
+
+    Returns:
+        Lista de (path_origem, nome esperado do arquivo de saída em minúsculas)
+    """
+    nomes_saida: List[Tuple[str, str]] = []
+    for indice, path_origem in enumerate(paths):
+        nome = f"{indice:04d}_{os.path.basename(path_origem)}"
+        _vincular_ou_copiar(path_origem, os.path.join(entrada, nome))
+        nome_saida = f"{os.path.splitext(nome)[0]}.{extensao}"
+        nomes_saida.append((path_origem, nome_saida.lower()))
+    return nomes_saida
+
+
+@contextmanager
+def executar_oda_em_lote(
+    oda_executable: str,
+    paths: List[str],
+    versao: str,
+    formato: str,
+    description: str,
+) -> Iterator[Dict[str, Optional[str]]]:
+    """Converte vários desenhos com uma única execução do ODA Converter.
+
+    O ODA Converter processa uma pasta inteira por execução. Os arquivos (que
+    podem vir de pastas diferentes e ter nomes repetidos) são colocados em uma
+    pasta temporária com um prefixo numérico, e cada saída é associada de volta
+    ao arquivo de origem pelo nome. Os arquivos gerados só existem dentro do
+    bloco ``with``.
+
+    Args:
+        oda_executable: Caminho do executável ODA Converter
+        paths: Arquivos DWG de origem
+        versao: Versão de saída (ex.: "ACAD2013")
+        formato: Formato de saída ("DWG" ou "DXF")
+        description: Descrição usada nos logs do subprocesso
+
+    Yields:
+        Dict {path_origem: caminho do arquivo convertido ou None se faltou}
+    """
+    extensao = formato.lower()
+    with tempfile.TemporaryDirectory() as entrada:
+        with tempfile.TemporaryDirectory() as saida:
+            nomes_saida = _preparar_entrada_oda(entrada, paths, extensao)
+
+            command = [oda_executable, entrada, saida, versao, formato]
+            command += ["0", "1", "*.DWG"]
+            timeout = max(ODA_TIMEOUT_MINIMO, ODA_TIMEOUT_POR_ARQUIVO * len(paths))
+            result = run_oda_command(command, description, timeout=timeout)
+            log_subprocess_output(result, "ODA Converter")
+
+            gerados = {n.lower(): os.path.join(saida, n) for n in os.listdir(saida)}
+            yield {origem: gerados.get(nome) for origem, nome in nomes_saida}
+
+
+def converter_em_lote_oda(
+    oda_executable: Optional[str],
+    paths: List[str],
+    saida: Tuple[str, str],
+    etapa: str,
+    finalizar: Callable[[Optional[str], str], Tuple[bool, str, Any]],
+) -> List[Tuple[bool, str, Any]]:
+    """Executa ``executar_oda_em_lote`` e trata as falhas de todo o lote.
+
+    Sem ODA configurado, ou se a execução falhar, todos os arquivos recebem o
+    mesmo resultado de falha.
+
+    Args:
+        oda_executable: Caminho do executável ODA Converter (ou None)
+        paths: Arquivos DWG de origem
+        saida: Versão e formato de saída (ex.: ("ACAD2013", "DWG"))
+        etapa: Descrição da conversão usada nos logs (ex.: "DWG->PDF")
+        finalizar: Recebe o arquivo convertido (ou None) e o de origem e
+            retorna o resultado daquele arquivo
+
+    Returns:
+        Lista com um Tuple (sucesso, mensagem, resultado) por arquivo, na mesma
+        ordem de ``paths``.
+    """
+    if not oda_executable:
+        falha = (False, "ODA Converter não está configurado corretamente.", None)
+        return [falha] * len(paths)
+
+    nomes = ", ".join(os.path.basename(p) for p in paths)
+    versao, formato = saida
+    try:
+        with executar_oda_em_lote(
+            oda_executable, paths, versao, formato, f"ODA Converter {etapa}"
+        ) as convertidos:
+            return [finalizar(convertidos[path], path) for path in paths]
+    except (
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+        FileNotFoundError,
+    ) as exc:
+        falha = build_subprocess_failure(exc, nomes, f"conversão {etapa}")
+        return [falha] * len(paths)
+    except OSError as exc:
+        return [(False, log_os_error(exc, nomes), None)] * len(paths)
@@ -7,55 +7,15 @@ reduzindo o tamanho de worker.py.
 import logging
 import os
 import shutil
-import subprocess
-import tempfile
-from pathlib import Path
 from typing import Optional
 
 from src.converters.common import (
+    converter_em_lote_oda,
     get_file_destination,
-    handle_subprocess_error,
     log_os_error,
-    run_oda_command,
 )
 
 
-def _executar_oda_converter(
-    path_origem: str,
-    oda_executable: str,
-    nome_arquivo: str,
-    temp_dir: str,
-) -> Optional[str]:
-    """Executa ODA Converter e retorna caminho do arquivo convertido.
-
-    Returns:
-        Caminho do arquivo convertido ou None se falhar
-    """
-    nome_base = os.path.splitext(nome_arquivo)[0]
-    nome_dwg_2013 = nome_base + ".dwg"
-
-    command = [
-        oda_executable,
-        os.path.dirname(path_origem),
-        temp_dir,
-        "ACAD2013",
-        "DWG",
-        "0",
-        "1",
-        nome_arquivo,
-    ]
-
-    run_oda_command(command, "ODA Converter DWG->DWG 2013")
-
-    expected_dwg = Path(temp_dir, nome_dwg_2013)
-    if expected_dwg.exists():
-        return str(expected_dwg)
-
-    # Fallback: qualquer arquivo DXF gerado
-    fallback = next(Path(temp_dir).glob("*.dwg"), None)
-    return str(fallback) if fallback else None
-
-
 def _substituir_arquivo_original(
     arquivo_convertido: str,
     path_origem: str,
@@ -124,78 +84,99 @@ def _salvar_em_pasta_destino(
     return (True, "Conversão bem-sucedida", [path_destino])
 
 
-def converter_dwg_para_dwg_2013(
-    path_origem: str,
+def converter_dwg_para_dwg_2013_lote(
+    paths_origem: list[str],
     pasta_destino: str,
     oda_executable: str,
     substituir_original: bool = False,
     ensure_unique_path_func=None,
-) -> tuple[bool, str, Optional[list[str]]]:
-    """Converte DWG para DWG versão 2013.
+) -> list[tuple[bool, str, Optional[list[str]]]]:
+    """Converte vários DWG para a versão 2013 com uma única execução do ODA.
 
     Args:
-        path_origem: Caminho do arquivo DWG original
-        pasta_destino: Pasta onde salvar o resultado
+        paths_origem: Caminhos dos arquivos DWG originais
+        pasta_destino: Pasta onde salvar os resultados
         oda_executable: Caminho do executável ODA Converter
-        substituir_original: Se True, substitui o original com backup .bak
+        substituir_original: Se True, substitui cada original com backup .bak
         ensure_unique_path_func: Função para garantir caminhos únicos
 
     Returns:
-        Tuple (sucesso, mensagem, lista_de_arquivos_criados)
+        Lista com um Tuple (sucesso, mensagem, lista_de_arquivos_criados) por
+        arquivo, na mesma ordem de ``paths_origem``.
     """
+    return converter_em_lote_oda(
+        oda_executable,
+        paths_origem,
+        ("ACAD2013", "DWG"),
+        "DWG->DWG 2013",
+        lambda convertido, path_origem: _finalizar_conversao(
+            convertido,
+            path_origem,
+            pasta_destino,
+            substituir_original,
+            ensure_unique_path_func,
+        ),
+    )
+
+
+def _finalizar_conversao(
+    arquivo_convertido: Optional[str],
+    path_origem: str,
+    pasta_destino: str,
+    substituir_original: bool,
+    ensure_unique_path_func=None,
+) -> tuple[bool, str, Optional[list[str]]]:
+    """Move o DWG convertido para o destino final (ou sobre o original)."""
     nome_arquivo = os.path.basename(path_origem)
     nome_base = os.path.splitext(nome_arquivo)[0]
 
-    if not oda_executable:
-        return (
-            False,
-            "ODA Converter não está configurado corretamente.",
-            None,
-        )
+    if not arquivo_convertido:
+        logging.error("FALHA: Arquivo DWG 2013 não foi criado para %s.", nome_arquivo)
+        return (False, "Arquivo DWG 2013 não foi criado.", None)
 
     try:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            arquivo_convertido = _executar_oda_converter(
-                path_origem,
-                oda_executable,
-                nome_arquivo,
-                temp_dir,
-            )
-
-            if not arquivo_convertido:
-                logging.error("FALHA: Arquivo DWG 2013 não foi criado.")
-                return (
-                    False,
-                    "Arquivo DWG 2013 não foi criado.",
-                    None,
-                )
-
-            if substituir_original:
-                return _substituir_arquivo_original(
-                    arquivo_convertido,
-                    path_origem,
-                    pasta_destino,
-                    nome_base,
-                    ensure_unique_path_func,
-                )
-
-            return _salvar_em_pasta_destino(
+        if substituir_original:
+            return _substituir_arquivo_original(
                 arquivo_convertido,
+                path_origem,
                 pasta_destino,
                 nome_base,
                 ensure_unique_path_func,
             )
 
-    except (
-        subprocess.CalledProcessError,
-        subprocess.TimeoutExpired,
-        FileNotFoundError,
-    ) as exc:
-        msg = handle_subprocess_error(
-            exc,
-            nome_arquivo,
-            "conversão DWG->DWG 2013",
+        return _salvar_em_pasta_destino(
+            arquivo_convertido,
+            pasta_destino,
+            nome_base,
+            ensure_unique_path_func,
         )
-        return (False, msg, None)
     except OSError as exc:
         return (False, log_os_error(exc, nome_arquivo), None)
+
+
+def converter_dwg_para_dwg_2013(
+    path_origem: str,
+    pasta_destino: str,
+    oda_executable: str,
+    substituir_original: bool = False,
+    ensure_unique_path_func=None,
+) -> tuple[bool, str, Optional[list[str]]]:
+    """Converte um único DWG para DWG versão 2013.
+
+    Args:
+        path_origem: Caminho do arquivo DWG original
+        pasta_destino: Pasta onde salvar o resultado
+        oda_executable: Caminho do executável ODA Converter
+        substituir_original: Se True, substitui o original com backup .bak
+        ensure_unique_path_func: Função para garantir caminhos únicos
+
+    Returns:
+        Tuple (sucesso, mensagem, lista_de_arquivos_criados)
+    """
+    return converter_dwg_para_dwg_2013_lote(
+        [path_origem],
+        pasta_destino,
+        oda_executable,
+        substituir_original,
+        ensure_unique_path_func,
+    )[0]
@@ -4,58 +4,54 @@ Este módulo concentra a lógica de conversão de DWG para PDF,
 utilizando o ODA Converter (DWG->DXF) e depois renderizando para PDF.
 """
 
-import os
-import subprocess
-import tempfile
 from typing import Optional
 
-from src.converters.common import (
-    build_subprocess_failure,
-    log_os_error,
-)
+from src.converters.common import converter_em_lote_oda
 
-SUBPROCESS_ERRORS = (
-    subprocess.CalledProcessError,
-    subprocess.TimeoutExpired,
-    FileNotFoundError,
-)
+
+def converter_dwg_para_pdf_lote(
+    paths_origem: list[str],
+    oda_executable: Optional[str],
+    convert_dxf_to_pdf_func,
+) -> list[tuple[bool, str, Optional[str]]]:
+    """Converte vários DWG para PDF: uma execução do ODA gera todos os DXF
+    intermediários, que depois são renderizados um a um.
+
+    Args:
+        paths_origem: Caminhos dos arquivos DWG originais
+        oda_executable: Caminho do executável ODA Converter
+        convert_dxf_to_pdf_func: Função para converter DXF para PDF
+
+    Returns:
+        Lista com um Tuple (sucesso, mensagem, caminho_arquivo_resultado) por
+        arquivo, na mesma ordem de ``paths_origem``.
+    """
+
+    def _renderizar(path_dxf: Optional[str], path_origem: str):
+        if not path_dxf:
+            return (False, "Arquivo DXF intermediário não foi criado.", None)
+        return convert_dxf_to_pdf_func(path_dxf, path_origem)
+
+    return converter_em_lote_oda(
+        oda_executable, paths_origem, ("ACAD2018", "DXF"), "DWG->PDF", _renderizar
+    )
 
 
 def converter_dwg_para_pdf(
     path_origem: str,
-    generate_dxf_func,
+    oda_executable: Optional[str],
     convert_dxf_to_pdf_func,
 ) -> tuple[bool, str, Optional[str]]:
     """Converte DWG para PDF em duas etapas: DWG -> DXF, depois DXF -> PDF.
 
     Args:
         path_origem: Caminho do arquivo DWG original
-        generate_dxf_func: Função para gerar DXF intermediário
+        oda_executable: Caminho do executável ODA Converter
         convert_dxf_to_pdf_func: Função para converter DXF para PDF
 
     Returns:
         Tuple (sucesso, mensagem, caminho_arquivo_resultado)
     """
-    nome_arquivo = os.path.basename(path_origem)
-
-    try:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            path_dxf_temp = os.path.join(temp_dir, "intermediario.dxf")
-
-            # Etapa 1: Gerar DXF temporário
-            sucesso_dxf, msg_dxf = generate_dxf_func(
-                path_origem, nome_arquivo, path_dxf_temp
-            )
-            if not sucesso_dxf:
-                return (False, msg_dxf, None)
-
-            # Etapa 2: Converter DXF para PDF
-            sucesso_pdf, msg_pdf, path_pdf = convert_dxf_to_pdf_func(
-                path_dxf_temp, path_origem
-            )
-            return (sucesso_pdf, msg_pdf, path_pdf)
-
-    except SUBPROCESS_ERRORS as exc:
-        return build_subprocess_failure(exc, nome_arquivo, "conversão DWG->PDF")
-    except OSError as exc:
-        return (False, log_os_error(exc, nome_arquivo), None)
+    return converter_dwg_para_pdf_lote(
+        [path_origem], oda_executable, convert_dxf_to_pdf_func
+    )[0]
@@ -9,18 +9,7 @@ import os
 from typing import Any, Optional
 
 from src.converters.common import get_file_destination
-
-# Importações opcionais de ezdxf
-try:
-    import ezdxf
-    from ezdxf import recover as ezdxf_recover
-
-    EZDXF_AVAILABLE = True
-    EZDXF_RECOVER = ezdxf_recover
-except ImportError:
-    ezdxf = None
-    EZDXF_AVAILABLE = False
-    EZDXF_RECOVER = None
+from src.utils.dependencias import EZDXF
 
 
 class DXFConversionError(RuntimeError):
@@ -48,7 +37,8 @@ def converter_dxf_para_pdf(
     Returns:
         Tuple (sucesso, mensagem, caminho_arquivo_resultado)
     """
-    if not EZDXF_AVAILABLE or ezdxf is None:
+    ezdxf = EZDXF.ezdxf
+    if ezdxf is None:
         return (
             False,
             "Biblioteca 'ezdxf' indisponível para renderização.",
@@ -115,7 +105,8 @@ def _load_dxf_document(
     Returns:
         Tuple (documento, foi_recuperado)
     """
-    if not EZDXF_AVAILABLE or ezdxf is None:
+    ezdxf = EZDXF.ezdxf
+    if ezdxf is None:
         raise RuntimeError("Biblioteca 'ezdxf' indisponível para renderização.")
 
     try:
@@ -127,11 +118,11 @@ def _load_dxf_document(
             exc,
         )
 
-        if EZDXF_RECOVER is None:
+        if EZDXF.recover is None:
             raise DXFConversionError(_format_dxf_error_message(path_dxf, exc)) from exc
 
         try:
-            doc, auditor = EZDXF_RECOVER.readfile(path_dxf)
+            doc, auditor = EZDXF.recover.readfile(path_dxf)
         except (ezdxf.DXFStructureError, ValueError) as recover_exc:
             raise DXFConversionError(
                 _format_dxf_error_message(path_dxf, recover_exc)
@@ -0,0 +1,192 @@
+"""Sessão persistente do Inkscape (``inkscape --shell``).
+
+Iniciar o Inkscape custa alguns segundos; exportar uma página, bem menos. Em
+vez de um processo por página, a sessão mantém um único ``inkscape --shell``
+vivo durante o lote e envia a exportação de cada página como uma linha de
+ações pelo stdin, aguardando o prompt ``> `` que o Inkscape imprime ao concluir
+cada linha. Se o processo morrer no meio do lote, ele é reiniciado.
+"""
+
+import logging
+import os
+import queue
+import subprocess
+import threading
+import time
+from typing import IO, List, Optional
+
+from src.converters.common import prepare_startupinfo
+from src.utils.utilitarios import start_trusted_process
+
+# Tempo limite (s) para a sessão iniciar ou concluir a exportação de uma página
+TIMEOUT_INKSCAPE = 240
+
+
+class InkscapeShellError(RuntimeError):
+    """A sessão do Inkscape foi encerrada e não pôde ser retomada."""
+
+
+class InkscapeShell:
+    """Processo ``inkscape --shell`` reutilizado entre páginas e arquivos.
+
+    Uso:
+        with InkscapeShell(executavel) as shell:
+            shell.exportar_dxf("pagina_1.pdf", "saida_1.dxf")
+    """
+
+    PROMPT = b"> "
+
+    def __init__(self, executable: str, timeout: float = TIMEOUT_INKSCAPE):
+        self.executable = executable
+        self.timeout = timeout
+        self._processo: Optional[subprocess.Popen] = None
+        self._saida: "queue.Queue[Optional[bytes]]" = queue.Queue()
+
+    def __enter__(self) -> "InkscapeShell":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.fechar()
+
+    @property
+    def ativa(self) -> bool:
+        """Indica se o processo do Inkscape está em execução."""
+        return self._processo is not None and self._processo.poll() is None
+
+    @staticmethod
+    def aceita(*caminhos: str) -> bool:
+        """Indica se os caminhos podem ser passados como argumentos de ação.
+
+        As ações de uma linha são separadas por ``;``, então caminhos que
+        contêm esse caractere precisam da invocação tradicional do Inkscape.
+        """
+        return not any(";" in caminho or "\n" in caminho for caminho in caminhos)
+
+    def exportar_dxf(self, origem: str, destino: str) -> Optional[str]:
+        """Exporta o desenho de ``origem`` (PDF de uma página) para DXF.
+
+        Returns:
+            Caminho do DXF gerado ou None se o Inkscape não o criou.
+        """
+        acoes = [
+            f"file-open:{origem}",
+            f"export-filename:{destino}",
+            "export-type:dxf",
+            "export-overwrite",
+            "export-area-drawing",
+            "export-do",
+            "file-close",
+        ]
+        saida = self.executar("; ".join(acoes))
+        if not os.path.exists(destino):
+            logging.warning("Inkscape não gerou '%s': %s", destino, saida.strip())
+            return None
+        return destino
+
+    def executar(self, linha: str) -> str:
+        """Envia uma linha de ações e aguarda sua conclusão.
+
+        Se a sessão caiu (antes ou durante o comando), ela é reiniciada e o
+        comando é reenviado uma vez.
+
+        Returns:
+            Texto impresso pelo Inkscape para esta linha.
+        """
+        for tentativa in range(2):
+            try:
+                if not self.ativa:
+                    self._iniciar()
+                self._processo.stdin.write(linha.encode("utf-8") + b"\n")
+                self._processo.stdin.flush()
+                return self._aguardar_prompt()
+            except (OSError, InkscapeShellError) as exc:
+                self.fechar()
+                if tentativa:
+                    raise InkscapeShellError(
+                        f"Sessão do Inkscape encerrada: {exc}"
+                    ) from exc
+                logging.warning("Sessão do Inkscape caiu (%s); reiniciando.", exc)
+            except subprocess.TimeoutExpired:
+                self.fechar()
+                raise
+        raise InkscapeShellError("Sessão do Inkscape indisponível.")
+
+    def _iniciar(self) -> None:
+        """Inicia o processo e aguarda o primeiro prompt."""
+        inicio = time.perf_counter()
+        self._saida = queue.Queue()
+        self._processo = start_trusted_process(
+            [self.executable, "--shell", "--pdf-poppler"],
+            description="Inkscape --shell",
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            startupinfo=prepare_startupinfo(),
+        )
+        threading.Thread(
+            target=self._ler_saida,
+            args=(self._processo.stdout, self._saida),
+            name="inkscape_stdout",
+            daemon=True,
+        ).start()
+        threading.Thread(
+            target=self._registrar_stderr,
+            args=(self._processo.stderr,),
+            name="inkscape_stderr",
+            daemon=True,
+        ).start()
+        self._aguardar_prompt()
+        logging.debug(
+            "Sessão do Inkscape iniciada em %.1f s", time.perf_counter() - inicio
+        )
+
+    @staticmethod
+    def _ler_saida(stream: IO[bytes], fila: "queue.Queue[Optional[bytes]]") -> None:
+        """Repassa o stdout do Inkscape para a fila (None indica fim)."""
+        leitura = getattr(stream, "read1", stream.read)
+        while True:
+            bloco = leitura(4096)
+            if not bloco:
+                fila.put(None)
+                return
+            fila.put(bloco)
+
+    @staticmethod
+    def _registrar_stderr(stream: IO[bytes]) -> None:
+        """Consome o stderr (avisos do GTK/Inkscape) para não travar o processo."""
+        for linha in iter(stream.readline, b""):
+            texto = linha.decode("utf-8", "replace").rstrip()
+            logging.debug("Inkscape stderr: %s", texto)
+
+    def _aguardar_prompt(self) -> str:
+        """Lê o stdout até o prompt, respeitando o tempo limite."""
+        blocos: List[bytes] = []
+        limite = time.monotonic() + self.timeout
+        while not b"".join(blocos[-2:]).endswith(self.PROMPT):
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                raise subprocess.TimeoutExpired(
+                    [self.executable, "--shell"], self.timeout, output=b"".join(blocos)
+                )
+            try:
+                bloco = self._saida.get(timeout=restante)
+            except queue.Empty:
+                continue
+            if bloco is None:
+                raise InkscapeShellError("o processo terminou inesperadamente")
+            blocos.append(bloco)
+        return b"".join(blocos).decode("utf-8", "replace")
+
+    def fechar(self) -> None:
+        """Encerra a sessão (``quit``), forçando o término se necessário."""
+        processo, self._processo = self._processo, None
+        if processo is None:
+            return
+        try:
+            if processo.poll() is None:
+                processo.stdin.write(b"quit\n")
+                processo.stdin.flush()
+            processo.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            processo.kill()
+            processo.wait()
@@ -8,12 +8,18 @@ import os
 import shutil
 import subprocess
 import tempfile
-from typing import Optional
+from typing import Iterable, Optional
 
 from src.converters.common import (
     build_subprocess_failure,
     get_file_destination,
     log_os_error,
+    obter_nome_destino_dxf,
+)
+from src.converters.inkscape_shell import (
+    TIMEOUT_INKSCAPE,
+    InkscapeShell,
+    InkscapeShellError,
 )
 from src.utils.utilitarios import run_trusted_command
 
@@ -21,64 +27,92 @@ SUBPROCESS_ERRORS = (
     subprocess.CalledProcessError,
     subprocess.TimeoutExpired,
     FileNotFoundError,
+    InkscapeShellError,
 )
 
 
+def _caminho_documento(config: dict) -> str:
+    """Grava o PDF completo no diretório temporário (uma única vez por arquivo)."""
+    if not config.get("documento_path"):
+        config["documento_path"] = os.path.join(config["temp_dir"], "entrada.pdf")
+        with open(config["documento_path"], "wb") as arquivo:
+            arquivo.write(config["dados_pdf"])
+    return config["documento_path"]
+
+
 def _processar_pagina_pdf(
     page_index: int,
-    page_source: str,
-    temp_dir: str,
-    inkscape_executable: str,
-    use_page_numbers: bool,
+    page_source: Optional[bytes],
+    config: dict,
 ) -> Optional[str]:
     """Processa uma página PDF para DXF.
 
+    A página em memória é gravada no diretório temporário apenas enquanto o
+    Inkscape a lê. Sem ela (``page_source`` None), o documento completo é usado
+    e a página é selecionada com ``--pdf-page``, o que exige um processo
+    próprio; nos demais casos a sessão ``--shell`` é reutilizada.
+
     Returns:
         Caminho do arquivo DXF gerado ou None se falhar
     """
+    temp_dir = config["temp_dir"]
     temp_dxf_path = os.path.join(temp_dir, f"saida_{page_index}.dxf")
+    inkscape_shell: Optional[InkscapeShell] = config.get("inkscape_shell")
+
+    if page_source is None:
+        page_path = _caminho_documento(config)
+    else:
+        page_path = os.path.join(temp_dir, f"pagina_{page_index}.pdf")
+        with open(page_path, "wb") as arquivo:
+            arquivo.write(page_source)
+
+    try:
+        if (
+            inkscape_shell is not None
+            and page_source is not None
+            and inkscape_shell.aceita(page_path, temp_dxf_path)
+        ):
+            return inkscape_shell.exportar_dxf(page_path, temp_dxf_path)
+
+        command = [
+            config["inkscape_executable"],
+            page_path,
+            f"--export-filename={temp_dxf_path}",
+            "--export-type=dxf",
+            "--export-overwrite",
+            "--export-area-drawing",
+            "--pdf-poppler",
+        ]
+        if page_source is None:
+            command.append(f"--pdf-page={page_index}")
+
+        run_trusted_command(
+            command,
+            description="Inkscape PDF->DXF",
+            capture_output=True,
+            text=True,
+            timeout=TIMEOUT_INKSCAPE,
+            encoding="utf-8",
+        )
 
-    command = [
-        inkscape_executable,
-        page_source,
-        f"--export-filename={temp_dxf_path}",
-        "--export-type=dxf",
-        "--export-overwrite",
-        "--export-area-drawing",
-        "--pdf-poppler",
-    ]
-    if use_page_numbers:
-        command.append(f"--pdf-page={page_index}")
-
-    run_trusted_command(
-        command,
-        description="Inkscape PDF->DXF",
-        capture_output=True,
-        text=True,
-        timeout=240,
-        encoding="utf-8",
-    )
-
-    return temp_dxf_path if os.path.exists(temp_dxf_path) else None
-
-
-def _obter_nome_destino(nome_base: str, page_index: int, total_pages: int) -> str:
-    """Determina o nome do arquivo de destino."""
-    if total_pages == 1:
-        return f"{nome_base}.dxf"
-    return f"{nome_base}_p{page_index}.dxf"
+        return temp_dxf_path if os.path.exists(temp_dxf_path) else None
+    finally:
+        if page_source is not None and os.path.exists(page_path):
+            os.remove(page_path)
 
 
 def _processar_paginas_pdf(
-    page_sources: list,
+    page_sources: Iterable[Optional[bytes]],
+    total_pages: int,
     config: dict,
 ) -> list[str]:
     """Processa todas as páginas do PDF.
 
     Args:
-        page_sources: Lista de caminhos das páginas PDF
-        config: Dicionário com {temp_dir, inkscape_executable, use_page_numbers,
-                nome_base, pasta_destino, ensure_unique_path_func}
+        page_sources: Páginas em memória (None seleciona a página pelo número)
+        total_pages: Total de páginas, usado para nomear os arquivos
+        config: Dicionário com {temp_dir, dados_pdf, inkscape_executable,
+                nome_base, pasta_destino, ensure_unique_path_func, inkscape_shell}
 
     Returns:
         Lista de arquivos gerados
@@ -86,21 +120,15 @@ def _processar_paginas_pdf(
     arquivos_gerados: list[str] = []
 
     for page_index, page_source in enumerate(page_sources, start=1):
-        temp_dxf_path = _processar_pagina_pdf(
-            page_index,
-            page_source,
-            config["temp_dir"],
-            config["inkscape_executable"],
-            config["use_page_numbers"],
-        )
+        temp_dxf_path = _processar_pagina_pdf(page_index, page_source, config)
 
         if not temp_dxf_path:
             continue
 
-        nome_destino = _obter_nome_destino(
+        nome_destino = obter_nome_destino_dxf(
             config["nome_base"],
             page_index,
-            len(page_sources),
+            total_pages,
         )
         path_destino = get_file_destination(
             config["pasta_destino"],
@@ -114,58 +142,25 @@ def _processar_paginas_pdf(
     return arquivos_gerados
 
 
-def _preparar_config_pdf(
-    temp_dir: str,
-    temp_pdf_path: str,
-    params: dict,
-) -> tuple[list, dict]:
-    """Prepara configuração e obtém page_sources.
-
-    Args:
-        temp_dir: Diretório temporário
-        temp_pdf_path: Caminho do PDF temporário
-        params: Dict com {inkscape_executable, nome_base, pasta_destino,
-                prepare_pdf_pages_func, nome_arquivo, ensure_unique_path_func}
-
-    Returns:
-        Tuple (page_sources, config)
-    """
-    if params.get("prepare_pdf_pages_func"):
-        page_sources, _, use_page_numbers = params["prepare_pdf_pages_func"](
-            temp_pdf_path,
-            params["nome_arquivo"],
-        )
-    else:
-        page_sources = [temp_pdf_path]
-        use_page_numbers = False
-
-    config = {
-        "temp_dir": temp_dir,
-        "inkscape_executable": params["inkscape_executable"],
-        "use_page_numbers": use_page_numbers,
-        "nome_base": params["nome_base"],
-        "pasta_destino": params["pasta_destino"],
-        "ensure_unique_path_func": params.get("ensure_unique_path_func"),
-    }
-
-    return page_sources, config
-
-
 def converter_pdf_para_dxf(
     path_origem: str,
     pasta_destino: str,
     inkscape_executable: str,
     prepare_pdf_pages_func=None,
     ensure_unique_path_func=None,
+    inkscape_shell: Optional[InkscapeShell] = None,
 ) -> tuple[bool, str, Optional[list[str]]]:
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
     """Converte um arquivo PDF para DXF (uma página por arquivo).
 
     Args:
         path_origem: Caminho do arquivo PDF original
         pasta_destino: Pasta onde salvar os resultados
         inkscape_executable: Caminho do executável Inkscape
-        prepare_pdf_pages_func: Função para preparar páginas do PDF
+        prepare_pdf_pages_func: Função que recebe o conteúdo do PDF e retorna
+            (páginas em memória, total de páginas)
         ensure_unique_path_func: Função para garantir caminhos únicos
+        inkscape_shell: Sessão ``--shell`` reutilizada entre páginas (opcional)
 
     Returns:
         Tuple (sucesso, mensagem, lista_de_arquivos)
@@ -177,29 +172,30 @@ def converter_pdf_para_dxf(
         return (False, "Inkscape não está configurado corretamente.", None)
 
     try:
+        with open(path_origem, "rb") as arquivo:
+            dados_pdf = arquivo.read()
+
+        if prepare_pdf_pages_func:
+            page_sources, total_pages = prepare_pdf_pages_func(dados_pdf, nome_arquivo)
+        else:
+            page_sources, total_pages = [dados_pdf], 1
+
         with tempfile.TemporaryDirectory() as temp_dir:
             try:
-                temp_pdf_path = os.path.join(temp_dir, "entrada.pdf")
-                shutil.copy(path_origem, temp_pdf_path)
-
-                page_sources, config = _preparar_config_pdf(
-                    temp_dir,
-                    temp_pdf_path,
+                arquivos_gerados = _processar_paginas_pdf(
+                    page_sources,
+                    total_pages,
                     {
+                        "temp_dir": temp_dir,
+                        "dados_pdf": dados_pdf,
                         "inkscape_executable": inkscape_executable,
                         "nome_base": nome_base,
                         "pasta_destino": pasta_destino,
-                        "prepare_pdf_pages_func": prepare_pdf_pages_func,
-                        "nome_arquivo": nome_arquivo,
                         "ensure_unique_path_func": ensure_unique_path_func,
+                        "inkscape_shell": inkscape_shell,
                     },
                 )
 
-                arquivos_gerados = _processar_paginas_pdf(
-                    page_sources,
-                    config,
-                )
-
                 if arquivos_gerados:
                     msg = f"{len(arquivos_gerados)} páginas convertidas: " + ", ".join(
                         os.path.basename(p) for p in arquivos_gerados
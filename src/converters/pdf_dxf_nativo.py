@@ -0,0 +1,296 @@
+"""Conversão de PDF para DXF sem processos externos.
+
+Lê os caminhos vetoriais de cada página com ``page.get_drawings()`` (PyMuPDF)
+e grava linhas, polilinhas e curvas de Bézier (aproximadas por polilinhas)
+diretamente em um documento ezdxf; o texto da página vira entidades TEXT.
+As coordenadas são convertidas de pontos PDF para milímetros e o eixo Y é
+invertido (no PDF ele cresce para baixo). O Inkscape continua como alternativa
+quando PyMuPDF ou ezdxf não estão disponíveis ou a leitura falha.
+"""
+
+import logging
+import math
+import os
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from src.converters.common import (
+    get_file_destination,
+    log_os_error,
+    obter_nome_destino_dxf,
+)
+from src.utils.dependencias import EZDXF, FITZ
+
+Ponto = Tuple[float, float]
+
+# 1 ponto PDF = 1/72 polegada
+PT_PARA_MM = 25.4 / 72
+
+# Comprimento máximo (mm) de cada segmento na aproximação das curvas de Bézier
+PASSO_BEZIER_MM = 0.5
+MAX_SEGMENTOS_BEZIER = 64
+
+# Tolerância (mm) para considerar contínuos dois segmentos de um caminho
+TOLERANCIA_MM = 1e-6
+
+# Altura de maiúscula aproximada em relação ao corpo da fonte
+FATOR_ALTURA_TEXTO = 0.7
+
+# $INSUNITS = 4 (milímetros); $MEASUREMENT = 1 (métrico)
+UNIDADE_DXF_MM = 4
+
+
+def nativo_disponivel() -> bool:
+    """Indica se PyMuPDF e ezdxf estão instalados para a conversão interna."""
+    return FITZ.disponivel and EZDXF.disponivel
+
+
+def _transformador(page) -> Callable[[Any], Ponto]:
+    """Cria a função que leva um ponto da página para mm no sistema do DXF."""
+    matriz = page.rotation_matrix if page.rotation else None
+    altura = page.rect.height
+
+    def transformar(ponto) -> Ponto:
+        if matriz is not None:
+            ponto = ponto * matriz
+        return ponto.x * PT_PARA_MM, (altura - ponto.y) * PT_PARA_MM
+
+    return transformar
+
+
+def _achatar_bezier(p0: Ponto, p1: Ponto, p2: Ponto, p3: Ponto) -> List[Ponto]:
+    """Aproxima uma Bézier cúbica por pontos (sem o inicial)."""
+    comprimento = math.dist(p0, p1) + math.dist(p1, p2) + math.dist(p2, p3)
+    segmentos = max(
+        1, min(MAX_SEGMENTOS_BEZIER, math.ceil(comprimento / PASSO_BEZIER_MM))
+    )
+    pontos = []
+    for i in range(1, segmentos + 1):
+        t = i / segmentos
+        u = 1 - t
+        a, b, c, d = u**3, 3 * u * u * t, 3 * u * t * t, t**3
+        pontos.append(
+            (
+                a * p0[0] + b * p1[0] + c * p2[0] + d * p3[0],
+                a * p0[1] + b * p1[1] + c * p2[1] + d * p3[1],
+            )
+        )
+    return pontos
+
+
+def _polilinhas_do_caminho(
+    caminho: dict, transformar: Callable[[Any], Ponto]
+) -> List[Tuple[List[Ponto], bool]]:
+    """Converte um caminho de ``get_drawings`` em polilinhas (pontos, fechada)."""
+    polilinhas: List[Tuple[List[Ponto], bool]] = []
+    atual: List[Ponto] = []
+
+    def encerrar(fechada: bool = False):
+        nonlocal atual
+        if (
+            fechada
+            and len(atual) > 2
+            and math.dist(atual[0], atual[-1]) <= (TOLERANCIA_MM)
+        ):
+            atual.pop()
+        if len(atual) >= 2:
+            polilinhas.append((atual, fechada))
+        atual = []
+
+    for item in caminho.get("items", ()):
+        tipo = item[0]
+        if tipo in ("l", "c"):
+            inicio = transformar(item[1])
+            if not atual or math.dist(atual[-1], inicio) > TOLERANCIA_MM:
+                encerrar()
+                atual = [inicio]
+            if tipo == "l":
+                atual.append(transformar(item[2]))
+            else:
+                atual.extend(
+                    _achatar_bezier(
+                        inicio,
+                        transformar(item[2]),
+                        transformar(item[3]),
+                        transformar(item[4]),
+                    )
+                )
+        elif tipo == "re":
+            encerrar()
+            rect = item[1]
+            cantos = (rect.tl, rect.tr, rect.br, rect.bl)
+            polilinhas.append(([transformar(p) for p in cantos], True))
+        elif tipo == "qu":
+            encerrar()
+            quad = item[1]
+            cantos = (quad.ul, quad.ur, quad.lr, quad.ll)
+            polilinhas.append(([transformar(p) for p in cantos], True))
+
+    encerrar(bool(caminho.get("closePath")))
+    return polilinhas
+
+
+def _cor_verdadeira(cor: Optional[Sequence[float]]) -> Optional[int]:
+    """Converte uma cor RGB (0..1) em true color do DXF; None para preto/ausente."""
+    if not cor or len(cor) < 3:
+        return None
+    r, g, b = (max(0, min(255, round(c * 255))) for c in cor[:3])
+    if r == g == b == 0:
+        return None
+    return (r << 16) | (g << 8) | b
+
+
+def _adicionar_caminhos(msp, page, transformar) -> int:
+    """Adiciona os caminhos vetoriais da página; retorna o número de entidades."""
+    total = 0
+    for caminho in page.get_drawings():
+        atributos = {}
+        cor = _cor_verdadeira(caminho.get("color") or caminho.get("fill"))
+        if cor is not None:
+            atributos["true_color"] = cor
+        for pontos, fechada in _polilinhas_do_caminho(caminho, transformar):
+            if len(pontos) == 2 and not fechada:
+                msp.add_line(pontos[0], pontos[1], dxfattribs=atributos)
+            else:
+                msp.add_lwpolyline(pontos, close=fechada, dxfattribs=atributos)
+            total += 1
+    return total
+
+
+def _adicionar_textos(msp, page, transformar) -> int:
+    """Adiciona o texto da página como entidades TEXT; retorna a quantidade."""
+    total = 0
+    for bloco in page.get_text("dict").get("blocks", ()):
+        for linha in bloco.get("lines", ()):
+            dx, dy = linha.get("dir", (1.0, 0.0))
+            angulo = math.degrees(math.atan2(-dy, dx))
+            for span in linha.get("spans", ()):
+                texto = span.get("text", "").strip()
+                if not texto:
+                    continue
+                origem = FITZ.fitz.Point(span["origin"])
+                msp.add_text(
+                    texto,
+                    dxfattribs={
+                        "height": span["size"] * PT_PARA_MM * FATOR_ALTURA_TEXTO,
+                        "rotation": angulo,
+                        "insert": transformar(origem),
+                    },
+                )
+                total += 1
+    return total
+
+
+def _pagina_para_dxf(page, path_destino: str) -> int:
+    """Grava uma página em um novo DXF; retorna o número de entidades.
+
+    Páginas sem entidades (ex.: digitalizadas) não geram arquivo.
+    """
+    doc = EZDXF.ezdxf.new("R2010")
+    doc.header["$INSUNITS"] = UNIDADE_DXF_MM
+    doc.header["$MEASUREMENT"] = 1
+    msp = doc.modelspace()
+    transformar = _transformador(page)
+    total = _adicionar_caminhos(msp, page, transformar)
+    total += _adicionar_textos(msp, page, transformar)
+    if total:
+        doc.saveas(path_destino)
+    return total
+
+
+def _gravar_paginas(
+    pdf,
+    path_origem: str,
+    pasta_destino: str,
+    ensure_unique_path_func,
+    arquivos_gerados: List[str],
+) -> List[int]:
+    """Grava cada página em um DXF, acrescentando-o a ``arquivos_gerados``.
+
+    Returns:
+        Números das páginas ignoradas por não terem desenho vetorial nem texto.
+    """
+    paginas_vazias: List[int] = []
+    nome_arquivo = os.path.basename(path_origem)
+    nome_base = os.path.splitext(nome_arquivo)[0]
+    for indice, page in enumerate(pdf, start=1):
+        path_destino = get_file_destination(
+            pasta_destino,
+            obter_nome_destino_dxf(nome_base, indice, pdf.page_count),
+            ensure_unique_path_func,
+        )
+        entidades = _pagina_para_dxf(page, path_destino)
+        if not entidades:
+            logging.warning(
+                "Página %d de '%s' sem desenho vetorial; ignorada.",
+                indice,
+                nome_arquivo,
+            )
+            paginas_vazias.append(indice)
+            continue
+        arquivos_gerados.append(path_destino)
+        logging.debug(
+            "Página %d de '%s': %d entidades", indice, nome_arquivo, entidades
+        )
+    return paginas_vazias
+
+
+def converter_pdf_para_dxf_nativo(
+    path_origem: str,
+    pasta_destino: str,
+    ensure_unique_path_func=None,
+) -> Optional[tuple[bool, str, Optional[list[str]]]]:
+    """Converte um PDF para DXF (uma página por arquivo) sem o Inkscape.
+
+    Args:
+        path_origem: Caminho do arquivo PDF original
+        pasta_destino: Pasta onde salvar os resultados
+        ensure_unique_path_func: Função para garantir caminhos únicos
+
+    Returns:
+        Tuple (sucesso, mensagem, lista_de_arquivos), ou None se a conversão
+        interna não está disponível ou falhou ao ler o PDF ou gravar o DXF
+        (use o Inkscape).
+    """
+    if not nativo_disponivel():
+        return None
+
+    nome_arquivo = os.path.basename(path_origem)
+    arquivos_gerados: List[str] = []
+
+    try:
+        with FITZ.fitz.open(path_origem) as pdf:
+            paginas_vazias = _gravar_paginas(
+                pdf,
+                path_origem,
+                pasta_destino,
+                ensure_unique_path_func,
+                arquivos_gerados,
+            )
+    except (RuntimeError, ValueError, EZDXF.ezdxf.DXFError) as exc:
+        # Erros de leitura do PyMuPDF ou de escrita do ezdxf: remove saídas
+        # parciais e usa o Inkscape
+        logging.warning(
+            "Conversão interna de '%s' falhou (%s); usando o Inkscape.",
+            nome_arquivo,
+            exc,
+        )
+        for path in arquivos_gerados:
+            if os.path.exists(path):
+                os.remove(path)
+        return None
+    except OSError as exc:
+        return (False, log_os_error(exc, nome_arquivo), None)
+
+    if not arquivos_gerados:
+        if paginas_vazias:
+            return (False, "O PDF não contém desenho vetorial para converter.", None)
+        return (False, "Nenhuma página foi convertida.", None)
+
+    msg = f"{len(arquivos_gerados)} páginas convertidas: " + ", ".join(
+        os.path.basename(p) for p in arquivos_gerados
+    )
+    if paginas_vazias:
+        msg += ". Páginas sem desenho vetorial ignoradas: " + ", ".join(
+            str(n) for n in paginas_vazias
+        )
+    return (True, msg, arquivos_gerados)
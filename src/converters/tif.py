@@ -1,23 +1,247 @@
 """Conversão de TIF para PDF.
 
 Este módulo concentra a lógica de conversão de arquivos TIF/TIFF para PDF,
-utilizando a biblioteca Pillow.
+utilizando a biblioteca Pillow para ler as páginas.
+
+As páginas são gravadas uma a uma em um PDF escrito de forma incremental, de
+modo que o consumo de memória não cresce com o número de páginas. Faixas CCITT
+Group 4 e JPEG são copiadas do arquivo sem decodificação; as demais páginas
+mantêm a profundidade original (1 bit, tons de cinza, RGB, CMYK ou paleta) e
+são compactadas com Flate.
 """
 
 import logging
 import os
-from typing import Optional
+import zlib
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
 from src.converters.common import get_file_destination
+from src.utils.dependencias import PIL
+
+# Tags TIFF usadas para copiar os dados comprimidos sem decodificá-los
+TAG_COMPRESSAO = 259
+TAG_FOTOMETRIA = 262
+TAG_ORDEM_BITS = 266
+TAG_OFFSETS_FAIXAS = 273
+TAG_AMOSTRAS_POR_PIXEL = 277
+TAG_BYTES_FAIXAS = 279
+TAG_LARGURA_BLOCO = 322
+TAG_TABELAS_JPEG = 347
+
+COMPRESSAO_CCITT_G4 = 4
+COMPRESSAO_JPEG = 7
+
+# Fotometria TIFF: 1 = BlackIsZero, 2 = RGB
+FOTOMETRIA_PRETO_ZERO = 1
+FOTOMETRIA_RGB = 2
+
+# Resolução assumida quando o TIF não informa DPI (ou informa um valor abaixo
+# do mínimo plausível, como o dpi=(1, 1) de arquivos sem unidade de resolução)
+DPI_PADRAO = 72.0
+DPI_MINIMO = 10.0
+
+# Modos do Pillow gravados sem conversão: modo -> (espaço de cor, bits)
+_MODOS_NATIVOS = {
+    "1": ("/DeviceGray", 1),
+    "L": ("/DeviceGray", 8),
+    "RGB": ("/DeviceRGB", 8),
+    "CMYK": ("/DeviceCMYK", 8),
+}
+
+# Modos com transparência ou precisão estendida e seus equivalentes gravados
+_MODOS_CONVERTIDOS = {"LA": "L", "RGBA": "RGB", "RGBX": "RGB", "PA": "RGB"}
+
+
+class _EscritorPdf:
+    """Escreve um PDF de imagens página a página, sem manter páginas em memória.
+
+    Apenas os offsets dos objetos e os números das páginas ficam guardados até
+    o fechamento, quando são gravados a árvore de páginas e a tabela xref.
+    """
+
+    _CATALOGO = 1
+    _PAGINAS = 2
+
+    def __init__(self, arquivo: BinaryIO):
+        self._arquivo = arquivo
+        self._offsets: Dict[int, int] = {}
+        self._paginas: List[int] = []
+        self._proximo = 3
+        arquivo.write(b"%PDF-1.5\n%\xe2\xe3\xcf\xd3\n")
+
+    @property
+    def total_paginas(self) -> int:
+        """Quantidade de páginas gravadas até o momento."""
+        return len(self._paginas)
+
+    def _novo_objeto(self) -> int:
+        numero = self._proximo
+        self._proximo += 1
+        return numero
+
+    def _gravar_objeto(
+        self, numero: int, dicionario: str, fluxo: Optional[bytes] = None
+    ) -> None:
+        self._offsets[numero] = self._arquivo.tell()
+        self._arquivo.write(f"{numero} 0 obj\n".encode("ascii"))
+        if fluxo is None:
+            self._arquivo.write(dicionario.encode("latin-1") + b"\nendobj\n")
+            return
+        cabecalho = dicionario[:-2] + f" /Length {len(fluxo)} >>"
+        self._arquivo.write(cabecalho.encode("latin-1") + b"\nstream\n")
+        self._arquivo.write(fluxo)
+        self._arquivo.write(b"\nendstream\nendobj\n")
+
+    def adicionar_pagina(
+        self,
+        dados: bytes,
+        parametros: str,
+        tamanho_px: Tuple[int, int],
+        dpi: Tuple[float, float],
+    ) -> None:
+        """Grava uma página contendo uma única imagem em tamanho real.
+
+        Args:
+            dados: Fluxo da imagem já comprimido conforme ``parametros``.
+            parametros: Entradas do dicionário da imagem (filtro, cor, bits).
+            tamanho_px: Largura e altura da imagem em pixels.
+            dpi: Resolução horizontal e vertical da imagem.
+        """
+        largura_px, altura_px = tamanho_px
+        largura = largura_px * 72.0 / dpi[0]
+        altura = altura_px * 72.0 / dpi[1]
 
-try:
-    from PIL import Image, ImageSequence, UnidentifiedImageError
+        imagem = self._novo_objeto()
+        conteudo = self._novo_objeto()
+        pagina = self._novo_objeto()
+        self._gravar_objeto(
+            imagem,
+            f"<< /Type /XObject /Subtype /Image /Width {largura_px}"
+            f" /Height {altura_px} {parametros} >>",
+            dados,
+        )
+        self._gravar_objeto(
+            conteudo,
+            "<< >>",
+            f"q {largura:.4f} 0 0 {altura:.4f} 0 0 cm /Im0 Do Q".encode("ascii"),
+        )
+        self._gravar_objeto(
+            pagina,
+            f"<< /Type /Page /Parent {self._PAGINAS} 0 R"
+            f" /MediaBox [0 0 {largura:.4f} {altura:.4f}]"
+            f" /Resources << /XObject << /Im0 {imagem} 0 R >> >>"
+            f" /Contents {conteudo} 0 R >>",
+        )
+        self._paginas.append(pagina)
 
-    PIL_AVAILABLE = True
-except ImportError:
-    Image = None
-    UnidentifiedImageError = None
-    PIL_AVAILABLE = False
+    def fechar(self) -> None:
+        """Grava catálogo, árvore de páginas, tabela xref e trailer."""
+        kids = " ".join(f"{numero} 0 R" for numero in self._paginas)
+        self._gravar_objeto(
+            self._PAGINAS,
+            f"<< /Type /Pages /Kids [{kids}] /Count {len(self._paginas)} >>",
+        )
+        self._gravar_objeto(
+            self._CATALOGO, f"<< /Type /Catalog /Pages {self._PAGINAS} 0 R >>"
+        )
+        inicio_xref = self._arquivo.tell()
+        linhas = [f"xref\n0 {self._proximo}\n", "0000000000 65535 f \n"]
+        linhas.extend(
+            f"{self._offsets[numero]:010d} 00000 n \n"
+            for numero in range(1, self._proximo)
+        )
+        linhas.append(
+            f"trailer\n<< /Size {self._proximo} /Root {self._CATALOGO} 0 R >>\n"
+            f"startxref\n{inicio_xref}\n%%EOF\n"
+        )
+        self._arquivo.write("".join(linhas).encode("ascii"))
+
+
+def _dpi_do_quadro(quadro) -> Tuple[float, float]:
+    """Resolução do quadro, ou ``DPI_PADRAO`` quando ausente ou implausível."""
+    dpi = quadro.info.get("dpi") or (DPI_PADRAO, DPI_PADRAO)
+    try:
+        x, y = float(dpi[0]), float(dpi[1])
+    except (TypeError, ValueError, IndexError):
+        return DPI_PADRAO, DPI_PADRAO
+    return (
+        x if x >= DPI_MINIMO else DPI_PADRAO,
+        y if y >= DPI_MINIMO else DPI_PADRAO,
+    )
+
+
+def _faixa_unica(quadro, origem: BinaryIO) -> Optional[bytes]:
+    """Lê os dados comprimidos do quadro quando ele ocupa uma única faixa."""
+    tags = quadro.tag_v2
+    offsets = tags.get(TAG_OFFSETS_FAIXAS)
+    tamanhos = tags.get(TAG_BYTES_FAIXAS)
+    if TAG_LARGURA_BLOCO in tags or not offsets or not tamanhos:
+        return None
+    if len(offsets) != 1 or len(tamanhos) != 1:
+        return None
+    origem.seek(offsets[0])
+    dados = origem.read(tamanhos[0])
+    return dados if len(dados) == tamanhos[0] else None
+
+
+def _copiar_comprimido(quadro, origem: BinaryIO) -> Optional[Tuple[bytes, str]]:
+    """Retorna os dados CCITT G4 ou JPEG do quadro prontos para o PDF.
+
+    Returns:
+        Tuple (dados, parâmetros da imagem) ou None se for preciso decodificar.
+    """
+    tags = quadro.tag_v2
+    compressao = tags.get(TAG_COMPRESSAO)
+    fotometria = tags.get(TAG_FOTOMETRIA)
+    largura, altura = quadro.size
+
+    if compressao == COMPRESSAO_CCITT_G4:
+        if quadro.mode != "1" or tags.get(TAG_ORDEM_BITS, 1) != 1:
+            return None
+        dados = _faixa_unica(quadro, origem)
+        if dados is None:
+            return None
+        preto_1 = "true" if fotometria == FOTOMETRIA_PRETO_ZERO else "false"
+        return dados, (
+            "/ColorSpace /DeviceGray /BitsPerComponent 1 /Filter /CCITTFaxDecode"
+            f" /DecodeParms << /K -1 /Columns {largura} /Rows {altura}"
+            f" /BlackIs1 {preto_1} >>"
+        )
+
+    if compressao == COMPRESSAO_JPEG and quadro.mode in ("L", "RGB"):
+        amostras = tags.get(TAG_AMOSTRAS_POR_PIXEL, 1)
+        dados = _faixa_unica(quadro, origem)
+        if dados is None or amostras not in (1, 3):
+            return None
+        tabelas = tags.get(TAG_TABELAS_JPEG)
+        if tabelas:
+            # Tabelas compartilhadas (SOI...EOI) + faixa (SOI...): um único JPEG
+            dados = bytes(tabelas)[:-2] + dados[2:]
+        espaco = "/DeviceGray" if amostras == 1 else "/DeviceRGB"
+        parametros = f"/ColorSpace {espaco} /BitsPerComponent 8 /Filter /DCTDecode"
+        if amostras == 3 and fotometria == FOTOMETRIA_RGB:
+            parametros += " /DecodeParms << /ColorTransform 0 >>"
+        return dados, parametros
+
+    return None
+
+
+def _codificar_quadro(quadro) -> Tuple[bytes, str]:
+    """Decodifica o quadro e o compacta com Flate na profundidade original."""
+    if quadro.mode == "P":
+        paleta = bytes(quadro.getpalette("RGB") or b"\x00\x00\x00")
+        espaco = f"[/Indexed /DeviceRGB {len(paleta) // 3 - 1} <{paleta.hex()}>]"
+        bits = 8
+    else:
+        modo = _MODOS_CONVERTIDOS.get(quadro.mode, quadro.mode)
+        if modo not in _MODOS_NATIVOS:
+            modo = "RGB"
+        if modo != quadro.mode:
+            quadro = quadro.convert(modo)
+        espaco, bits = _MODOS_NATIVOS[modo]
+    return zlib.compress(quadro.tobytes()), (
+        f"/ColorSpace {espaco} /BitsPerComponent {bits} /Filter /FlateDecode"
+    )
 
 
 def converter_tif_para_pdf(
@@ -35,7 +259,7 @@ def converter_tif_para_pdf(
     Returns:
         Tuple (sucesso, mensagem, caminho_arquivo_resultado)
     """
-    if not PIL_AVAILABLE or Image is None:
+    if not PIL.disponivel:
         return (False, "Biblioteca Pillow indisponível", None)
 
     nome_arquivo = os.path.basename(path_origem)
@@ -48,27 +272,25 @@ def converter_tif_para_pdf(
     )
 
     try:
-        frames_rgb = []
-        with Image.open(path_origem) as img:
-            for frame in ImageSequence.Iterator(img):
-                frames_rgb.append(frame.convert("RGB"))
-
-        if not frames_rgb:
-            raise UnidentifiedImageError("Arquivo TIF sem páginas utilizáveis.")
-
-        primeira_pagina, *demais_paginas = frames_rgb
-        save_kwargs = {
-            "save_all": bool(demais_paginas),
-            "append_images": demais_paginas,
-            "optimize": True,
-        }
-        primeira_pagina.save(path_destino, "PDF", **save_kwargs)
+        with PIL.Image.open(path_origem) as img, open(path_origem, "rb") as origem:
+            with open(path_destino, "wb") as destino:
+                escritor = _EscritorPdf(destino)
+                for quadro in PIL.ImageSequence.Iterator(img):
+                    copia = _copiar_comprimido(quadro, origem)
+                    dados, parametros = copia or _codificar_quadro(quadro)
+                    escritor.adicionar_pagina(
+                        dados, parametros, quadro.size, _dpi_do_quadro(quadro)
+                    )
+                if not escritor.total_paginas:
+                    raise PIL.UnidentifiedImageError(
+                        "Arquivo TIF sem páginas utilizáveis."
+                    )
+                escritor.fechar()
 
         return (True, "Conversão bem-sucedida", path_destino)
 
-    except (IOError, UnidentifiedImageError, OSError, MemoryError) as exc:
+    except (IOError, PIL.UnidentifiedImageError, OSError, MemoryError) as exc:
         logging.error("FALHA na conversão de %s.", nome_arquivo, exc_info=True)
+        if os.path.exists(path_destino):
+            os.remove(path_destino)
         return (False, str(exc), None)
-    finally:
-        for pagina in frames_rgb:
-            pagina.close()
@@ -7,117 +7,60 @@ para reduzir o tamanho do formulário principal e facilitar a reutilização.
 from __future__ import annotations
 
 import logging
+import math
 import os
 import shutil
 import subprocess  # nosec B404 - necessário para integração com conversores externos
-import tempfile
 import traceback
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
 from PySide6.QtCore import QThread, Signal
 
-from src.converters.common import run_oda_command
-from src.converters.dwg import converter_dwg_para_dwg_2013
-from src.converters.dwg_pdf import converter_dwg_para_pdf
+from src.converters.dwg import converter_dwg_para_dwg_2013_lote
+from src.converters.dwg_pdf import converter_dwg_para_pdf_lote
 from src.converters.dxf_pdf import converter_dxf_para_pdf
+from src.converters.inkscape_shell import InkscapeShell
 from src.converters.pdf_dxf import converter_pdf_para_dxf
+from src.converters.pdf_dxf_nativo import (
+    converter_pdf_para_dxf_nativo,
+    nativo_disponivel,
+)
 from src.converters.tif import converter_tif_para_pdf
+from src.utils.dependencias import (
+    BACKEND_MATPLOTLIB,
+    BACKEND_PYMUPDF,
+    EZDXF,
+    EZDXF_DESENHO,
+    FITZ,
+    PIL,
+    cad_render_disponivel,
+)
 
-try:  # Pillow
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-
-# Valores padrão para módulos opcionais
-# pylint: disable=invalid-name
-Frontend = RenderContext = None  # type: ignore[assignment]
-BackgroundPolicy = ColorPolicy = None  # type: ignore[assignment]
-BoundingBox = None  # type: ignore[assignment]
-BoundingBox2d = Margins = Page = Settings = Units = None  # type: ignore[assignment]
-MatplotlibBackend = None  # type: ignore[assignment]
-PyMuPdfBackend = None  # type: ignore[assignment]
-plt = None  # type: ignore[assignment]
-# pylint: enable=invalid-name
-
-EZDXF_RECOVER = None  # type: ignore[assignment]
-try:  # ezdxf e estruturas de desenho
-    import ezdxf  # type: ignore[import]
-
-    EZDXF_AVAILABLE = True
-    try:
-        from ezdxf.addons.drawing import Frontend, RenderContext
-        from ezdxf.addons.drawing.config import BackgroundPolicy, ColorPolicy
-        from ezdxf.addons.drawing.layout import (
-            BoundingBox2d,
-            Margins,
-            Page,
-            Settings,
-            Units,
-        )
-        from ezdxf.math import BoundingBox
-    except ImportError:
-        Frontend = RenderContext = None  # type: ignore[assignment]
-        BackgroundPolicy = ColorPolicy = None  # type: ignore[assignment]
-        BoundingBox = None  # type: ignore[assignment]
-        # type: ignore[assignment]
-        BoundingBox2d = Margins = Page = Settings = Units = None
-        EZDXF_AVAILABLE = False
-
-    if EZDXF_AVAILABLE:
-        try:
-            from ezdxf.addons.drawing.matplotlib import (  # type: ignore[import]
-                MatplotlibBackend,
-            )
-        except ImportError:
-            MatplotlibBackend = None  # type: ignore[assignment]
-
-        try:
-            from ezdxf.addons.drawing.pymupdf import (  # type: ignore[import]
-                PyMuPdfBackend,
-            )
-        except ImportError:
-            PyMuPdfBackend = None  # type: ignore[assignment]
+# (sucesso, mensagem, caminho ou lista de caminhos gerados)
+ResultadoConversao = Tuple[bool, str, Any]
 
-        try:
-            from ezdxf import recover as ezdxf_recover  # type: ignore[import]
-        except ImportError:
-            EZDXF_RECOVER = None  # type: ignore[assignment]
-        else:
-            EZDXF_RECOVER = ezdxf_recover
-
-except ImportError:
-    ezdxf = None  # type: ignore[assignment]
-    EZDXF_AVAILABLE = False
-
-if MatplotlibBackend is not None:
-    try:  # Matplotlib backend
-        import matplotlib.pyplot as plt  # type: ignore[import]
-    except ImportError:
-        plt = None  # type: ignore[assignment]
-
-try:  # PyMuPDF para análise de PDF
-    import fitz  # type: ignore[import]
-
-    FITZ_AVAILABLE = True
-except ImportError:
-    fitz = None  # type: ignore[assignment]
-    FITZ_AVAILABLE = False
-
-MATPLOTLIB_BACKEND_AVAILABLE = bool(MatplotlibBackend and plt)
-PYMUPDF_BACKEND_AVAILABLE = bool(PyMuPdfBackend)
-CAD_RENDER_AVAILABLE = EZDXF_AVAILABLE and (
-    MATPLOTLIB_BACKEND_AVAILABLE or PYMUPDF_BACKEND_AVAILABLE
-)
+# Limite padrão de arquivos convertidos ao mesmo tempo
+MAX_CONVERSOES_PARALELAS = os.cpu_count() or 1
 
 
 def _collect_render_config() -> dict[str, object]:
     config_changes: dict[str, object] = {}
-    if BackgroundPolicy:
-        config_changes["background_policy"] = BackgroundPolicy.WHITE
+    background_policy = EZDXF_DESENHO.BackgroundPolicy
+    color_policy = EZDXF_DESENHO.ColorPolicy
+    if background_policy:
+        config_changes["background_policy"] = background_policy.WHITE
         config_changes["custom_bg_color"] = "#FFFFFF"
-    if ColorPolicy:
-        config_changes["color_policy"] = ColorPolicy.BLACK
+    if color_policy:
+        config_changes["color_policy"] = color_policy.BLACK
     return config_changes
 
 
@@ -127,18 +70,6 @@ def _update_render_config(target: Any) -> None:
         target.config = target.config.with_changes(**config_changes)
 
 
-def _log_subprocess_output(
-    result: Any, context: str, *, stderr_level: int = logging.DEBUG
-) -> None:
-    stdout = getattr(result, "stdout", "")
-    if stdout:
-        logging.debug("%s stdout:\n%s", context, str(stdout).strip())
-
-    stderr = getattr(result, "stderr", "")
-    if stderr:
-        logging.log(stderr_level, "%s stderr:\n%s", context, str(stderr).strip())
-
-
 def find_external_program(
     program_name: str, executable_name: str, common_paths: List[str]
 ) -> Optional[str]:
@@ -183,24 +114,30 @@ def _search_globbed_program(path_pattern: str, executable_name: str) -> Optional
     return None
 
 
-INKSCAPE_EXECUTABLE = find_external_program(
-    "Inkscape", "inkscape.exe", ["C:/Program Files/Inkscape/bin"]
-)
-ODA_CONVERTER_EXECUTABLE = find_external_program(
-    "ODA File Converter",
-    "ODAFileConverter.exe",
-    ["C:/Program Files/ODA/ODAFileConverter*"],
-)
+@lru_cache(maxsize=None)
+def inkscape_executable() -> Optional[str]:
+    """Localiza o Inkscape na primeira consulta."""
+    return find_external_program(
+        "Inkscape", "inkscape.exe", ["C:/Program Files/Inkscape/bin"]
+    )
+
 
-INKSCAPE_AVAILABLE = bool(INKSCAPE_EXECUTABLE)
-ODA_CONVERTER_AVAILABLE = bool(ODA_CONVERTER_EXECUTABLE)
+@lru_cache(maxsize=None)
+def oda_converter_executable() -> Optional[str]:
+    """Localiza o ODA File Converter na primeira consulta."""
+    return find_external_program(
+        "ODA File Converter",
+        "ODAFileConverter.exe",
+        ["C:/Program Files/ODA/ODAFileConverter*"],
+    )
 
 
-CONVERSION_HANDLERS = {
+_CONVERSION_TYPES: dict[str, dict[str, Any]] = {
     "DWG para PDF": {
         "extensions": ("*.dwg",),
         "tooltip": "Converte DWG para PDF (Ctrl+Enter)",
-        "enabled": ODA_CONVERTER_AVAILABLE and CAD_RENDER_AVAILABLE,
+        "requires": lambda: bool(oda_converter_executable())
+        and cad_render_disponivel(),
         "dependency_msg": (
             "O ODA Converter e bibliotecas ezdxf com um backend de renderização"
             " (Matplotlib ou PyMuPDF) são necessários."
@@ -209,19 +146,19 @@ CONVERSION_HANDLERS = {
     "DWG para DWG 2013": {
         "extensions": ("*.dwg",),
         "tooltip": "Converte DWG para DWG versão 2013 (Ctrl+Enter)",
-        "enabled": ODA_CONVERTER_AVAILABLE,
+        "requires": lambda: bool(oda_converter_executable()),
         "dependency_msg": "O ODA Converter é necessário.",
     },
     "TIF para PDF": {
         "extensions": ("*.tif", "*.tiff"),
         "tooltip": "Converte TIF para PDF (Ctrl+Enter)",
-        "enabled": PIL_AVAILABLE,
+        "requires": lambda: PIL.disponivel,
         "dependency_msg": "A biblioteca 'Pillow' é necessária.",
     },
     "DXF para PDF": {
         "extensions": ("*.dxf",),
         "tooltip": "Converte DXF para PDF (Ctrl+Enter)",
-        "enabled": CAD_RENDER_AVAILABLE,
+        "requires": cad_render_disponivel,
         "dependency_msg": (
             "É necessário ter 'ezdxf' e um backend de renderização"
             " (Matplotlib ou PyMuPDF)."
@@ -230,42 +167,81 @@ CONVERSION_HANDLERS = {
     "PDF para DXF": {
         "extensions": ("*.pdf",),
         "tooltip": "Converte PDF para DXF (Ctrl+Enter)",
-        "enabled": INKSCAPE_AVAILABLE,
-        "dependency_msg": "O software Inkscape (instalado e/ou no PATH) é necessário.",
+        "requires": lambda: nativo_disponivel() or bool(inkscape_executable()),
+        "dependency_msg": (
+            "São necessárias as bibliotecas 'PyMuPDF' e 'ezdxf' ou o software"
+            " Inkscape (instalado e/ou no PATH)."
+        ),
     },
 }
 
 
-class ConversionWorker(QThread):
-    """Executa a conversão em segundo plano."""
+# Máximo de arquivos entregues a uma execução do ODA ou a uma sessão do Inkscape
+MAX_ARQUIVOS_POR_LOTE = 25
+
+# Tipo de conversão -> (etapa de ConversionSteps, executar em processo separado,
+# etapa recebe um lote de arquivos). Renderização com ezdxf/Pillow usa a CPU;
+# ODA e Inkscape são processos externos: o ODA converte uma pasta por execução
+# e o Inkscape mantém uma sessão --shell por lote. PDF para DXF lê os vetores
+# com PyMuPDF no próprio processo e só recorre ao Inkscape como alternativa.
+_ETAPAS_CONVERSAO: dict[str, Tuple[str, bool, bool]] = {
+    "TIF para PDF": ("tif_para_pdf", True, False),
+    "DWG para PDF": ("dwg_para_pdf_lote", True, True),
+    "DXF para PDF": ("dxf_para_pdf", True, False),
+    "DWG para DWG 2013": ("dwg_para_dwg_2013_lote", False, True),
+    "PDF para DXF": ("pdf_para_dxf_lote", True, True),
+}
 
-    progress_percent = Signal(int)
-    file_processed = Signal(int, object, bool, str)
-    processo_finalizado = Signal(bool)
-    error_occurred = Signal(str)
 
-    def __init__(
-        self,
-        conversion_config: dict,
-        parent=None,
-    ) -> None:
-        """Inicializa ConversionWorker com configuração centralizada.
+def get_conversion_handlers() -> dict[str, dict[str, Any]]:
+    """Retorna os tipos de conversão com a flag ``enabled`` já avaliada.
+
+    A primeira chamada importa as bibliotecas e procura os programas externos
+    necessários; por isso deve ser feita ao abrir o formulário de conversão, e
+    não na importação do módulo.
+    """
+    handlers = {}
+    for nome, info in _CONVERSION_TYPES.items():
+        handler = {k: v for k, v in info.items() if k != "requires"}
+        handler["enabled"] = bool(info["requires"]())
+        handlers[nome] = handler
+    return handlers
+
+
+# Nomes antigos das flags e símbolos opcionais, resolvidos sob demanda (PEP 562)
+_NOMES_PREGUICOSOS: dict[str, Callable[[], Any]] = {
+    "PIL_AVAILABLE": lambda: PIL.disponivel,
+    "EZDXF_AVAILABLE": lambda: EZDXF_DESENHO.disponivel,
+    "FITZ_AVAILABLE": lambda: FITZ.disponivel,
+    "MATPLOTLIB_BACKEND_AVAILABLE": lambda: BACKEND_MATPLOTLIB.disponivel,
+    "PYMUPDF_BACKEND_AVAILABLE": lambda: BACKEND_PYMUPDF.disponivel,
+    "CAD_RENDER_AVAILABLE": cad_render_disponivel,
+    "INKSCAPE_EXECUTABLE": inkscape_executable,
+    "ODA_CONVERTER_EXECUTABLE": oda_converter_executable,
+    "INKSCAPE_AVAILABLE": lambda: bool(inkscape_executable()),
+    "ODA_CONVERTER_AVAILABLE": lambda: bool(oda_converter_executable()),
+    "CONVERSION_HANDLERS": get_conversion_handlers,
+}
 
-        Args:
-            conversion_config: Dict com {pasta_destino, files, conversion_type, substituir_original}
-            parent: Widget pai (QObject)
-        """
-        super().__init__(parent)
-        self.pasta_destino = conversion_config["pasta_destino"]
-        self.files = conversion_config["files"]
-        self.conversion_type = conversion_config["conversion_type"]
-        self.substituir_original = conversion_config.get("substituir_original", False)
-        self._is_interrupted = False
-        self._conversion_handlers = self._build_conversion_handlers()
 
-    def stop(self) -> None:
-        """Sinaliza à thread para interromper a execução."""
-        self._is_interrupted = True
+def __getattr__(nome: str) -> Any:
+    """Avalia as flags legadas (``*_AVAILABLE`` etc.) apenas quando lidas."""
+    if nome in _NOMES_PREGUICOSOS:
+        return _NOMES_PREGUICOSOS[nome]()
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+class ConversionSteps:
+    """Etapas de conversão sem dependência de Qt.
+
+    Cada etapa recebe o caminho de origem e retorna ``(sucesso, mensagem,
+    resultado)``; por não guardar estado além da configuração, pode ser criada
+    e executada tanto na thread do worker quanto em um processo separado.
+    """
+
+    def __init__(self, pasta_destino: str, substituir_original: bool = False):
+        self.pasta_destino = pasta_destino
+        self.substituir_original = substituir_original
 
     @staticmethod
     def _ensure_unique_path(path_destino: str) -> str:
@@ -285,117 +261,84 @@ class ConversionWorker(QThread):
                 return str(new_candidate)
             counter += 1
 
-    # pylint: disable=too-many-branches,too-many-locals
-    def run(self) -> None:  # type: ignore[override]
-        """Ponto de entrada da thread de conversão."""
-        try:
-            total = len(self.files)
-            for idx, (row, path_origem) in enumerate(self.files, start=1):
-                if self._is_interrupted:
-                    break
-
-                handler = self._conversion_handlers.get(self.conversion_type)
-                if handler is None:
-                    logging.error(
-                        "Tipo de conversão desconhecido: %s", self.conversion_type
-                    )
-                    continue
-
-                handler(row, path_origem)
-
-                percent = int((idx / total) * 100)
-                self.progress_percent.emit(percent)
-        except (
-            OSError,
-            subprocess.CalledProcessError,
-            subprocess.TimeoutExpired,
-            FileNotFoundError,
-        ) as exc:
-            logging.error("Ocorreu um erro na thread de conversão.")
-            logging.error(traceback.format_exc())
-            self.error_occurred.emit(f"Ocorreu um erro crítico na conversão:\n{exc}")
-        finally:
-            self.processo_finalizado.emit(self._is_interrupted)
-
-    def _build_conversion_handlers(self) -> dict[str, Callable[[int, str], None]]:
-        return {
-            "TIF para PDF": self._convert_tif_to_pdf,
-            "DWG para PDF": self._convert_dwg_to_pdf,
-            "DWG para DWG 2013": self._convert_dwg_to_dwg_2013,
-            "PDF para DXF": self._convert_pdf_to_dxf,
-            "DXF para PDF": self._convert_dxf_to_pdf_handler,
-        }
-
-    def _convert_dxf_to_pdf_handler(self, row: int, path_origem: str) -> None:
-        self._convert_dxf_to_pdf(row, path_origem, path_origem)
-
-    def _convert_dwg_to_pdf(self, row: int, path_origem: str) -> None:
-        """Converte DWG para PDF delegando ao helper especializado."""
-        sucesso, mensagem, path_resultado = converter_dwg_para_pdf(
+    def tif_para_pdf(self, path_origem: str) -> ResultadoConversao:
+        """Converte um único arquivo TIF para PDF."""
+        return converter_tif_para_pdf(
             path_origem=path_origem,
-            generate_dxf_func=self._generate_intermediate_dxf,
-            convert_dxf_to_pdf_func=self._convert_dxf_temp_to_pdf,
+            pasta_destino=self.pasta_destino,
+            ensure_unique_path_func=self._ensure_unique_path,
         )
 
-        if self._is_interrupted:
-            return
+    def dxf_para_pdf(self, path_origem: str) -> ResultadoConversao:
+        """Converte um arquivo DXF para PDF via helper especializado."""
+        return self._convert_dxf_temp_to_pdf(path_origem, path_origem)
 
-        self.file_processed.emit(row, path_resultado or "", sucesso, mensagem)
+    def dwg_para_pdf_lote(self, paths_origem: List[str]) -> List[ResultadoConversao]:
+        """Converte DWG para PDF com uma única execução do ODA para o lote."""
+        return converter_dwg_para_pdf_lote(
+            paths_origem=paths_origem,
+            oda_executable=oda_converter_executable(),
+            convert_dxf_to_pdf_func=self._convert_dxf_temp_to_pdf,
+        )
 
-    def _convert_dwg_to_dwg_2013(self, row: int, path_origem: str) -> None:
-        """Converte DWG para DWG versão 2013 utilizando o ODA Converter."""
-        sucesso, mensagem, arquivos = converter_dwg_para_dwg_2013(
-            path_origem=path_origem,
+    def dwg_para_dwg_2013_lote(
+        self, paths_origem: List[str]
+    ) -> List[ResultadoConversao]:
+        """Converte DWG para DWG 2013 com uma única execução do ODA para o lote."""
+        resultados = converter_dwg_para_dwg_2013_lote(
+            paths_origem=paths_origem,
             pasta_destino=self.pasta_destino,
-            oda_executable=ODA_CONVERTER_EXECUTABLE,
+            oda_executable=oda_converter_executable(),
             substituir_original=self.substituir_original,
             ensure_unique_path_func=self._ensure_unique_path,
         )
+        return [
+            (sucesso, mensagem, arquivos[0] if arquivos else "")
+            for sucesso, mensagem, arquivos in resultados
+        ]
 
-        if sucesso:
-            path_resultado = arquivos[0] if arquivos else ""
-            self.file_processed.emit(row, path_resultado, True, mensagem)
-        else:
-            path_resultado = arquivos[0] if arquivos else ""
-            self.file_processed.emit(row, path_resultado, sucesso, mensagem)
-
-    def _generate_intermediate_dxf(
-        self, path_origem: str, nome_arquivo: str, path_dxf_temp: str
-    ) -> tuple[bool, str]:
-        """Executa o ODA Converter para gerar um DXF temporário."""
-
-        if not ODA_CONVERTER_EXECUTABLE:
-            return (False, "ODA Converter não está configurado corretamente.")
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            command = [
-                ODA_CONVERTER_EXECUTABLE,
-                os.path.dirname(path_origem),
-                temp_dir,
-                "ACAD2018",
-                "DXF",
-                "0",
-                "1",
-                nome_arquivo,
-            ]
-
-            result = run_oda_command(command, "ODA Converter DWG->DXF")
-
-            _log_subprocess_output(result, "ODA Converter", stderr_level=logging.DEBUG)
-
-            nome_base = Path(nome_arquivo).stem
-            expected_dxf = Path(temp_dir, f"{nome_base}.dxf")
-            if expected_dxf.exists():
-                shutil.move(str(expected_dxf), path_dxf_temp)
-                return (True, "DXF intermediário gerado")
+    def pdf_para_dxf_lote(self, paths_origem: List[str]) -> List[ResultadoConversao]:
+        """Converte cada página dos PDFs em um DXF.
 
-            fallback = next(Path(temp_dir).glob("*.dxf"), None)
-            if fallback:
-                shutil.move(str(fallback), path_dxf_temp)
-                return (True, "DXF intermediário gerado")
+        Os vetores são lidos diretamente com PyMuPDF; o Inkscape (uma sessão
+        por lote, iniciada só se necessária) é usado quando a leitura interna
+        não está disponível ou falha.
+        """
+        executable = inkscape_executable()
+        shell = InkscapeShell(executable) if executable else None
+        try:
+            return [
+                self._pdf_para_dxf(path_origem, executable, shell)
+                for path_origem in paths_origem
+            ]
+        finally:
+            if shell is not None:
+                shell.fechar()
 
-            logging.error("FALHA: Arquivo DXF intermediário não foi criado.")
-            return (False, "Arquivo DXF intermediário não foi criado.")
+    def _pdf_para_dxf(
+        self,
+        path_origem: str,
+        executable: Optional[str],
+        shell: Optional[InkscapeShell],
+    ) -> ResultadoConversao:
+        """Converte um PDF, tentando a leitura interna antes do Inkscape."""
+        resultado = converter_pdf_para_dxf_nativo(
+            path_origem=path_origem,
+            pasta_destino=self.pasta_destino,
+            ensure_unique_path_func=self._ensure_unique_path,
+        )
+        if resultado is not None:
+            return resultado
+        if not executable:
+            return (False, "Inkscape não encontrado para converter o PDF.", None)
+        return converter_pdf_para_dxf(
+            path_origem=path_origem,
+            pasta_destino=self.pasta_destino,
+            inkscape_executable=executable,
+            prepare_pdf_pages_func=self._prepare_pdf_page_sources,
+            ensure_unique_path_func=self._ensure_unique_path,
+            inkscape_shell=shell,
+        )
 
     def _convert_dxf_temp_to_pdf(
         self, path_dxf: str, path_original_para_nome: str
@@ -414,25 +357,6 @@ class ConversionWorker(QThread):
             nome_base_override=nome_destino_base,
         )
 
-    def _convert_tif_to_pdf(self, row: int, path_origem: str) -> None:
-        """Converte um único arquivo TIF para PDF."""
-        sucesso, mensagem, path_destino = converter_tif_para_pdf(
-            path_origem=path_origem,
-            pasta_destino=self.pasta_destino,
-            ensure_unique_path_func=self._ensure_unique_path,
-        )
-        self.file_processed.emit(row, path_destino or "", sucesso, mensagem)
-
-    def _convert_dxf_to_pdf(
-        self, row: int, path_dxf: str, path_original_para_nome: str
-    ) -> None:
-        """Converte um arquivo DXF para PDF via helper especializado."""
-        sucesso, mensagem, path_destino = self._convert_dxf_temp_to_pdf(
-            path_dxf,
-            path_original_para_nome,
-        )
-        self.file_processed.emit(row, path_destino or "", sucesso, mensagem)
-
     def _select_layout_for_render(self, doc):
         model = doc.modelspace()
         if self._layout_entity_count(model) > 0:
@@ -458,34 +382,28 @@ class ConversionWorker(QThread):
             return 1 if next(iterator, None) is not None else 0
 
     def _render_layout_to_pdf(self, doc, layout_obj, path_destino: str) -> None:
-        if PYMUPDF_BACKEND_AVAILABLE:
+        if BACKEND_PYMUPDF.disponivel:
             self._render_with_pymupdf(doc, layout_obj, path_destino)
             return
-        if MATPLOTLIB_BACKEND_AVAILABLE:
+        if BACKEND_MATPLOTLIB.disponivel:
             self._render_with_matplotlib(doc, layout_obj, path_destino)
             return
         raise RuntimeError("Nenhum backend de renderização DXF está disponível.")
 
     def _render_with_pymupdf(self, doc, layout_obj, path_destino: str) -> None:
-        if not (
-            PYMUPDF_BACKEND_AVAILABLE
-            and PyMuPdfBackend
-            and Page
-            and Settings
-            and Margins
-            and Units
-        ):
+        if not BACKEND_PYMUPDF.disponivel:
             raise RuntimeError("Backend PyMuPDF indisponível para renderização de DXF.")
 
-        backend = PyMuPdfBackend()
+        desenho = EZDXF_DESENHO
+        backend = BACKEND_PYMUPDF.PyMuPdfBackend()
         try:
             backend.set_background("#FFFFFF")
         except AttributeError:
             logging.debug(
                 "Backend PyMuPDF sem suporte a set_background; usando padrão."
             )
-        ctx = RenderContext(doc)
-        frontend = Frontend(ctx, backend)
+        ctx = desenho.RenderContext(doc)
+        frontend = desenho.Frontend(ctx, backend)
         self._apply_monochrome_override(frontend)
         _update_render_config(frontend)
         frontend.draw_layout(layout_obj, finalize=True)
@@ -494,30 +412,30 @@ class ConversionWorker(QThread):
         bbox = self._layout_bounding_box(layout_obj)
         render_box = None
         width_mm, height_mm = self._preferred_page_size_mm(bbox)
-        if bbox and BoundingBox2d:
-            render_box = BoundingBox2d(
+        if bbox:
+            render_box = desenho.BoundingBox2d(
                 [
                     (bbox.extmin.x, bbox.extmin.y),
                     (bbox.extmax.x, bbox.extmax.y),
                 ]
             )
 
-        page = Page(
+        page = desenho.Page(
             width_mm,
             height_mm,
-            units=Units.mm,
-            margins=Margins(5, 5, 5, 5),
+            units=desenho.Units.mm,
+            margins=desenho.Margins(5, 5, 5, 5),
         )
         pdf_bytes = backend.get_pdf_bytes(
             page,
-            settings=Settings(fit_page=True, output_layers=True),
+            settings=desenho.Settings(fit_page=True, output_layers=True),
             render_box=render_box,
         )
         with open(path_destino, "wb") as destino:
             destino.write(pdf_bytes)
 
     def _render_with_matplotlib(self, doc, layout_obj, path_destino: str) -> None:
-        if not (MATPLOTLIB_BACKEND_AVAILABLE and plt and MatplotlibBackend):
+        if not BACKEND_MATPLOTLIB.disponivel:
             raise RuntimeError(
                 "Backend Matplotlib indisponível para renderização de DXF."
             )
@@ -527,16 +445,17 @@ class ConversionWorker(QThread):
         if width_mm == 0 or height_mm == 0:
             width_mm, height_mm = 420.0, 297.0
 
+        plt = BACKEND_MATPLOTLIB.plt
         fig = plt.figure(figsize=(width_mm / 25.4, height_mm / 25.4), dpi=300)
         fig.patch.set_facecolor("white")
         ax = fig.add_axes([0, 0, 1, 1])
         ax.set_axis_off()
         ax.set_facecolor("white")
 
-        ctx = RenderContext(doc)
-        backend = MatplotlibBackend(ax)
+        ctx = EZDXF_DESENHO.RenderContext(doc)
+        backend = BACKEND_MATPLOTLIB.MatplotlibBackend(ax)
         _update_render_config(backend)
-        frontend = Frontend(ctx, backend)
+        frontend = EZDXF_DESENHO.Frontend(ctx, backend)
         self._apply_monochrome_override(frontend)
         frontend.draw_layout(layout_obj, finalize=True)
 
@@ -578,48 +497,12 @@ class ConversionWorker(QThread):
 
         frontend.push_property_override_function(_force_black)
 
-    def _split_pdf_if_needed(self, pdf_path: str) -> Tuple[List[str], int]:
-        """Divide PDFs multipágina em arquivos individuais quando possível."""
-
-        if not (FITZ_AVAILABLE and fitz):
-            logging.info(
-                "PyMuPDF indisponível, conversão multi-página dependerá do Inkscape."
-            )
-            return [pdf_path], 1
-
-        try:
-            with fitz.open(pdf_path) as doc:  # type: ignore[call-arg]
-                total_pages = doc.page_count
-                if total_pages <= 1:
-                    return [pdf_path], total_pages
-
-                page_paths: List[str] = []
-                base_dir = os.path.dirname(pdf_path)
-                for idx in range(total_pages):
-                    single_doc = fitz.open()  # type: ignore[call-arg]
-                    single_doc.insert_pdf(doc, from_page=idx, to_page=idx)
-                    page_path = self._ensure_unique_path(
-                        os.path.join(base_dir, f"pagina_{idx + 1}.pdf")
-                    )
-                    single_doc.save(page_path)
-                    single_doc.close()
-                    page_paths.append(page_path)
-                logging.debug(
-                    "PDF '%s' dividido em %d páginas temporárias.",
-                    os.path.basename(pdf_path),
-                    total_pages,
-                )
-                return page_paths, total_pages
-        except (RuntimeError, ValueError, IOError) as exc:
-            logging.warning("Falha ao segmentar PDF multipágina: %s", exc)
-        return [pdf_path], 1
-
     def _layout_bounding_box(self, layout_obj):
-        if not BoundingBox:
+        if not EZDXF.disponivel:
             return None
         try:
-            bbox = BoundingBox(layout_obj)
-        except (ValueError, ezdxf.DXFStructureError, TypeError):
+            bbox = EZDXF.BoundingBox(layout_obj)
+        except (ValueError, EZDXF.ezdxf.DXFStructureError, TypeError):
             return None
         return bbox if getattr(bbox, "has_data", False) else None
 
@@ -650,36 +533,237 @@ class ConversionWorker(QThread):
     def _clamp_page_size(value: float) -> float:
         return max(50.0, min(value, 2000.0))
 
+    @staticmethod
     def _prepare_pdf_page_sources(
-        self, temp_pdf_path: str, original_name: str
-    ) -> Tuple[List[str], int, bool]:
-        page_sources, total_pages = self._split_pdf_if_needed(temp_pdf_path)
-        use_page_numbers = False
+        dados_pdf: bytes, original_name: str
+    ) -> Tuple[Iterator[Optional[bytes]], int]:
+        """Separa as páginas do PDF em buffers de memória, sob demanda.
+
+        Cada página só é extraída quando o conversor a consome; nada é gravado
+        em disco aqui. Sem PyMuPDF (ou com PDF ilegível), o documento inteiro é
+        a única fonte, como antes.
 
-        if total_pages > len(page_sources):
+        Returns:
+            Tuple (páginas, total de páginas). Uma página None indica que ela
+            não pôde ser extraída e deve ser lida do documento pelo número.
+        """
+        fitz = FITZ.fitz
+        if fitz is None:
             logging.info(
-                "PDF '%s' possui %d página(s), mas apenas %d fonte(s) foram geradas; "
-                "usando o arquivo original com parâmetros de página.",
-                original_name,
-                total_pages,
-                len(page_sources),
+                "PyMuPDF indisponível, conversão multi-página dependerá do Inkscape."
             )
-            if page_sources:
-                page_sources = [page_sources[0]] * total_pages
-                use_page_numbers = True
-        else:
-            total_pages = len(page_sources)
+            return iter([dados_pdf]), 1
 
-        return page_sources, total_pages, use_page_numbers
+        try:
+            doc = fitz.open(stream=dados_pdf, filetype="pdf")
+        except (RuntimeError, ValueError) as exc:
+            logging.warning("Falha ao segmentar PDF multipágina: %s", exc)
+            return iter([dados_pdf]), 1
 
-    def _convert_pdf_to_dxf(self, row: int, path_origem: str) -> None:
-        sucesso, mensagem, arquivos_gerados = converter_pdf_para_dxf(
-            path_origem=path_origem,
-            pasta_destino=self.pasta_destino,
-            inkscape_executable=INKSCAPE_EXECUTABLE,
-            prepare_pdf_pages_func=self._prepare_pdf_page_sources,
-            ensure_unique_path_func=self._ensure_unique_path,
+        total_pages = doc.page_count
+        if total_pages <= 1:
+            doc.close()
+            return iter([dados_pdf]), 1
+
+        logging.debug(
+            "PDF '%s' será dividido em %d páginas em memória.",
+            original_name,
+            total_pages,
+        )
+        return _paginas_em_memoria(doc), total_pages
+
+
+def _paginas_em_memoria(doc) -> Iterator[Optional[bytes]]:
+    """Gera cada página de ``doc`` como um PDF próprio em memória."""
+    fitz = FITZ.fitz
+    try:
+        for idx in range(doc.page_count):
+            try:
+                with fitz.open() as pagina:  # type: ignore[call-arg]
+                    pagina.insert_pdf(doc, from_page=idx, to_page=idx)
+                    dados = pagina.tobytes(garbage=1, deflate=True)
+            except (RuntimeError, ValueError) as exc:
+                logging.warning("Falha ao extrair a página %d: %s", idx + 1, exc)
+                dados = None
+            yield dados
+    finally:
+        doc.close()
+
+
+def _executar_etapa(
+    etapa: Tuple[str, bool, bool],
+    pasta_destino: str,
+    substituir_original: bool,
+    paths_origem: List[str],
+) -> List[ResultadoConversao]:
+    """Executa uma etapa de ``ConversionSteps`` (alvo dos pools de execução).
+
+    Etapas em lote recebem todos os arquivos de uma vez; as demais são
+    aplicadas a cada arquivo. Retorna um resultado por arquivo, na mesma ordem.
+    """
+    nome_etapa, _, em_lote = etapa
+    funcao = getattr(ConversionSteps(pasta_destino, substituir_original), nome_etapa)
+    if em_lote:
+        return funcao(paths_origem)
+    return [funcao(path_origem) for path_origem in paths_origem]
+
+
+class ConversionWorker(QThread):
+    """Executa a conversão em segundo plano, com vários arquivos em paralelo.
+
+    Renderizações com ezdxf e Pillow (limitadas pela CPU) rodam em um pool de
+    processos; conversões que apenas aguardam o ODA Converter ou o Inkscape
+    rodam em um pool de threads. Ambos respeitam ``max_workers``.
+    """
+
+    progress_percent = Signal(int)
+    file_processed = Signal(int, object, bool, str)
+    processo_finalizado = Signal(bool)
+    error_occurred = Signal(str)
+
+    def __init__(
+        self,
+        conversion_config: dict,
+        parent=None,
+    ) -> None:
+        """Inicializa ConversionWorker com configuração centralizada.
+
+        Args:
+            conversion_config: Dict com {pasta_destino, files, conversion_type,
+                substituir_original, max_workers (opcional)}
+            parent: Widget pai (QObject)
+        """
+        super().__init__(parent)
+        self.pasta_destino = conversion_config["pasta_destino"]
+        self.files = conversion_config["files"]
+        self.conversion_type = conversion_config["conversion_type"]
+        self.substituir_original = conversion_config.get("substituir_original", False)
+        self.max_workers = max(
+            1, conversion_config.get("max_workers") or MAX_CONVERSOES_PARALELAS
         )
+        self._is_interrupted = False
 
-        resultado = arquivos_gerados if arquivos_gerados else ""
-        self.file_processed.emit(row, resultado, sucesso, mensagem)
+    def stop(self) -> None:
+        """Sinaliza à thread para interromper a execução."""
+        self._is_interrupted = True
+
+    def run(self) -> None:  # type: ignore[override]
+        """Ponto de entrada da thread de conversão."""
+        try:
+            etapa = _ETAPAS_CONVERSAO.get(self.conversion_type)
+            if etapa is None:
+                logging.error(
+                    "Tipo de conversão desconhecido: %s", self.conversion_type
+                )
+                return
+
+            total = len(self.files)
+            concluidos = 0
+            for onda in self._agrupar_por_nome(self.files):
+                if self._is_interrupted:
+                    break
+                for row, (sucesso, mensagem, resultado) in self._executar_onda(
+                    etapa, onda
+                ):
+                    self.file_processed.emit(row, resultado or "", sucesso, mensagem)
+                    concluidos += 1
+                    self.progress_percent.emit(int((concluidos / total) * 100))
+        except (
+            OSError,
+            subprocess.CalledProcessError,
+            subprocess.TimeoutExpired,
+            FileNotFoundError,
+        ) as exc:
+            logging.error("Ocorreu um erro na thread de conversão.")
+            logging.error(traceback.format_exc())
+            self.error_occurred.emit(f"Ocorreu um erro crítico na conversão:\n{exc}")
+        finally:
+            self.processo_finalizado.emit(self._is_interrupted)
+
+    @staticmethod
+    def _agrupar_por_nome(
+        files: List[Tuple[int, str]],
+    ) -> List[List[Tuple[int, str]]]:
+        """Separa em ondas os arquivos cujas saídas teriam o mesmo nome.
+
+        Arquivos de pastas diferentes com o mesmo nome disputariam o mesmo
+        destino (e o sufixo de ``_ensure_unique_path``) se convertidos ao mesmo
+        tempo; a n-ésima ocorrência de cada nome vai para a n-ésima onda.
+        """
+        ocorrencias: dict[str, int] = {}
+        ondas: List[List[Tuple[int, str]]] = []
+        for row, path_origem in files:
+            chave = Path(path_origem).stem.lower()
+            indice = ocorrencias.get(chave, 0)
+            ocorrencias[chave] = indice + 1
+            if indice == len(ondas):
+                ondas.append([])
+            ondas[indice].append((row, path_origem))
+        return ondas
+
+    def _dividir_em_lotes(
+        self, etapa: Tuple[str, bool, bool], onda: List[Tuple[int, str]]
+    ) -> List[List[Tuple[int, str]]]:
+        """Agrupa os arquivos da onda nas unidades enviadas aos pools.
+
+        Etapas em lote recebem até ``MAX_ARQUIVOS_POR_LOTE`` arquivos,
+        repartidos de modo que todos os workers tenham trabalho; as demais
+        recebem um arquivo por tarefa.
+        """
+        if not etapa[2]:
+            return [[item] for item in onda]
+        tamanho = min(MAX_ARQUIVOS_POR_LOTE, math.ceil(len(onda) / self.max_workers))
+        return [onda[i : i + tamanho] for i in range(0, len(onda), tamanho)]
+
+    def _executar_onda(
+        self, etapa: Tuple[str, bool, bool], onda: List[Tuple[int, str]]
+    ) -> Iterator[Tuple[int, ResultadoConversao]]:
+        """Converte os arquivos da onda, produzindo os resultados ao concluírem."""
+        lotes = self._dividir_em_lotes(etapa, onda)
+        workers = min(self.max_workers, len(lotes))
+        argumentos = (etapa, self.pasta_destino, self.substituir_original)
+
+        if workers <= 1:
+            # Uma única tarefa não compensa o custo de iniciar um pool
+            for lote in lotes:
+                if self._is_interrupted:
+                    return
+                resultados = _executar_etapa(*argumentos, [p for _, p in lote])
+                yield from zip((row for row, _ in lote), resultados)
+            return
+
+        executor_cls = ProcessPoolExecutor if etapa[1] else ThreadPoolExecutor
+        with executor_cls(max_workers=workers) as executor:
+            futuros = {
+                executor.submit(
+                    _executar_etapa, *argumentos, [p for _, p in lote]
+                ): lote
+                for lote in lotes
+            }
+            try:
+                for futuro in as_completed(futuros):
+                    lote = futuros[futuro]
+                    resultados = self._resultados(futuro, len(lote))
+                    yield from zip((row for row, _ in lote), resultados)
+                    if self._is_interrupted:
+                        break
+            finally:
+                for futuro in futuros:
+                    futuro.cancel()
+
+    @staticmethod
+    def _resultados(futuro: Future, quantidade: int) -> List[ResultadoConversao]:
+        """Obtém os resultados da tarefa; uma falha é reportada em cada arquivo.
+
+        Um erro não tratado na etapa (ou a queda do processo auxiliar) não deve
+        interromper as demais tarefas da onda.
+        """
+        try:
+            return futuro.result()
+        except BrokenProcessPool as exc:
+            logging.error("Processo de conversão encerrado inesperadamente: %s", exc)
+            falha = (False, f"Processo de conversão encerrado: {exc}", None)
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.error("Falha na tarefa de conversão: %s", exc, exc_info=True)
+            falha = (False, f"Erro na conversão: {exc}", None)
+        return [falha] * quantidade
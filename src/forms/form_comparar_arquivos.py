@@ -15,12 +15,13 @@ plano para manter a interface responsiva.
 import logging
 import os
 import sys
-from typing import Optional, Set
+from typing import Iterable, Optional, Set
 
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QApplication,
+    QCheckBox,
     QComboBox,
     QFileDialog,
     QGroupBox,
@@ -46,11 +47,13 @@ from src.forms.common.ui_helpers import (
     update_processing_state,
 )
 from src.utils.comparar_worker import (
-    FILE_HANDLERS,
     ComparisonWorker,
+    get_file_handlers,
     get_missing_dependencies,
 )
+from src.utils.dependencias import FITZ
 from src.utils.estilo import aplicar_estilo_botao
+from src.utils.pareamento_arquivos import expandir_pastas
 from src.utils.themed_widgets import ThemedDialog
 from src.utils.utilitarios import (
     ICON_PATH,
@@ -67,7 +70,7 @@ MARGEM_LAYOUT = 10
 
 
 class FileTableWidget(ManagedFileTableWidget):
-    """Tabela que aceita arquivos arrastados e permite reordenação e exclusão."""
+    """Tabela que aceita arquivos e pastas arrastados, com reordenação e exclusão."""
 
     def __init__(self, parent=None):
         """Inicializa a tabela configurando colunas e estado inicial."""
@@ -96,6 +99,13 @@ class FileTableWidget(ManagedFileTableWidget):
                     paths.add(data)
         return paths
 
+    def _is_extension_allowed(self, file_path: str) -> bool:
+        return os.path.isdir(file_path) or super()._is_extension_allowed(file_path)
+
+    def handle_dropped_files(self, files: Iterable[str]) -> None:
+        """Adiciona os arquivos soltos, incluindo os de pastas (recursivamente)."""
+        self.add_files(expandir_pastas(files, self._allowed_extensions))
+
     def _insert_path(self, path: str) -> None:
         row = self.rowCount()
         self.insertRow(row)
@@ -140,6 +150,10 @@ class FormCompararArquivos(ThemedDialog):
         self.btn_cancel: Optional[QPushButton] = None
         self.btn_clear: Optional[QPushButton] = None
         self.cmb_file_type: Optional[QComboBox] = None
+        self.chk_parear: Optional[QCheckBox] = None
+        self.chk_sobreposicao: Optional[QCheckBox] = None
+        # As bibliotecas de comparação só são verificadas ao abrir o formulário
+        self._handlers = get_file_handlers()
         self._inicializar_ui()
 
     def _inicializar_ui(self):
@@ -184,7 +198,7 @@ class FormCompararArquivos(ThemedDialog):
         label_tipo.setObjectName("label_titulo")
         type_layout.addWidget(label_tipo)
         self.cmb_file_type = QComboBox()
-        for name, data in FILE_HANDLERS.items():
+        for name, data in self._handlers.items():
             if data["available"]:
                 self.cmb_file_type.addItem(name)
         self.cmb_file_type.setToolTip("Selecione o tipo de arquivo para comparar.")
@@ -192,16 +206,37 @@ class FormCompararArquivos(ThemedDialog):
         type_layout.addWidget(self.cmb_file_type, 1)
         main_layout.addLayout(type_layout)
 
+        options_layout = QHBoxLayout()
+        self.chk_parear = QCheckBox("Parear por nome e conteúdo")
+        self.chk_parear.setChecked(True)
+        self.chk_parear.setToolTip(
+            "Casa os arquivos das listas pelo nome (ignorando sufixos de revisão)\n"
+            "e, para arquivos renomeados, pelo conteúdo.\n"
+            "Desmarcado, compara a linha N da Lista A com a linha N da Lista B."
+        )
+        options_layout.addWidget(self.chk_parear)
+        self.chk_sobreposicao = QCheckBox("PDF de diferenças (DXF)")
+        self.chk_sobreposicao.setToolTip(
+            "Para cada par de DXF diferente, gera um PDF com as duas versões\n"
+            "sobrepostas: removidas em vermelho, adicionadas em verde e\n"
+            "movidas em azul. A pasta de destino é pedida ao comparar."
+        )
+        options_layout.addWidget(self.chk_sobreposicao)
+        options_layout.addStretch(1)
+        main_layout.addLayout(options_layout)
+
         lists_layout = QHBoxLayout()
         self.table_a_widget = FileTableWidget()
         self.table_b_widget = FileTableWidget()
         self.table_a_widget.set_other_table(self.table_b_widget)
         self.table_b_widget.set_other_table(self.table_a_widget)
         self.table_a_widget.setToolTip(
-            "Arraste arquivos ou use o botão acima para adicioná-los à Lista A."
+            "Arraste arquivos ou pastas, ou use o botão acima para adicioná-los à"
+            " Lista A."
         )
         self.table_b_widget.setToolTip(
-            "Arraste arquivos ou use o botão acima para adicioná-los à Lista B."
+            "Arraste arquivos ou pastas, ou use o botão acima para adicioná-los à"
+            " Lista B."
         )
         lists_layout.addWidget(
             self._create_list_groupbox("Lista A", self.table_a_widget, "Ctrl+1")
@@ -255,16 +290,21 @@ class FormCompararArquivos(ThemedDialog):
         """Chamado quando o tipo de arquivo no ComboBox muda."""
         self._clear_all()
         file_type = self.cmb_file_type.currentText()
-        if handler := FILE_HANDLERS.get(file_type):
+        if handler := self._handlers.get(file_type):
             extensions = handler["extensions"]
             self.table_a_widget.set_allowed_extensions(extensions)
             self.table_b_widget.set_allowed_extensions(extensions)
             self.btn_compare.setToolTip(handler["tooltip"])
+        self.chk_sobreposicao.setEnabled(self._sobreposicao_disponivel())
+
+    def _sobreposicao_disponivel(self) -> bool:
+        """A sobreposição em PDF só existe para DXF e requer o PyMuPDF."""
+        return self.cmb_file_type.currentText() == "DXF" and FITZ.disponivel
 
     def _select_files(self, table: FileTableWidget):
         """Abre uma caixa de diálogo para selecionar arquivos."""
         file_type = self.cmb_file_type.currentText()
-        if not (handler := FILE_HANDLERS.get(file_type)):
+        if not (handler := self._handlers.get(file_type)):
             return
 
         extensions = " ".join(handler["extensions"])
@@ -286,6 +326,15 @@ class FormCompararArquivos(ThemedDialog):
             )
             return
 
+        pasta_sobreposicao = None
+        if self._sobreposicao_disponivel() and self.chk_sobreposicao.isChecked():
+            pasta_sobreposicao = (
+                QFileDialog.getExistingDirectory(
+                    self, "Pasta para os PDFs de diferenças"
+                )
+                or None
+            )
+
         self._reset_tables_status()
         self._set_ui_state(is_running=True)
 
@@ -299,10 +348,14 @@ class FormCompararArquivos(ThemedDialog):
         ]
 
         self.worker = ComparisonWorker(
-            files_a, files_b, self.cmb_file_type.currentText()
+            files_a,
+            files_b,
+            self.cmb_file_type.currentText(),
+            parear_arquivos=self.chk_parear.isChecked(),
+            pasta_sobreposicao=pasta_sobreposicao,
         )
         self.worker.progress_updated.connect(self.progress_bar.setValue)
-        self.worker.row_compared.connect(self._on_row_compared)
+        self.worker.pair_compared.connect(self._on_pair_compared)
         self.worker.comparison_finished.connect(self._on_comparison_finished)
         self.worker.error_occurred.connect(self._on_worker_error)
         self.worker.start()
@@ -320,10 +373,18 @@ class FormCompararArquivos(ThemedDialog):
         """Habilita/desabilita controles da UI com base no estado da operação."""
         update_processing_state(
             is_running,
-            [self.btn_compare, self.btn_clear, self.cmb_file_type],
+            [
+                self.btn_compare,
+                self.btn_clear,
+                self.cmb_file_type,
+                self.chk_parear,
+                self.chk_sobreposicao,
+            ],
             self.btn_cancel,
             self.progress_bar,
         )
+        if not is_running:
+            self.chk_sobreposicao.setEnabled(self._sobreposicao_disponivel())
 
     def _reset_tables_status(self):
         """Limpa o status e a cor de todas as linhas em ambas as tabelas."""
@@ -336,16 +397,33 @@ class FormCompararArquivos(ThemedDialog):
                     if item := table.item(row, col):
                         item.setForeground(QColor("white"))
 
-    def _on_row_compared(self, row, props_a, status_a, props_b, status_b, are_equal):
-        """Atualiza a UI para uma linha que acabou de ser comparada."""
-        if row < self.table_a_widget.rowCount():
-            self._update_row_status(
-                self.table_a_widget, row, props_a, status_a, are_equal
-            )
-        if row < self.table_b_widget.rowCount():
-            self._update_row_status(
-                self.table_b_widget, row, props_b, status_b, are_equal
-            )
+    def _on_pair_compared(
+        self, row_a, row_b, props_a, status_a, props_b, status_b, are_equal
+    ):
+        """Atualiza a UI para um par que acabou de ser comparado.
+
+        A linha vale -1 no lado sem correspondente; cada tabela indica na
+        tooltip com qual arquivo da outra lista a linha foi comparada.
+        """
+        lados = (
+            (self.table_a_widget, row_a, props_a, status_a, self.table_b_widget, row_b),
+            (self.table_b_widget, row_b, props_b, status_b, self.table_a_widget, row_a),
+        )
+        for table, row, props, status, other_table, other_row in lados:
+            if 0 <= row < table.rowCount():
+                other_item = (
+                    other_table.item(other_row, 1)
+                    if 0 <= other_row < other_table.rowCount()
+                    else None
+                )
+                self._update_row_status(
+                    table,
+                    row,
+                    props,
+                    status,
+                    are_equal,
+                    other_item.data(Qt.ItemDataRole.UserRole) if other_item else None,
+                )
 
     def _format_properties_tooltip(self, props: Optional[tuple], file_type: str) -> str:
         """Formata as propriedades para exibição na tooltip."""
@@ -360,12 +438,16 @@ class FormCompararArquivos(ThemedDialog):
             labels = ["Topologia", "Volume", "Área", "Centro de Massa", "Mom. Inércia"]
             lines = [f"  - {lbl}: {val}" for lbl, val in zip(labels, props)]
         elif file_type == "DXF":
-            labels = ["Entidades", "Ext. Mínima", "Ext. Máxima"]
+            labels = [
+                "Entidades",
+                "Ext. Mínima",
+                "Ext. Máxima",
+                "Hash Geometria",
+                "Diferenças",
+            ]
             lines = [f"  - {lbl}: {val}" for lbl, val in zip(labels, props)]
         elif file_type == "PDF":
-            pages, author, creator, text_hash, image_count, image_hash, file_hash = (
-                props
-            )
+            pages, author, creator, text_hash, image_count, image_hash = props
             lines = [
                 f"  - Páginas: {pages}",
                 f"  - Autor: {author}",
@@ -375,10 +457,8 @@ class FormCompararArquivos(ThemedDialog):
             ]
             if image_count:
                 lines.append(f"  - Hash Imagens: {self._short_hash(image_hash)}")
-            if file_hash:
-                lines.append(f"  - Hash Binário: {self._short_hash(file_hash)}")
         elif file_type == "DWG":
-            lines = [f"  - Hash SHA256: {self._short_hash(props[0], 32)}"]
+            lines = [f"  - Hash BLAKE2b: {self._short_hash(props[0], 32)}"]
         return header + "\n".join(lines)
 
     @staticmethod
@@ -394,6 +474,7 @@ class FormCompararArquivos(ThemedDialog):
         props: tuple,
         status_msg: str,
         are_equal: Optional[bool],
+        counterpart: Optional[str] = None,
     ):
         """Atualiza a cor e a tooltip de uma linha com base no resultado."""
         status_item = table.item(row, 2)
@@ -402,6 +483,8 @@ class FormCompararArquivos(ThemedDialog):
             return
 
         tooltip = f"Caminho: {file_item.data(Qt.ItemDataRole.UserRole)}"
+        if counterpart:
+            tooltip += f"\nComparado com: {counterpart}"
         tooltip += self._format_properties_tooltip(
             props, self.cmb_file_type.currentText()
         )
@@ -39,7 +39,7 @@ from PySide6.QtWidgets import (
 )
 from shiboken6 import isValid
 
-from src.converters import CONVERSION_HANDLERS, ConversionWorker
+from src.converters import ConversionWorker, get_conversion_handlers
 from src.forms.common import context_help
 from src.forms.common.file_tables import ManagedFileTableWidget
 from src.forms.common.form_manager import BaseSingletonFormManager
@@ -114,6 +114,8 @@ class FormConverterArquivos(ThemedDialog):
         self.btn_limpar: Optional[QPushButton] = None
         self.progress_bar: Optional[QProgressBar] = None
         self.chk_substituir_original: Optional[QCheckBox] = None
+        # As bibliotecas de conversão só são verificadas ao abrir o formulário
+        self._handlers = get_conversion_handlers()
         self._inicializar_ui()
 
     def _inicializar_ui(self):
@@ -149,7 +151,7 @@ class FormConverterArquivos(ThemedDialog):
         label_tipo.setObjectName("label_titulo")
         type_layout.addWidget(label_tipo)
         self.cmb_conversion_type = QComboBox()
-        self.cmb_conversion_type.addItems(CONVERSION_HANDLERS.keys())
+        self.cmb_conversion_type.addItems(self._handlers.keys())
         self.cmb_conversion_type.setToolTip(
             "Selecione o tipo de conversão que deseja executar."
         )
@@ -311,7 +313,7 @@ class FormConverterArquivos(ThemedDialog):
         """Atualiza a UI quando o tipo de conversão é alterado."""
         self._clear_all()
         conv_type = self.cmb_conversion_type.currentText()
-        if handler := CONVERSION_HANDLERS.get(conv_type):
+        if handler := self._handlers.get(conv_type):
             self.tabela_origem.set_allowed_extensions(handler["extensions"])
             self.btn_converter.setToolTip(handler["tooltip"])
             self.btn_converter.setEnabled(handler["enabled"])
@@ -331,9 +333,7 @@ class FormConverterArquivos(ThemedDialog):
 
     def _select_files(self):
         """Abre o diálogo para selecionar arquivos de origem."""
-        if not (
-            handler := CONVERSION_HANDLERS.get(self.cmb_conversion_type.currentText())
-        ):
+        if not (handler := self._handlers.get(self.cmb_conversion_type.currentText())):
             return
         extensions = " ".join(handler["extensions"])
         dialog_filter = f"Arquivos ({extensions});;Todos os arquivos (*)"
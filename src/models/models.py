@@ -13,14 +13,16 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
     create_engine,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, relationship
 
-from src.utils.utilitarios import DB_PATH
+from src.utils.caminhos import DB_PATH
 
 # --- Modelos ORM ---
 
@@ -57,6 +59,8 @@ class Espessura(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     valor = Column(Float, nullable=False)
 
+    __table_args__ = (Index("ix_espessura_valor", "valor"),)
+
 
 class Material(Base):
     """Modelo da tabela de materiais."""
@@ -68,6 +72,12 @@ class Material(Base):
     escoamento = Column(Float)
     elasticidade = Column(Float)
 
+    __table_args__ = (
+        Index("ix_material_nome", "nome"),
+        # Permite que buscas por prefixo (LIKE, sem distinção de caixa) usem índice
+        Index("ix_material_nome_nocase", text("nome COLLATE NOCASE")),
+    )
+
 
 class Canal(Base):
     """Modelo da tabela de canais (ferramentas)."""
@@ -80,6 +90,11 @@ class Canal(Base):
     comprimento_total = Column(Float)
     observacao = Column(String)
 
+    __table_args__ = (
+        Index("ix_canal_valor", "valor"),
+        Index("ix_canal_valor_nocase", text("valor COLLATE NOCASE")),
+    )
+
 
 class Deducao(Base):
     """Modelo da tabela de deduções, relacionando os outros elementos."""
@@ -104,6 +119,29 @@ class Deducao(Base):
             "material_id",
             name="_canal_espessura_material_uc",
         ),
+        Index(
+            "ix_deducao_material_espessura_canal",
+            "material_id",
+            "espessura_id",
+            "canal_id",
+        ),
+        Index("ix_deducao_espessura", "espessura_id"),
+    )
+
+
+class FatorK(Base):
+    """Modelo da tabela de curvas de Fator K (Raio/Espessura) por material."""
+
+    __tablename__ = "fator_k"
+    id = Column(Integer, primary_key=True)
+    material_id = Column(Integer, ForeignKey("material.id"), nullable=False)
+    razao = Column(Float, nullable=False)
+    valor = Column(Float, nullable=False)
+
+    material = relationship("Material")
+
+    __table_args__ = (
+        UniqueConstraint("material_id", "razao", name="_material_razao_uc"),
     )
 
 
@@ -119,6 +157,8 @@ class Log(Base):
     detalhes = Column(String)
     data_hora = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
+    __table_args__ = (Index("ix_log_data_hora", "data_hora"),)
+
 
 class SystemControl(Base):
     """Tabela de controle do sistema para atualizações e sessões ativas."""
@@ -7,14 +7,28 @@ e modo DELETE (padrão) para prevenir criação de arquivos WAL e SHM.
 
 import logging
 import os
+import sqlite3
+import threading
+import time
+import unicodedata
 from contextlib import contextmanager
+from typing import Dict
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import Integer, String, cast, create_engine, delete, event, exists, or_
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import sessionmaker
 
-from src.models.models import Base, Log
-from src.utils.utilitarios import DATABASE_DIR, DB_PATH
+from src.models.models import (
+    Base,
+    Canal,
+    Deducao,
+    Espessura,
+    Log,
+    Material,
+    SystemControl,
+)
+from src.utils.caminhos import CACHE_DIR, DATABASE_DIR, DB_PATH
+from src.utils.migracoes import executar_migracoes
 
 # Garante a existência do diretório de banco compartilhado
 os.makedirs(DATABASE_DIR, exist_ok=True)
@@ -66,6 +80,8 @@ def get_session():
     try:
         yield session
         session.commit()
+        # Garante que a próxima leitura pela réplica veja esta transação
+        replica.marcar_alterado()
     except (IntegrityError, OperationalError) as e:
         session.rollback()
         logging.error("Erro de banco de dados, rollback executado: %s", e)
@@ -80,11 +96,229 @@ def get_session():
         session.close()
 
 
+# --- Réplica local de leitura ---
+
+# Cópia local do banco compartilhado; as leituras são servidas a partir dela
+REPLICA_PATH = os.path.join(CACHE_DIR, "replica", "tabela_de_dobra.db")
+
+# Permite desativar a réplica (ex.: depuração) definindo a variável como "0"
+REPLICA_ATIVA = os.environ.get("CALCULADORA_DOBRA_REPLICA", "1") != "0"
+
+# Intervalo mínimo (s) entre verificações do contador de alterações do mestre
+INTERVALO_VERIFICACAO_REPLICA = 1.0
+
+# Posição do "file change counter" no cabeçalho de um arquivo SQLite
+_OFFSET_CONTADOR_ALTERACOES = 24
+
+
+def _ler_contador_alteracoes(caminho: str):
+    """Lê o contador de alterações do cabeçalho de um arquivo SQLite.
+
+    O SQLite incrementa esse contador a cada transação de escrita no modo de
+    jornal DELETE, então basta ler os primeiros bytes do arquivo para saber se
+    o banco mudou.
+    """
+    try:
+        with open(caminho, "rb") as f:
+            cabecalho = f.read(_OFFSET_CONTADOR_ALTERACOES + 4)
+    except OSError:
+        return None
+    if len(cabecalho) < _OFFSET_CONTADOR_ALTERACOES + 4:
+        return None
+    return int.from_bytes(cabecalho[_OFFSET_CONTADOR_ALTERACOES:], "big")
+
+
+class ReplicaLeitura:
+    """Mantém uma cópia local do banco compartilhado para consultas de leitura."""
+
+    def __init__(self, caminho_mestre: str, caminho_replica: str):
+        """Prepara a réplica; a cópia só é feita na primeira leitura."""
+        self.caminho_mestre = caminho_mestre
+        self.caminho_replica = caminho_replica
+        self._lock = threading.Lock()
+        self._contador = None
+        self._ultima_verificacao = 0.0
+        self._engine = None
+        self._session_factory = None
+
+    def _criar_engine(self):
+        """Cria o engine somente leitura da réplica."""
+        replica_engine = create_engine(
+            f"sqlite:///{self.caminho_replica}",
+            connect_args={"timeout": SQLALCHEMY_TIMEOUT},
+        )
+
+        @event.listens_for(replica_engine, "connect")
+        def _somente_leitura(dbapi_connection, _connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("PRAGMA query_only=ON;")
+            finally:
+                cursor.close()
+
+        self._engine = replica_engine
+        self._session_factory = sessionmaker(bind=replica_engine)
+
+    def _copiar_mestre(self, contador):
+        """Copia o banco mestre para a réplica usando a API de backup do SQLite."""
+        os.makedirs(os.path.dirname(self.caminho_replica), exist_ok=True)
+        origem = sqlite3.connect(self.caminho_mestre, timeout=SQLALCHEMY_TIMEOUT)
+        try:
+            destino = sqlite3.connect(self.caminho_replica, timeout=SQLALCHEMY_TIMEOUT)
+            try:
+                origem.backup(destino)
+            finally:
+                destino.close()
+        finally:
+            origem.close()
+        with open(self.caminho_contador, "w", encoding="utf-8") as arquivo:
+            arquivo.write(str(contador))
+        self._contador = contador
+        logging.info("Réplica local atualizada (contador %s).", contador)
+
+    @property
+    def caminho_contador(self) -> str:
+        """Arquivo com o contador do mestre no momento da última cópia.
+
+        O cabeçalho da própria réplica tem um contador independente do mestre,
+        que não serve para saber se ela está atualizada.
+        """
+        return self.caminho_replica + ".contador"
+
+    def _ler_contador_copiado(self):
+        """Retorna o contador do mestre gravado na última cópia, se houver."""
+        if not os.path.exists(self.caminho_replica):
+            return None
+        try:
+            with open(self.caminho_contador, encoding="utf-8") as arquivo:
+                return int(arquivo.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def marcar_alterado(self):
+        """Força a verificação do mestre na próxima leitura (após uma escrita)."""
+        self._ultima_verificacao = 0.0
+
+    def sincronizar(self) -> bool:
+        """Atualiza a réplica se o mestre mudou.
+
+        Returns:
+            bool: True se a réplica está pronta para leitura.
+        """
+        with self._lock:
+            agora = time.monotonic()
+            if (
+                self._session_factory is not None
+                and agora - self._ultima_verificacao < INTERVALO_VERIFICACAO_REPLICA
+            ):
+                return True
+            self._ultima_verificacao = agora
+
+            contador = _ler_contador_alteracoes(self.caminho_mestre)
+            if contador is None:
+                return False
+            if self._contador is None:
+                self._contador = self._ler_contador_copiado()
+            try:
+                if contador != self._contador:
+                    self._copiar_mestre(contador)
+            except (sqlite3.Error, OSError) as e:
+                logging.warning("Falha ao atualizar réplica local: %s", e)
+                self._contador = None
+                return False
+            if self._session_factory is None:
+                self._criar_engine()
+            return True
+
+    def criar_sessao(self):
+        """Cria uma sessão ligada à réplica."""
+        return self._session_factory()
+
+
+replica = ReplicaLeitura(DB_PATH, REPLICA_PATH)
+
+
+@contextmanager
+def get_read_session():
+    """Fornece uma sessão somente leitura, servida pela réplica local.
+
+    Consultas que não alteram dados devem usar esta sessão: evitam idas e
+    vindas pela rede e não mantêm bloqueios compartilhados no banco mestre.
+    Quando a réplica está desativada ou não pôde ser atualizada, recorre a
+    ``get_session``.
+
+    Uso:
+        with get_read_session() as session:
+            materiais = session.query(Material).all()
+    """
+    if not (REPLICA_ATIVA and replica.sincronizar()):
+        with get_session() as session:
+            yield session
+        return
+
+    session = replica.criar_sessao()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+# --- Versões de dados ---
+
+# Prefixo das chaves em system_control com o contador de escritas por tabela
+VERSAO_DADOS_PREFIXO = "DATA_VERSION_"
+
+# Carimbo das versões de dados na última verificação de deduções órfãs
+CHAVE_ORFAOS_VERIFICADOS = "ORFAOS_VERIFICADOS"
+
+TABELAS_DEDUCAO = ("material", "espessura", "canal", "deducao")
+
+
+def _normalizar_tabela(tabela: str) -> str:
+    """Normaliza o nome da tabela (ex.: 'dedução' -> 'deducao')."""
+    return (
+        unicodedata.normalize("NFKD", str(tabela))
+        .encode("ascii", "ignore")
+        .decode("ascii")
+        .lower()
+    )
+
+
+def incrementar_versao_dados(session, tabela: str):
+    """Incrementa, na mesma transação, o contador de escritas da tabela."""
+    chave = VERSAO_DADOS_PREFIXO + _normalizar_tabela(tabela)
+    atualizadas = (
+        session.query(SystemControl)
+        .filter(SystemControl.key == chave)
+        .update(
+            {SystemControl.value: cast(cast(SystemControl.value, Integer) + 1, String)},
+            synchronize_session=False,
+        )
+    )
+    if not atualizadas:
+        session.add(SystemControl(type="DATA_VERSION", key=chave, value="1"))
+
+
+def obter_versoes_dados(session) -> Dict[str, int]:
+    """Retorna o contador de escritas de cada tabela ({tabela: versão})."""
+    linhas = session.query(SystemControl.key, SystemControl.value).filter(
+        SystemControl.key.like(f"{VERSAO_DADOS_PREFIXO}%")
+    )
+    versoes = {}
+    for chave, valor in linhas:
+        try:
+            versoes[chave[len(VERSAO_DADOS_PREFIXO) :]] = int(valor)
+        except (TypeError, ValueError):
+            continue
+    return versoes
+
+
 # pylint: disable=R0913,R0917
 
 
 def registrar_log(session, usuario_nome, acao, tabela, registro_id, detalhes=None):
-    """Registra uma ação no log do sistema."""
+    """Registra uma ação no log do sistema e incrementa a versão da tabela."""
     try:
         log = Log(
             usuario_nome=usuario_nome,
@@ -94,15 +328,17 @@ def registrar_log(session, usuario_nome, acao, tabela, registro_id, detalhes=Non
             detalhes=detalhes,
         )
         session.add(log)
+        incrementar_versao_dados(session, tabela)
     except (IntegrityError, OperationalError) as e:
         logging.error("Erro ao criar log: %s", e)
 
 
 def inicializar_banco_dados():
-    """Cria todas as tabelas no banco de dados."""
+    """Cria as tabelas e aplica as migrações pendentes do esquema."""
     try:
         logging.info("Inicializando banco de dados...")
         Base.metadata.create_all(engine)
+        executar_migracoes(engine)
         # Limpar deduções órfãs após inicialização
         limpar_deducoes_orfas()
         logging.info("Banco de dados inicializado com sucesso")
@@ -111,33 +347,53 @@ def inicializar_banco_dados():
         raise
 
 
-def limpar_deducoes_orfas():
-    """Remove deduções órfãs (sem relacionamentos válidos) do banco de dados."""
-    try:
-        from src.models.models import Deducao  # pylint: disable=import-outside-toplevel
+def limpar_deducoes_orfas(forcar: bool = False):
+    """Remove deduções órfãs (sem relacionamentos válidos) do banco de dados.
 
+    A remoção é feita com um único ``DELETE ... WHERE NOT EXISTS`` e só é
+    executada quando houve escritas em materiais, espessuras, canais ou
+    deduções desde a última verificação (ou quando ``forcar`` é True).
+    """
+    try:
         with get_session() as session:
-            deducoes = session.query(Deducao).all()
-            orfaos_removidos = 0
-
-            for d in deducoes:
-                if not d.material or not d.espessura or not d.canal:
-                    logging.warning(
-                        "Removendo dedução órfã ID %s: material_id=%s, espessura_id=%s, canal_id=%s",  # pylint: disable=line-too-long
-                        d.id,
-                        d.material_id,
-                        d.espessura_id,
-                        d.canal_id,
+            versoes = obter_versoes_dados(session)
+            carimbo = ":".join(str(versoes.get(t, 0)) for t in TABELAS_DEDUCAO)
+            controle = (
+                session.query(SystemControl)
+                .filter_by(key=CHAVE_ORFAOS_VERIFICADOS)
+                .first()
+            )
+            if controle and controle.value == carimbo and not forcar:
+                logging.debug("Sem escritas desde a última verificação de órfãs.")
+                return
+
+            resultado = session.execute(
+                delete(Deducao)
+                .where(
+                    or_(
+                        ~exists().where(Material.id == Deducao.material_id),
+                        ~exists().where(Espessura.id == Deducao.espessura_id),
+                        ~exists().where(Canal.id == Deducao.canal_id),
                     )
-                    session.delete(d)
-                    orfaos_removidos += 1
-
-            if orfaos_removidos > 0:
-                session.commit()
-                logging.info(
-                    "Foram removidas %s deduções órfãs do banco de dados",
-                    orfaos_removidos,
                 )
+                .execution_options(synchronize_session=False)
+            )
+            orfaos_removidos = resultado.rowcount or 0
+
+            if controle:
+                controle.value = carimbo
+            else:
+                session.add(
+                    SystemControl(
+                        type="CONFIG", key=CHAVE_ORFAOS_VERIFICADOS, value=carimbo
+                    )
+                )
+
+        if orfaos_removidos > 0:
+            logging.info(
+                "Foram removidas %s deduções órfãs do banco de dados",
+                orfaos_removidos,
+            )
 
     except (IntegrityError, OperationalError) as e:
         logging.error("Erro ao limpar deduções órfãs: %s", e)
@@ -0,0 +1,167 @@
+"""Cache persistente das impressões digitais dos arquivos comparados.
+
+Guarda, para cada arquivo, o hash e as propriedades extraídas na última
+comparação, indexados pelo caminho absoluto e validados pelo tamanho e pela
+data de modificação (``st_mtime_ns``): qualquer alteração no arquivo invalida a
+entrada. O tamanho do cache é limitado descartando as entradas usadas há mais
+tempo (LRU). Assim, comparar de novo uma pasta inalterada não relê os arquivos.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.utils.caminhos import CACHE_DIR
+
+# (caminho absoluto, tamanho, st_mtime_ns) que identifica o conteúdo do arquivo
+ChaveArquivo = Tuple[str, int, int]
+
+# Quantidade máxima de arquivos lembrados
+MAX_ENTRADAS = 20000
+
+# Incrementar quando o formato das propriedades extraídas ou o hash mudar
+VERSAO_EXTRATORES = 3
+
+# Incrementar quando as colunas da tabela mudarem (o cache é recriado)
+VERSAO_ESQUEMA = 2
+
+CAMINHO_PADRAO = Path(CACHE_DIR) / "comparacao_cache.db"
+
+
+def chave_arquivo(path: str) -> Optional[ChaveArquivo]:
+    """Retorna a chave atual do arquivo, ou None se ele não puder ser lido."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    caminho = os.path.normcase(os.path.abspath(path))
+    return caminho, stat.st_size, stat.st_mtime_ns
+
+
+class CacheImpressoes:
+    """Tabela SQLite local com o hash e as propriedades de cada arquivo.
+
+    Cada impressão é um dicionário com ``chave`` (``ChaveArquivo``),
+    ``hash``, ``props`` e ``tipo`` (tipo de arquivo das propriedades); os
+    dois últimos podem ser None quando só o hash foi calculado.
+    """
+
+    def __init__(
+        self, caminho: Path = CAMINHO_PADRAO, max_entradas: int = MAX_ENTRADAS
+    ):
+        """Abre (ou cria) o arquivo de cache no caminho indicado."""
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entradas = max_entradas
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.caminho), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        (versao_esquema,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if versao_esquema != VERSAO_ESQUEMA:
+            self._conn.execute("DROP TABLE IF EXISTS impressoes")
+            self._conn.execute(f"PRAGMA user_version = {VERSAO_ESQUEMA}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS impressoes ("
+            "caminho TEXT PRIMARY KEY, tamanho INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, versao INTEGER NOT NULL, hash TEXT, "
+            "tipo TEXT, props BLOB, acesso REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_impressoes_acesso ON impressoes (acesso)"
+        )
+        self._conn.commit()
+
+    def obter_muitas(self, paths: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Retorna as impressões ainda válidas dos arquivos informados.
+
+        Arquivos alterados desde a gravação (ou ausentes do cache) não aparecem
+        no resultado. As entradas encontradas têm o último acesso atualizado.
+        """
+        chaves = {path: chave_arquivo(path) for path in paths}
+        encontradas: Dict[str, Dict[str, Any]] = {}
+        try:
+            with self._lock, self._conn:
+                for path, chave in chaves.items():
+                    if chave is None:
+                        continue
+                    linha = self._conn.execute(
+                        "SELECT tamanho, mtime_ns, versao, hash, tipo, props "
+                        "FROM impressoes WHERE caminho = ?",
+                        (chave[0],),
+                    ).fetchone()
+                    if linha is None or tuple(linha[:3]) != (
+                        chave[1],
+                        chave[2],
+                        VERSAO_EXTRATORES,
+                    ):
+                        continue
+                    self._conn.execute(
+                        "UPDATE impressoes SET acesso = ? WHERE caminho = ?",
+                        (time.time(), chave[0]),
+                    )
+                    encontradas[path] = {
+                        "chave": chave,
+                        "hash": linha[3],
+                        "tipo": linha[4],
+                        "props": tuple(json.loads(linha[5])) if linha[5] else None,
+                    }
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning("Erro ao ler o cache de comparação: %s", e)
+        return encontradas
+
+    def gravar_muitas(self, impressoes: Iterable[Dict[str, Any]]):
+        """Grava (ou substitui) as impressões e descarta as menos usadas."""
+        agora = time.time()
+        linhas = [
+            (
+                *impressao["chave"],
+                VERSAO_EXTRATORES,
+                impressao.get("hash"),
+                impressao.get("tipo"),
+                self._codificar(impressao.get("props")),
+                agora,
+            )
+            for impressao in impressoes
+            if impressao.get("chave")
+        ]
+        if not linhas:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO impressoes (caminho, tamanho, mtime_ns, "
+                    "versao, hash, tipo, props, acesso) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    linhas,
+                )
+                self._conn.execute(
+                    "DELETE FROM impressoes WHERE caminho NOT IN ("
+                    "SELECT caminho FROM impressoes ORDER BY acesso DESC LIMIT ?)",
+                    (self.max_entradas,),
+                )
+        except sqlite3.Error as e:
+            logging.warning("Erro ao gravar o cache de comparação: %s", e)
+
+    @staticmethod
+    def _codificar(props: Optional[tuple]) -> Optional[bytes]:
+        """Serializa as propriedades em JSON compacto (UTF-8)."""
+        if props is None:
+            return None
+        texto = json.dumps(list(props), ensure_ascii=False, separators=(",", ":"))
+        return texto.encode("utf-8")
+
+    def clear(self):
+        """Remove todas as entradas."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM impressoes")
+
+    def close(self):
+        """Fecha a conexão com o arquivo de cache."""
+        with self._lock:
+            self._conn.close()
@@ -1,22 +1,51 @@
 """Gerenciador de cache para dados do banco.
 
 Mantém dados em memória para acesso quando o banco está bloqueado.
+
+A validade das entradas segue os contadores de versão de dados por tabela
+(``DATA_VERSION_*`` em ``system_control``): enquanto a versão de uma tabela
+não muda, suas entradas não expiram. Escritas locais avisam as demais
+instâncias pelo arquivo de sinal ``ipc_manager.DADOS_SIGNAL_FILE``. O TTL só é
+usado quando as versões não puderam ser lidas.
+
+Entradas expiradas ou obsoletas (alteradas por outra instância) continuam
+sendo servidas imediatamente enquanto uma única thread de fundo as atualiza
+(stale-while-revalidate); a thread da interface só consulta o banco quando não
+há nenhum dado em cache para a chave.
 """
 
-import json
 import logging
-import os
-import tempfile
+import sqlite3
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, Set, cast
 
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.models.models import Canal, Deducao, Espessura, Material
-from src.utils.banco_dados import get_session
-from src.utils.utilitarios import CACHE_DIR
+from src.utils import ipc_manager
+from src.utils.banco_dados import get_read_session, obter_versoes_dados, replica
+from src.utils.cache_store import CacheStore
+from src.utils.caminhos import CACHE_DIR
+from src.utils.deducao_index import deducao_index
+
+# Prefixos de cache afetados por escritas em cada tabela (exclusões em
+# materiais/espessuras/canais também removem as deduções relacionadas)
+CHAVES_POR_TABELA: Dict[str, List[str]] = {
+    "material": ["materiais", "deducoes"],
+    "espessura": ["espessuras", "deducoes"],
+    "canal": ["canais", "deducoes"],
+    "deducao": ["deducoes"],
+}
+
+# Chaves de coalescência das tarefas em segundo plano que não são entradas
+_CHAVE_INDICE_DEDUCOES = "__indice_deducoes__"
+_CHAVE_VERSOES = "__versoes__"
+
+# Metadado do armazenamento com as versões refletidas pelo cache persistido
+META_VERSOES = "versoes_dados"
 
 
 class CacheManager:  # pylint: disable=too-many-instance-attributes
@@ -28,8 +57,22 @@ class CacheManager:  # pylint: disable=too-many-instance-attributes
         self._cache_timestamps: Dict[str, datetime] = {}
         self._lock = threading.RLock()
         self._initialized = False
-        self._dirty = False  # Flag para controle de persistência
+        self._dirty_keys: Set[str] = set()  # Chaves alteradas desde a última gravação
+        self._loaded_keys: Set[str] = set()  # Chaves já consultadas no disco
         self._last_save: datetime = datetime.min  # controle de frequência de gravação
+        # Versões de dados refletidas pelo cache (None = desconhecidas, usa TTL)
+        self._versoes: Optional[Dict[str, int]] = None
+        # Chaves alteradas por outra instância, servidas até serem atualizadas
+        self._stale_keys: Set[str] = set()
+        # Atualização em segundo plano: uma única thread, sem chaves repetidas
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="cache_refresh"
+        )
+        self._pending_refresh: Set[str] = set()
+        # Incrementada a cada invalidação; descarta atualizações iniciadas antes
+        self._generation = 0
+        # Chamadas quando os materiais mudam (ex.: curvas de Fator K compiladas)
+        self._ao_invalidar_materiais: List[Callable[[], None]] = []
 
         # Configurações simplificadas de TTL por tipo de dado
         self._cache_ttl = {
@@ -39,130 +82,164 @@ class CacheManager:  # pylint: disable=too-many-instance-attributes
             "deducoes": 5,  # 5 minutos para dados dinâmicos
         }
 
-        # Arquivo para persistir cache entre sessões
-        self.cache_file = Path(CACHE_DIR) / "database_cache.json"
+        # Arquivo para persistir cache entre sessões (SQLite chave/valor)
+        self.cache_file = Path(CACHE_DIR) / "database_cache.db"
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Carrega cache persistido
-        self._load_persistent_cache()
+        self._store: Optional[CacheStore] = None
+        self._open_persistent_cache()
 
         # Configurar logger do cache
         self.cache_logger = logging.getLogger("cache_manager")
 
-    def _load_persistent_cache(self):
-        """Carrega cache persistido do disco."""
+    def _open_persistent_cache(self):
+        """Abre o armazenamento persistido; as entradas são lidas sob demanda."""
         try:
-            if self.cache_file.exists():
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    cache_data = json.load(f)
-
-                # Reconstitui timestamps
-                for key, timestamp_str in cache_data.get("timestamps", {}).items():
-                    self._cache_timestamps[key] = datetime.fromisoformat(timestamp_str)
-
-                # Carrega dados do cache
-                self._cache = cache_data.get("data", {})
-
-                logging.info(
-                    "Cache persistido carregado: %d entradas", len(self._cache)
-                )
-
-        except (OSError, json.JSONDecodeError, ValueError, KeyError) as e:
-            logging.warning("Erro ao carregar cache persistido: %s", e)
-            self._cache = {}
-            self._cache_timestamps = {}
+            self._store = CacheStore(self.cache_file)
+            # Remove o antigo cache em JSON, substituído pelo armazenamento SQLite
+            self.cache_file.with_suffix(".json").unlink(missing_ok=True)
+        except (OSError, sqlite3.Error) as e:
+            logging.warning("Erro ao abrir cache persistido: %s", e)
+            self._store = None
+
+    def _load_persistent_entry(self, key: str):
+        """Carrega uma entrada do disco para a memória, se ainda não consultada."""
+        if key in self._loaded_keys or key in self._cache or self._store is None:
+            return
+        self._loaded_keys.add(key)
+        entrada = self._store.get(key)
+        if entrada is not None:
+            self._cache[key], self._cache_timestamps[key] = entrada
 
     def _save_persistent_cache(self, force=False):
-        """Salva cache no disco para persistência (escrita atômica + throttling)."""
+        """Grava no disco apenas as chaves alteradas (com throttling)."""
         # Throttling: evita gravar muitas vezes em curto intervalo
-        if not force:
-            if not self._dirty:
-                return
-            if datetime.now() - self._last_save < timedelta(seconds=2):
-                return
-
-        try:
-            cache_data = {
-                "data": self._cache,
-                "timestamps": {
-                    key: timestamp.isoformat()
-                    for key, timestamp in self._cache_timestamps.items()
-                },
-                "saved_at": datetime.now().isoformat(),
-            }
-
-            # Escrita atômica: grava em arquivo temporário e substitui
-            tmp_dir = self.cache_file.parent
-            tmp_dir.mkdir(parents=True, exist_ok=True)
-            with tempfile.NamedTemporaryFile(
-                "w", delete=False, dir=tmp_dir, encoding="utf-8"
-            ) as tf:
-                json.dump(cache_data, tf, indent=2, ensure_ascii=False)
-                tmp_path = tf.name
+        if not self._dirty_keys or self._store is None:
+            return
+        if not force and datetime.now() - self._last_save < timedelta(seconds=2):
+            return
 
-            os.replace(tmp_path, self.cache_file)
+        with self._lock:
+            entradas = [
+                (key, self._cache[key], self._cache_timestamps[key])
+                for key in self._dirty_keys
+                if key in self._cache and key in self._cache_timestamps
+            ]
+            self._dirty_keys = set()
 
-            self._dirty = False
+        try:
+            self._store.put_many(entradas)
             self._last_save = datetime.now()
-
-        except (OSError, json.JSONDecodeError, ValueError) as e:
+        except (sqlite3.Error, TypeError, ValueError) as e:
             logging.error("Erro ao salvar cache persistido: %s", e)
 
     def _is_cache_valid(self, key: str) -> bool:
-        """Verifica se o cache ainda é válido baseado no TTL."""
-        if key not in self._cache_timestamps:
+        """Verifica se o cache ainda é válido (não obsoleto e dentro do TTL)."""
+        if key in self._stale_keys:
+            return False
+        return self._is_timestamp_valid(key, self._cache_timestamps)
+
+    def _is_timestamp_valid(self, key: str, timestamps: Dict[str, datetime]) -> bool:
+        """Verifica a validade da chave a partir do dicionário de timestamps dado.
+
+        Com as versões de dados conhecidas, a entrada vale até que a versão da
+        tabela mude (a invalidação é feita por ``sincronizar_versoes``).
+        """
+        if key not in timestamps:
             return False
+        if self._versoes is not None:
+            return True
 
         # Determina TTL baseado no tipo de dado
         cache_type = key.split("_")[0]  # ex: 'materiais' de 'materiais_list'
         ttl_minutes = self._cache_ttl.get(cache_type, 5)  # Default 5 minutos
         ttl = timedelta(minutes=ttl_minutes)
 
-        return datetime.now() - self._cache_timestamps[key] < ttl
+        return datetime.now() - timestamps[key] < ttl
 
     def _update_cache_timestamp(self, key: str):
         """Atualiza o timestamp do cache."""
         self._cache_timestamps[key] = datetime.now()
-        self._dirty = True  # Marca cache como modificado
+        self._dirty_keys.add(key)  # Marca a chave como modificada
 
     def _get_cached_data(
         self, cache_key: str, query_func, result_processor=None
     ) -> Any:
-        """Método genérico para buscar dados com cache."""
+        """Método genérico para buscar dados com cache.
+
+        Uma entrada expirada é retornada imediatamente e atualizada em segundo
+        plano; só há consulta síncrona quando a chave não tem dado algum.
+        """
         with self._lock:
+            self._load_persistent_entry(cache_key)
             if self._is_cache_valid(cache_key):
                 self.cache_logger.debug("Usando dados do cache: %s", cache_key)
                 return self._cache[cache_key]
 
-            try:
-                with get_session() as session:
-                    data = query_func(session)
-
-                    if result_processor:
-                        result = result_processor(data)
-                    else:
-                        result = data
+            if cache_key in self._cache:
+                self._schedule_refresh(
+                    cache_key,
+                    lambda: self._refresh_entry(
+                        cache_key, query_func, result_processor
+                    ),
+                )
+                self.cache_logger.debug("Usando dados expirados: %s", cache_key)
+                return self._cache[cache_key]
 
-                    self._cache[cache_key] = result
-                    self._update_cache_timestamp(cache_key)
+        return self._refresh_entry(cache_key, query_func, result_processor)
 
-                    # Salvar cache apenas se necessário
-                    if self._dirty:
-                        self._save_persistent_cache()
+    def _refresh_entry(self, cache_key: str, query_func, result_processor=None):
+        """Consulta o banco (sem manter o lock) e atualiza a entrada do cache."""
+        with self._lock:
+            generation = self._generation
 
-                    self.cache_logger.info("Cache atualizado: %s", cache_key)
-                    return result
+        try:
+            with get_read_session() as session:
+                data = query_func(session)
+                result = result_processor(data) if result_processor else data
 
-            except SQLAlchemyError as e:
-                self.cache_logger.warning("Banco bloqueado, usando cache: %s", e)
+        except SQLAlchemyError as e:
+            self.cache_logger.warning("Banco bloqueado, usando cache: %s", e)
+            with self._lock:
                 cached_data = self._cache.get(
                     cache_key, [] if "list" in cache_key else None
                 )
 
-                if not cached_data and "list" in cache_key:
-                    self.cache_logger.error("Nenhum dado em cache para: %s", cache_key)
+            if not cached_data and "list" in cache_key:
+                self.cache_logger.error("Nenhum dado em cache para: %s", cache_key)
 
-                return cached_data
+            return cached_data
+
+        with self._lock:
+            # Uma invalidação durante a consulta torna o resultado suspeito:
+            # ele é retornado, mas não substitui o estado do cache
+            if generation == self._generation:
+                self._cache[cache_key] = result
+                self._stale_keys.discard(cache_key)
+                self._update_cache_timestamp(cache_key)
+
+        # Salvar cache apenas se necessário
+        self._save_persistent_cache()
+
+        self.cache_logger.info("Cache atualizado: %s", cache_key)
+        return result
+
+    def _schedule_refresh(self, key: str, func: Callable[[], Any]):
+        """Agenda ``func`` na thread de fundo, uma única vez por chave."""
+        with self._lock:
+            if key in self._pending_refresh:
+                return
+            self._pending_refresh.add(key)
+        self._executor.submit(self._run_refresh, key, func)
+
+    def _run_refresh(self, key: str, func: Callable[[], Any]):
+        """Executa uma atualização agendada e libera a chave para novo agendamento."""
+        try:
+            func()
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.cache_logger.exception("Erro na atualização em segundo plano: %s", key)
+        finally:
+            with self._lock:
+                self._pending_refresh.discard(key)
 
     def get_materiais(self) -> List[Dict]:
         """Retorna lista de materiais do cache ou banco."""
@@ -212,7 +289,24 @@ class CacheManager:  # pylint: disable=too-many-instance-attributes
     def get_deducao(
         self, material_nome: str, espessura_valor: float, canal_valor: str
     ) -> Optional[Dict]:
-        """Busca dedução específica do cache ou banco."""
+        """Busca dedução específica no índice em memória, cache ou banco.
+
+        O índice de deduções resolve a busca sem acessar o banco; o cache por
+        chave só é usado quando o índice não pôde ser carregado (banco
+        bloqueado ou inacessível).
+        """
+        if deducao_index.ensure_loaded():
+            entrada = deducao_index.get_deducao(
+                material_nome, espessura_valor, canal_valor
+            )
+            if entrada is None:
+                return None
+            return {
+                "valor": entrada["valor"],
+                "observacao": entrada["observacao"],
+                "forca": entrada["forca"],
+            }
+
         # Padroniza prefixo no plural para alinhar com TTL/invalidade
         cache_key = f"deducoes_{material_nome}_{espessura_valor}_{canal_valor}"
 
@@ -244,16 +338,68 @@ class CacheManager:  # pylint: disable=too-many-instance-attributes
             self._get_cached_data(cache_key, query_deducao, process_deducao),
         )
 
+    def get_espessuras_material(self, material_nome: str) -> Optional[List[float]]:
+        """Espessuras com dedução para o material, em ordem crescente.
+
+        Servido pelo índice de deduções, sem consulta ao banco. Retorna None
+        quando o índice não pôde ser carregado.
+        """
+        return deducao_index.get_espessuras_material(material_nome)
+
+    def get_canais_material_espessura(
+        self, material_nome: str, espessura_valor: float
+    ) -> Optional[List[str]]:
+        """Canais com dedução para o material e a espessura, em ordem.
+
+        Servido pelo índice de deduções, sem consulta ao banco. Retorna None
+        quando o índice não pôde ser carregado.
+        """
+        return deducao_index.get_canais_material_espessura(
+            material_nome, espessura_valor
+        )
+
+    @staticmethod
+    def _expand_patterns(keys: List[str]) -> Set[str]:
+        """Expande padrões de chave para lidar com singular/plural."""
+        expanded = set(keys)
+        if any(k.startswith("deducao") or k.startswith("deducoes") for k in keys):
+            expanded.update({"deducao", "deducao_", "deducoes", "deducoes_"})
+        return expanded
+
+    def registrar_invalidacao_materiais(self, callback: Callable[[], None]):
+        """Registra uma função chamada quando o cache de materiais é invalidado.
+
+        Permite que módulos que usam este cache (como ``calculos``) descartem
+        dados derivados dos materiais sem que este módulo os importe.
+        """
+        with self._lock:
+            if callback not in self._ao_invalidar_materiais:
+                self._ao_invalidar_materiais.append(callback)
+
+    def _notificar_materiais(self):
+        """Chama as funções registradas; deve ser usada fora de ``self._lock``.
+
+        Os callbacks obtêm os seus próprios locks, e chamá-los com o lock do
+        cache adquirido inverteria a ordem usada por quem os registra.
+        """
+        with self._lock:
+            callbacks = list(self._ao_invalidar_materiais)
+        for callback in callbacks:
+            callback()
+
     def invalidate_cache(self, keys: Optional[List[str]] = None):
         """Invalida cache específico ou todo o cache."""
+        notificar = not keys or any(k.startswith("materiais") for k in keys)
         with self._lock:
+            self._generation += 1
+            if not keys or any(
+                k.startswith(("materiais", "espessuras", "canais", "deduc"))
+                for k in keys
+            ):
+                deducao_index.invalidate()
+
             if keys:
-                # Expande padrões para lidar com singular/plural
-                expanded = set(keys)
-                if any(
-                    k.startswith("deducao") or k.startswith("deducoes") for k in keys
-                ):
-                    expanded.update({"deducao", "deducao_", "deducoes", "deducoes_"})
+                expanded = self._expand_patterns(keys)
 
                 keys_to_remove = [
                     cache_key
@@ -264,6 +410,11 @@ class CacheManager:  # pylint: disable=too-many-instance-attributes
                 for cache_key in keys_to_remove:
                     self._cache.pop(cache_key, None)
                     self._cache_timestamps.pop(cache_key, None)
+                    self._dirty_keys.discard(cache_key)
+                    self._stale_keys.discard(cache_key)
+
+                if self._store is not None:
+                    self._store.delete_prefixes(expanded)
 
                 self.cache_logger.info(
                     "Cache invalidado para padrões: %s", list(expanded)
@@ -271,19 +422,119 @@ class CacheManager:  # pylint: disable=too-many-instance-attributes
             else:
                 self._cache.clear()
                 self._cache_timestamps.clear()
+                self._dirty_keys.clear()
+                self._stale_keys.clear()
+                if self._store is not None:
+                    self._store.clear()
                 self.cache_logger.info("Todo o cache foi invalidado")
+        if notificar:
+            self._notificar_materiais()
 
-            self._dirty = True
-            self._save_persistent_cache(force=True)
+    def _mark_stale(self, keys: List[str]):
+        """Marca entradas como obsoletas sem removê-las da memória.
+
+        Elas continuam sendo servidas até a atualização em segundo plano; o
+        índice de deduções também é reconstruído em segundo plano, mantendo o
+        índice anterior disponível até a troca. Quem chama notifica, depois de
+        liberar o lock, os dependentes do cache de materiais.
+        """
+        with self._lock:
+            self._generation += 1
+
+            expanded = self._expand_patterns(keys)
+            stale = [
+                cache_key
+                for cache_key in self._cache
+                if any(cache_key.startswith(pattern) for pattern in expanded)
+            ]
+            self._stale_keys.update(stale)
+            self._dirty_keys.difference_update(stale)
+
+            # O disco não guarda entradas obsoletas: as versões gravadas no
+            # metadado passam a valer para tudo o que resta no armazenamento
+            if self._store is not None:
+                self._store.delete_prefixes(expanded)
+
+        if deducao_index.loaded:
+            self._schedule_refresh(_CHAVE_INDICE_DEDUCOES, deducao_index.load)
+        else:
+            deducao_index.invalidate()
+
+        self.cache_logger.info("Cache marcado como obsoleto: %s", sorted(expanded))
+
+    def sincronizar_versoes(self) -> List[str]:
+        """Compara as versões de dados do banco com as refletidas pelo cache.
+
+        Apenas as entradas das tabelas cuja versão mudou são marcadas como
+        obsoletas (e atualizadas em segundo plano quando forem lidas).
+
+        Returns:
+            List[str]: Tabelas alteradas desde a última sincronização.
+        """
+        try:
+            # Um sinal indica escrita recente: força a réplica a verificar o mestre
+            replica.marcar_alterado()
+            with get_read_session() as session:
+                versoes = obter_versoes_dados(session)
+        except SQLAlchemyError as e:
+            self.cache_logger.warning("Não foi possível ler versões de dados: %s", e)
+            with self._lock:
+                self._versoes = None
+            return []
+
+        with self._lock:
+            anteriores = self._versoes
+            if anteriores is None and self._store is not None:
+                anteriores = self._store.get_meta(META_VERSOES)
+
+            if anteriores is None:
+                # Sem referência: o cache persistido não é confiável
+                alteradas = list(CHAVES_POR_TABELA)
+            else:
+                alteradas = [
+                    tabela
+                    for tabela in CHAVES_POR_TABELA
+                    if versoes.get(tabela, 0) != anteriores.get(tabela, 0)
+                ]
+
+            chaves = sorted(
+                {c for tabela in alteradas for c in CHAVES_POR_TABELA[tabela]}
+            )
+            if chaves:
+                self._mark_stale(chaves)
+
+            self._versoes = versoes
+            if self._store is not None and versoes != anteriores:
+                self._store.set_meta(META_VERSOES, versoes)
+
+        if any(c.startswith("materiais") for c in chaves):
+            self._notificar_materiais()
+        if alteradas:
+            self.cache_logger.info("Tabelas alteradas: %s", alteradas)
+        return alteradas
+
+    def agendar_sincronizacao_versoes(self):
+        """Executa ``sincronizar_versoes`` na thread de fundo do cache."""
+        self._schedule_refresh(_CHAVE_VERSOES, self.sincronizar_versoes)
+
+    def notificar_alteracao(self, keys: List[str]):
+        """Invalida o cache local após uma escrita e avisa as demais instâncias."""
+        self.invalidate_cache(keys)
+        self.sincronizar_versoes()
+        ipc_manager.send_update_signal(ipc_manager.DADOS_SIGNAL_FILE)
 
     def preload_cache(self):
         """Pré-carrega dados essenciais no cache."""
         self.cache_logger.info("Pré-carregando cache de dados...")
         try:
+            # Descarta apenas o que mudou no banco desde a última sessão
+            self.sincronizar_versoes()
+
             # Carrega dados estáticos primeiro
             self.get_materiais()
             self.get_espessuras()
             self.get_canais()
+            deducao_index.load()
 
             self._initialized = True
             self.cache_logger.info("Cache pré-carregado com sucesso.")
@@ -293,48 +544,59 @@ class CacheManager:  # pylint: disable=too-many-instance-attributes
             # Mesmo com erro, marca como inicializado para usar cache existente
             self._initialized = True
 
+    def _all_timestamps(self) -> Dict[str, datetime]:
+        """Timestamps das entradas em disco, sobrepostos pelos da memória."""
+        timestamps = self._store.timestamps() if self._store is not None else {}
+        timestamps.update(self._cache_timestamps)
+        return timestamps
+
     def get_cache_status(self) -> Dict[str, Any]:
-        """Retorna status atual do cache."""
+        """Retorna status atual do cache (memória e disco)."""
         with self._lock:
-            total_entries = len(self._cache)
+            timestamps = self._all_timestamps()
+            total_entries = len(timestamps)
             valid_entries = sum(
-                1 for key in self._cache.keys() if self._is_cache_valid(key)
+                1 for key in timestamps if self._is_timestamp_valid(key, timestamps)
             )
 
             cache_types: Dict[str, int] = {}
-            for key in self._cache.keys():
+            for key in timestamps:
                 cache_type = key.split("_")[0]
                 cache_types[cache_type] = cache_types.get(cache_type, 0) + 1
 
             return {
                 "initialized": self._initialized,
                 "total_entries": total_entries,
+                "loaded_entries": len(self._cache),
                 "valid_entries": valid_entries,
                 "invalid_entries": total_entries - valid_entries,
                 "cache_types": cache_types,
                 "last_update": (
-                    max(self._cache_timestamps.values()).isoformat()
-                    if self._cache_timestamps
-                    else None
+                    max(timestamps.values()).isoformat() if timestamps else None
                 ),
             }
 
     def cleanup_expired_cache(self):
-        """Remove entradas expiradas do cache."""
+        """Remove entradas expiradas do cache (memória e disco)."""
         with self._lock:
+            timestamps = self._all_timestamps()
             expired_keys = [
-                key for key in self._cache.keys() if not self._is_cache_valid(key)
+                key
+                for key in timestamps
+                if not self._is_timestamp_valid(key, timestamps)
             ]
 
             for key in expired_keys:
                 self._cache.pop(key, None)
                 self._cache_timestamps.pop(key, None)
+                self._dirty_keys.discard(key)
 
             if expired_keys:
+                if self._store is not None:
+                    self._store.delete_many(expired_keys)
                 self.cache_logger.info(
                     "Removidas %d entradas expiradas do cache", len(expired_keys)
                 )
-                self._save_persistent_cache(force=True)
 
     def force_refresh(self, cache_types: Optional[List[str]] = None):
         """Força atualização do cache."""
@@ -351,7 +613,7 @@ class CacheManager:  # pylint: disable=too-many-instance-attributes
 
     def sync_cache_to_disk(self):
         """Sincroniza cache modificado para o disco."""
-        if self._dirty:
+        if self._dirty_keys:
             self._save_persistent_cache(force=True)
             logging.info("Cache sincronizado para disco")
 
@@ -0,0 +1,125 @@
+"""Armazenamento persistente chave/valor do cache de dados.
+
+Substitui o arquivo JSON único do cache por uma tabela SQLite local: cada
+entrada é gravada individualmente (apenas as chaves alteradas são escritas) e
+lida sob demanda, sem precisar interpretar o cache inteiro na inicialização.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class CacheStore:
+    """Tabela chave/valor em SQLite local para persistir o cache."""
+
+    def __init__(self, caminho: Path):
+        """Abre (ou cria) o arquivo de cache no caminho indicado."""
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.caminho), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, timestamp REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _codificar(valor: Any) -> bytes:
+        """Serializa o valor em JSON compacto (UTF-8)."""
+        return json.dumps(valor, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    def get(self, key: str) -> Optional[Tuple[Any, datetime]]:
+        """Lê uma única entrada; retorna (valor, timestamp) ou None."""
+        try:
+            with self._lock:
+                linha = self._conn.execute(
+                    "SELECT value, timestamp FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+            if linha is None:
+                return None
+            return json.loads(linha[0]), datetime.fromtimestamp(linha[1])
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning("Erro ao ler entrada '%s' do cache: %s", key, e)
+            return None
+
+    def put_many(self, entradas: Iterable[Tuple[str, Any, datetime]]):
+        """Grava (ou substitui) as entradas informadas em uma transação."""
+        linhas = [
+            (key, self._codificar(valor), timestamp.timestamp())
+            for key, valor, timestamp in entradas
+        ]
+        if not linhas:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, timestamp) VALUES (?, ?, ?)",
+                linhas,
+            )
+
+    def delete_many(self, keys: Iterable[str]):
+        """Remove as chaves informadas."""
+        linhas = [(key,) for key in keys]
+        if not linhas:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM cache WHERE key = ?", linhas)
+
+    def delete_prefixes(self, prefixos: Iterable[str]):
+        """Remove todas as chaves que começam com algum dos prefixos."""
+        with self._lock, self._conn:
+            for prefixo in prefixos:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE substr(key, 1, ?) = ?",
+                    (len(prefixo), prefixo),
+                )
+
+    def clear(self):
+        """Remove todas as entradas."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def timestamps(self) -> Dict[str, datetime]:
+        """Retorna o timestamp de todas as chaves, sem ler os valores."""
+        with self._lock:
+            linhas: List[Tuple[str, float]] = self._conn.execute(
+                "SELECT key, timestamp FROM cache"
+            ).fetchall()
+        return {key: datetime.fromtimestamp(ts) for key, ts in linhas}
+
+    def get_meta(self, key: str) -> Any:
+        """Lê um metadado do cache (ex.: versões de dados); None se ausente."""
+        try:
+            with self._lock:
+                linha = self._conn.execute(
+                    "SELECT value FROM meta WHERE key = ?", (key,)
+                ).fetchone()
+            return json.loads(linha[0]) if linha is not None else None
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning("Erro ao ler metadado '%s' do cache: %s", key, e)
+            return None
+
+    def set_meta(self, key: str, valor: Any):
+        """Grava um metadado do cache."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (key, self._codificar(valor)),
+            )
+
+    def close(self):
+        """Fecha a conexão com o arquivo de cache."""
+        with self._lock:
+            self._conn.close()
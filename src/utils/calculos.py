@@ -9,14 +9,19 @@ sem modificar ou sequer conhecer a interface gráfica.
 
 import logging
 import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
 from math import pi
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence, Union
 
+import numpy as np
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.config import globals as g
-from src.models.models import Canal, Deducao, Espessura, Material
-from src.utils.banco_dados import get_session
+from src.models.models import Canal, Deducao, Espessura, FatorK, Material
+from src.utils.banco_dados import get_read_session
+from src.utils.deducao_index import deducao_index
 
 
 def buscar_deducao_por_parametros(
@@ -24,6 +29,10 @@ def buscar_deducao_por_parametros(
 ):
     """Busca uma dedução no banco de dados usando os parâmetros fornecidos.
 
+    O ID é resolvido pelo índice em memória e o objeto obtido pela chave
+    primária; o join completo só é executado quando o índice não conhece a
+    combinação ou está desatualizado em relação ao banco.
+
     Args:
         session: Sessão do SQLAlchemy
         material_nome: Nome do material
@@ -33,6 +42,16 @@ def buscar_deducao_por_parametros(
     Returns:
         Objeto Deducao ou None se não encontrado
     """
+    entrada = deducao_index.get_deducao(material_nome, espessura_valor, canal_valor)
+    if entrada is not None:
+        deducao = session.get(Deducao, entrada["id"])
+        if deducao is not None and (
+            deducao.material_id,
+            deducao.espessura_id,
+            deducao.canal_id,
+        ) == (entrada["material_id"], entrada["espessura_id"], entrada["canal_id"]):
+            return deducao
+
     return (
         # pylint: disable=duplicate-code
         session.query(Deducao)
@@ -127,7 +146,7 @@ class CalculoDeducaoDB:
     ):
         """Busca direta no banco como fallback."""
         try:
-            with get_session() as session:
+            with get_read_session() as session:
                 resultado = buscar_deducao_por_parametros(
                     session, material_nome, espessura_valor, canal_valor
                 )
@@ -144,6 +163,111 @@ class CalculoDeducaoDB:
             return None
 
 
+class TabelaFatorK:
+    """Tabela Raio/Espessura -> Fator K pré-compilada para interpolação.
+
+    Os pontos são ordenados uma única vez na construção; buscas escalares usam
+    ``bisect`` e buscas em lote usam ``np.interp``.
+    """
+
+    RAZAO_MIN = 0.1
+    RAZAO_MAX = 10.0
+
+    def __init__(self, pontos: Dict[float, float]):
+        """Compila a tabela a partir de um dicionário {razão: fator K}."""
+        itens = sorted((float(r), float(k)) for r, k in pontos.items())
+        if not itens:
+            raise ValueError("A tabela de Fator K precisa de ao menos um ponto.")
+        self.razoes = [r for r, _ in itens]
+        self.valores = [k for _, k in itens]
+        self._razoes_np = np.array(self.razoes)
+        self._valores_np = np.array(self.valores)
+
+    def interpolar(self, razao_re: float) -> float:
+        """Obtém o fator K de uma razão RI/E por interpolação linear."""
+        razao_re = max(self.RAZAO_MIN, min(razao_re, self.RAZAO_MAX))
+        i = bisect_left(self.razoes, razao_re)
+        if i < len(self.razoes) and self.razoes[i] == razao_re:
+            return self.valores[i]
+        if i == 0:
+            return self.valores[0]
+        if i == len(self.razoes):
+            return self.valores[-1]
+        r1, r2 = self.razoes[i - 1], self.razoes[i]
+        k1, k2 = self.valores[i - 1], self.valores[i]
+        return k1 + (k2 - k1) * (razao_re - r1) / (r2 - r1)
+
+    def interpolar_many(self, razoes_re) -> "np.ndarray":
+        """Obtém o fator K para um array (de qualquer forma) de razões RI/E."""
+        razoes = np.clip(
+            np.asarray(razoes_re, dtype=float), self.RAZAO_MIN, self.RAZAO_MAX
+        )
+        return np.interp(razoes, self._razoes_np, self._valores_np)
+
+
+class RegistroTabelasFatorK:
+    """Mantém a tabela padrão e as curvas de Fator K específicas por material.
+
+    As curvas por material ficam na tabela ``fator_k`` do banco e são
+    carregadas uma única vez, sob demanda; materiais sem curva própria usam a
+    tabela padrão ``g.RAIO_K``.
+    """
+
+    def __init__(self):
+        """Compila a tabela padrão; as curvas por material são carregadas depois."""
+        self.padrao = TabelaFatorK(g.RAIO_K)
+        self._por_material: Dict[str, TabelaFatorK] = {}
+        self._carregado = False
+        self._registrado = False
+        self._lock = threading.Lock()
+
+    def tabela(self, material_nome: Optional[str] = None) -> TabelaFatorK:
+        """Retorna a tabela do material (ou a padrão, se não houver curva)."""
+        if not material_nome:
+            return self.padrao
+        self._carregar()
+        return self._por_material.get(material_nome, self.padrao)
+
+    def _carregar(self):
+        """Carrega as curvas por material do banco, se ainda não carregadas."""
+        if not self._registrado:
+            # Import tardio pelo mesmo motivo de CalculoDeducaoDB; o registro
+            # fica fora de self._lock para não adquirir o lock do cache dentro dele
+            from src.utils.cache_manager import (  # pylint: disable=C0415
+                cache_manager,
+            )
+
+            cache_manager.registrar_invalidacao_materiais(self.invalidar)
+            self._registrado = True
+        with self._lock:
+            if self._carregado:
+                return
+            curvas: Dict[str, Dict[float, float]] = defaultdict(dict)
+            try:
+                with get_read_session() as session:
+                    linhas = (
+                        session.query(Material.nome, FatorK.razao, FatorK.valor)
+                        .join(Material, FatorK.material_id == Material.id)
+                        .all()
+                    )
+                for nome, razao, valor in linhas:
+                    curvas[nome][razao] = valor
+            except SQLAlchemyError as e:
+                logging.warning("Erro ao carregar curvas de Fator K: %s", e)
+            self._por_material = {
+                nome: TabelaFatorK(pontos) for nome, pontos in curvas.items()
+            }
+            self._carregado = True
+
+    def invalidar(self):
+        """Descarta as curvas carregadas; a próxima busca as recarrega."""
+        with self._lock:
+            self._carregado = False
+
+
+tabelas_fator_k = RegistroTabelasFatorK()
+
+
 class CalculoFatorK:
     """Calcula o Fator K e o Offset."""
 
@@ -158,21 +282,17 @@ class CalculoFatorK:
         return max(0.0, min(fator_k, 0.5))
 
     @staticmethod
-    def _obter_fator_k_tabela(razao_re):
+    def _obter_fator_k_tabela(razao_re, material_nome: Optional[str] = None):
         """Obtém o fator K da tabela de referência por interpolação."""
-        razao_re = max(0.1, min(razao_re, 10.0))
-        if razao_re in g.RAIO_K:
-            return g.RAIO_K[razao_re]
-
-        razoes = sorted(g.RAIO_K.keys())
-        for i in range(len(razoes) - 1):
-            r1, r2 = razoes[i], razoes[i + 1]
-            if r1 <= razao_re <= r2:
-                k1, k2 = g.RAIO_K[r1], g.RAIO_K[r2]
-                return k1 + (k2 - k1) * (razao_re - r1) / (r2 - r1)
-        return g.RAIO_K[razoes[-1]]
-
-    def calcular(self, espessura: float, raio_interno: float, deducao_usada: float):
+        return tabelas_fator_k.tabela(material_nome).interpolar(razao_re)
+
+    def calcular(
+        self,
+        espessura: float,
+        raio_interno: float,
+        deducao_usada: float,
+        material_nome: Optional[str] = None,
+    ):
         """Executa o cálculo do Fator K e Offset."""
         if raio_interno <= 0 or espessura <= 0:
             return None
@@ -181,11 +301,42 @@ class CalculoFatorK:
             fator_k = self._formula_fator_k(espessura, deducao_usada, raio_interno)
         else:
             razao_re = raio_interno / espessura if espessura > 0 else 0
-            fator_k = self._obter_fator_k_tabela(razao_re)
+            fator_k = self._obter_fator_k_tabela(razao_re, material_nome)
 
         offset = fator_k * espessura
         return {"fator_k": fator_k, "offset": offset}
 
+    def calcular_many(
+        self,
+        espessuras,
+        raios_internos,
+        deducoes=0.0,
+        material_nome: Optional[str] = None,
+    ) -> Dict[str, "np.ndarray"]:
+        """Calcula Fator K e Offset para arrays (ou grades) de entradas.
+
+        Os argumentos são combinados por broadcasting do NumPy, permitindo
+        varrer grades Raio x Espessura (ex.: saídas de ``np.meshgrid``).
+
+        Returns:
+            dict: ``fator_k`` e ``offset`` (NaN onde o cálculo não se aplica)
+            e a máscara ``valido``.
+        """
+        esp, raio, ded = np.broadcast_arrays(
+            np.asarray(espessuras, dtype=float),
+            np.asarray(raios_internos, dtype=float),
+            np.asarray(deducoes, dtype=float),
+        )
+        valido = (raio > 0) & (esp > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            formula = np.clip(
+                (4 * (esp - ded / 2 + raio) - pi * raio) / (pi * esp), 0.0, 0.5
+            )
+            razao = np.where(esp > 0, raio / esp, 0.0)
+        tabela = tabelas_fator_k.tabela(material_nome).interpolar_many(razao)
+        fator_k = np.where(valido, np.where(ded > 0, formula, tabela), np.nan)
+        return {"fator_k": fator_k, "offset": fator_k * esp, "valido": valido}
+
 
 class CalculoAbaMinima:
     """Calcula a aba mínima externa."""
@@ -207,14 +358,10 @@ class CalculoZMinimo:
         """Executa o cálculo do Z mínimo externo."""
         if espessura <= 0 or deducao <= 0 or not canal_str:
             return None
-        try:
-            with get_session() as session:
-                canal_obj = session.query(Canal).filter_by(valor=canal_str).first()
-                if not canal_obj or canal_obj.largura is None:
-                    return None
-                return espessura + (deducao / 2) + (canal_obj.largura / 2) + 2
-        except SQLAlchemyError:
+        canal = deducao_index.get_canal(canal_str)
+        if not canal or canal["largura"] is None:
             return None
+        return espessura + (deducao / 2) + (canal["largura"] / 2) + 2
 
 
 class CalculoRazaoRIE:
@@ -232,48 +379,28 @@ class CalculoForca:
     """Calcula a força de dobra necessária."""
 
     @staticmethod
-    def _obter_forca_db(session, espessura_valor, material_nome, canal_valor):
-        """Busca o valor da força no banco de dados."""
-
-        deducao_obj = (
-            # pylint: disable=R0801
-            session.query(Deducao)
-            .join(Material)
-            .join(Espessura)
-            .join(Canal)
-            .filter(
-                Material.nome == material_nome,
-                Espessura.valor == espessura_valor,
-                Canal.valor == canal_valor,
-            )
-            .first()
-        )
-        canal_obj = session.query(Canal).filter_by(valor=canal_valor).first()
-        return (deducao_obj.forca if deducao_obj else None), canal_obj
+    def _obter_forca_indice(espessura_valor, material_nome, canal_valor):
+        """Busca o valor da força e a geometria do canal no índice de deduções."""
+        entrada = deducao_index.get_deducao(material_nome, espessura_valor, canal_valor)
+        canal = deducao_index.get_canal(canal_valor)
+        return (entrada["forca"] if entrada else None), canal
 
     def calcular(self, comprimento: float, espessura: float, material: str, canal: str):
         """Executa o cálculo da força em toneladas/m."""
         if not all([espessura, material, canal]):
             return None
-        try:
-            with get_session() as session:
-                forca_base, canal_obj = self._obter_forca_db(
-                    session, espessura, material, canal
-                )
-                if forca_base is None:
-                    return {"forca": None, "canal_obj": None, "comprimento_total": None}
-                toneladas_m = (
-                    (forca_base * comprimento) / 1000 if comprimento > 0 else forca_base
-                )
-                # Extrair o valor do comprimento_total antes de fechar a sessão
-                comprimento_total = canal_obj.comprimento_total if canal_obj else None
-                return {
-                    "forca": toneladas_m,
-                    "canal_obj": canal_obj,
-                    "comprimento_total": comprimento_total,
-                }
-        except SQLAlchemyError:
+        forca_base, canal_info = self._obter_forca_indice(espessura, material, canal)
+        if forca_base is None:
             return {"forca": None, "canal_obj": None, "comprimento_total": None}
+        toneladas_m = (
+            (forca_base * comprimento) / 1000 if comprimento > 0 else forca_base
+        )
+        comprimento_total = canal_info["comprimento_total"] if canal_info else None
+        return {
+            "forca": toneladas_m,
+            "canal_obj": canal_info,
+            "comprimento_total": comprimento_total,
+        }
 
 
 class CalculoDobra:
@@ -329,6 +456,79 @@ class CalculoDobra:
         }
 
 
+class CalculoDobraLote:
+    """Calcula medidas de dobra e blanks de várias colunas/peças de uma vez.
+
+    Cada linha da matriz de entrada corresponde a uma coluna da interface (ou a
+    uma peça), com uma dedução por linha. As regras são as mesmas de
+    ``CalculoDobra``: abas nas extremidades de um bloco contínuo descontam
+    metade da dedução e abas internas descontam a dedução inteira.
+    """
+
+    def calcular(
+        self,
+        valores_dobras: Union[Sequence[Sequence[float]], "np.ndarray"],
+        deducoes: Union[float, Sequence[float], "np.ndarray"],
+    ) -> Dict[str, "np.ndarray"]:
+        """Calcula todas as linhas em uma única passagem vetorizada.
+
+        Args:
+            valores_dobras: Matriz (linhas x abas) com as medidas das abas;
+                valores <= 0 indicam aba vazia.
+            deducoes: Dedução por linha (ou escalar aplicado a todas).
+
+        Returns:
+            dict: ``medida`` e ``metade`` (linhas x abas, NaN nas abas vazias),
+            ``total_abas``, ``blank_total`` e ``valido`` (por linha). Linhas com
+            dedução <= 0 são marcadas como inválidas e têm totais zerados.
+        """
+        valores = np.atleast_2d(np.asarray(valores_dobras, dtype=float))
+        linhas = valores.shape[0]
+        ded = np.broadcast_to(np.asarray(deducoes, dtype=float), (linhas,))
+        valido = ded > 0
+
+        preenchido = valores > 0
+        vazio = np.zeros((linhas, 1), dtype=bool)
+        anterior = np.hstack([vazio, preenchido[:, :-1]])
+        seguinte = np.hstack([preenchido[:, 1:], vazio])
+        extremidade = ~(anterior & seguinte)
+
+        desconto = np.where(extremidade, ded[:, None] / 2, ded[:, None])
+        ativo = preenchido & valido[:, None]
+        medida = np.where(ativo, valores - desconto, np.nan)
+
+        return {
+            "medida": medida,
+            "metade": medida / 2,
+            "total_abas": np.where(
+                valido, np.where(preenchido, valores, 0.0).sum(axis=1), 0.0
+            ),
+            "blank_total": np.where(ativo, medida, 0.0).sum(axis=1),
+            "valido": valido,
+        }
+
+    @staticmethod
+    def resultado_linha(
+        resultado: Dict[str, "np.ndarray"], linha: int
+    ) -> Optional[Dict[str, Any]]:
+        """Converte uma linha do lote no formato de ``CalculoDobra.calcular_coluna``."""
+        if not resultado["valido"][linha]:
+            return None
+        resultados = [
+            {"medida": None, "metade": None}
+            if np.isnan(medida)
+            else {"medida": float(medida), "metade": float(metade)}
+            for medida, metade in zip(
+                resultado["medida"][linha], resultado["metade"][linha]
+            )
+        ]
+        return {
+            "total_abas": float(resultado["total_abas"][linha]),
+            "resultados": resultados,
+            "blank_total": float(resultado["blank_total"][linha]),
+        }
+
+
 def calcular_spring_back(y: float, e: float, t: float, rf: float, a2: float):
     """Calcula Ks, Ri e a1 para o formulário de Spring Back.
 
@@ -0,0 +1,48 @@
+"""Constantes de caminhos da aplicação, sem dependência da interface gráfica.
+
+Mantido separado de ``utilitarios`` para que a camada de dados e os cálculos
+possam ser importados em modo headless (scripts e processamento em lote) sem
+carregar o PySide6.
+"""
+
+import os
+import sys
+
+
+def obter_dir_base() -> str:
+    """Retorna o diretório base da aplicação de forma consistente.
+
+    Verifica se a aplicação está rodando como um script ou como um executável
+    "congelado" para determinar o caminho raiz correto.
+
+    Returns:
+        str: O caminho absoluto para o diretório raiz da aplicação.
+    """
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(sys.executable)
+    # Em modo de script, assume-se que este arquivo está em 'src/utils',
+    # então o diretório base está dois níveis acima.
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+BASE_DIR = obter_dir_base()
+
+# Diretório de banco de dados
+DATABASE_DIR = os.path.join(BASE_DIR, "database")
+DB_PATH = os.path.join(DATABASE_DIR, "tabela_de_dobra.db")
+
+# Diretório de logs
+LOG_DIR = os.path.join(BASE_DIR, "logs")
+
+# Configuração de AppData para dados do usuário
+APPDATA_DIR = os.environ.get(
+    "APPDATA", os.path.join(os.environ["USERPROFILE"], "AppData", "Roaming")
+)
+
+# Diretórios para comunicação entre processos (IPC) - mantidos no diretório base
+RUNTIME_DIR = os.path.join(BASE_DIR, ".runtime", "calculadora_dobra")
+SESSION_DIR = os.path.join(RUNTIME_DIR, "sessions")
+COMMAND_DIR = os.path.join(RUNTIME_DIR, "commands")
+
+# Cache movido para AppData
+CACHE_DIR = os.path.join(APPDATA_DIR, "Calculadora de Dobra", "cache")
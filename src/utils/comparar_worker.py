@@ -9,52 +9,43 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
+import sqlite3
 import traceback
-from typing import List, Optional, Tuple, TypedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+)
 
 from PySide6.QtCore import QObject, QThread, Signal
 
-try:  # Bibliotecas CAD (STEP/IGES)
-    from OCC.Core.BRepGProp import brepgprop  # type: ignore[attr-defined]
-    from OCC.Core.GProp import GProp_GProps  # type: ignore[attr-defined]
-    from OCC.Core.IGESControl import IGESControl_Reader  # type: ignore[attr-defined]
-    from OCC.Core.STEPControl import STEPControl_Reader  # type: ignore[attr-defined]
-    from OCC.Core.TopAbs import (  # type: ignore[attr-defined]
-        TopAbs_EDGE,
-        TopAbs_FACE,
-        TopAbs_VERTEX,
-    )
-    from OCC.Core.TopExp import TopExp_Explorer  # type: ignore[attr-defined]
-
-    PYTHON_OCC_AVAILABLE = True
-except ImportError:
-    brepgprop = None  # type: ignore[assignment]
-    GProp_GProps = None  # type: ignore[assignment]
-    IGESControl_Reader = None  # type: ignore[assignment]
-    STEPControl_Reader = None  # type: ignore[assignment]
-    TopAbs_EDGE = TopAbs_FACE = TopAbs_VERTEX = None  # type: ignore[assignment]
-    TopExp_Explorer = None  # type: ignore[assignment]
-    PYTHON_OCC_AVAILABLE = False
-
-try:  # DXF
-    import ezdxf  # type: ignore[import]
-    from ezdxf import bbox as ezdxf_bbox  # type: ignore[attr-defined]
-    from ezdxf.math import BoundingBox  # type: ignore[attr-defined]
-
-    EZDXF_AVAILABLE = True
-except ImportError:
-    ezdxf = None  # type: ignore[assignment]
-    ezdxf_bbox = None  # type: ignore[assignment]
-    BoundingBox = None  # type: ignore[assignment]
-    EZDXF_AVAILABLE = False
-
-try:  # PDFs
-    import fitz  # type: ignore[import]
-
-    PYMUPDF_AVAILABLE = True
-except ImportError:
-    fitz = None  # type: ignore[assignment]
-    PYMUPDF_AVAILABLE = False
+from src.utils.cache_impressoes import CacheImpressoes, chave_arquivo
+from src.utils.dependencias import EZDXF, FITZ, OCC
+from src.utils.diferenca_dxf import (
+    EntidadeGeometrica,
+    diferenciar,
+    extrair_entidades,
+    gerar_sobreposicao_pdf,
+    impressao_geometrica,
+    ler_entidades,
+)
+from src.utils.hash_arquivos import TAMANHO_AMOSTRA, hash_amostra, hash_completo
+from src.utils.pareamento_arquivos import parear
 
 
 class FileHandlerInfo(TypedDict):
@@ -65,131 +56,279 @@ class FileHandlerInfo(TypedDict):
     tooltip: str
 
 
-FILE_HANDLERS: dict[str, FileHandlerInfo] = {
+# Tipo de arquivo -> extensões, dependência, dica e se a extração roda em um
+# processo separado (leitura de geometria, texto e imagens usa a CPU; DWG é
+# comparado só por hash, limitado pela leitura do disco, e usa threads).
+_FILE_TYPES: dict[str, dict[str, Any]] = {
     "STEP": {
         "extensions": ("*.step", "*.stp"),
-        "available": PYTHON_OCC_AVAILABLE,
+        "requires": OCC,
+        "em_processo": True,
         "tooltip": "Comparação geométrica de topologia, volume, área, etc. (Ctrl+Enter)",
     },
     "IGES": {
         "extensions": ("*.igs", "*.iges"),
-        "available": PYTHON_OCC_AVAILABLE,
+        "requires": OCC,
+        "em_processo": True,
         "tooltip": "Comparação geométrica de topologia, volume, área, etc. (Ctrl+Enter)",
     },
     "DXF": {
         "extensions": ("*.dxf",),
-        "available": EZDXF_AVAILABLE,
-        "tooltip": "Comparação por contagem de entidades e extensões do desenho (Ctrl+Enter)",
+        "requires": EZDXF,
+        "em_processo": True,
+        "tooltip": "Comparação entidade a entidade: adicionadas, removidas e movidas (Ctrl+Enter)",
     },
     "PDF": {
         "extensions": ("*.pdf",),
-        "available": PYMUPDF_AVAILABLE,
+        "requires": FITZ,
+        "em_processo": True,
         "tooltip": "Comparação por metadados, texto e imagens incorporadas (Ctrl+Enter)",
     },
     "DWG": {
         "extensions": ("*.dwg",),
-        "available": True,
+        "requires": None,
+        "em_processo": False,
         "tooltip": "Comparação por hash binário (Ctrl+Enter)",
     },
 }
 
+# Comparações simultâneas quando o chamador não informa ``max_workers``
+MAX_COMPARACOES_PARALELAS = os.cpu_count() or 1
+
+# Intervalo (s) entre verificações de cancelamento enquanto aguarda as tarefas
+INTERVALO_CANCELAMENTO = 0.2
+
+# Resultado de uma linha: (props_a, status_a, props_b, status_b, are_equal)
+ResultadoComparacao = Tuple[Optional[tuple], str, Optional[tuple], str, Optional[bool]]
+
+# Linha a comparar: (linha na lista A, linha na lista B, arquivo A, arquivo B);
+# a linha vale -1 (e o arquivo, None) no lado sem correspondente
+LinhaComparacao = Tuple[int, int, Optional[str], Optional[str]]
+
 _DEPENDENCY_MESSAGES = (
-    ("python-occ-core (para STEP/IGES)", PYTHON_OCC_AVAILABLE),
-    ("ezdxf (para DXF)", EZDXF_AVAILABLE),
-    ("PyMuPDF (para PDF)", PYMUPDF_AVAILABLE),
+    ("python-occ-core (para STEP/IGES)", OCC),
+    ("ezdxf (para DXF)", EZDXF),
+    ("PyMuPDF (para PDF)", FITZ),
 )
 
 
-def get_missing_dependencies() -> list[str]:
-    """Retorna uma lista com as dependências opcionais ausentes."""
+def get_file_handlers() -> dict[str, FileHandlerInfo]:
+    """Retorna os tipos de arquivo com a flag ``available`` já avaliada.
 
-    return [name for name, available in _DEPENDENCY_MESSAGES if not available]
+    A primeira chamada importa as bibliotecas opcionais; deve ser feita ao
+    abrir o formulário de comparação, e não na importação do módulo.
+    """
+    handlers: dict[str, FileHandlerInfo] = {}
+    for nome, info in _FILE_TYPES.items():
+        dependencia = info["requires"]
+        handlers[nome] = {
+            "extensions": info["extensions"],
+            "available": dependencia is None or dependencia.disponivel,
+            "tooltip": info["tooltip"],
+        }
+    return handlers
 
 
-class ComparisonWorker(QThread):
-    """Executa a comparação de arquivos em segundo plano."""
+def get_missing_dependencies() -> list[str]:
+    """Retorna uma lista com as dependências opcionais ausentes."""
 
-    progress_updated = Signal(int)
-    row_compared = Signal(int, object, str, object, str, object)
-    comparison_finished = Signal(bool)
-    error_occurred = Signal(str)
+    return [name for name, dep in _DEPENDENCY_MESSAGES if not dep.disponivel]
 
-    def __init__(
-        self,
-        files_a: List[str],
-        files_b: List[str],
-        file_type: str,
-        parent: Optional[QObject] = None,
-    ) -> None:
-        super().__init__(parent)
-        self.files_a = files_a
-        self.files_b = files_b
-        self.file_type = file_type
-        self._is_interrupted = False
 
-    def stop(self) -> None:
-        """Sinaliza à thread que o processamento deve ser interrompido."""
+# Nomes antigos das flags, resolvidos sob demanda (PEP 562)
+_NOMES_PREGUICOSOS: dict[str, Callable[[], Any]] = {
+    "PYTHON_OCC_AVAILABLE": lambda: OCC.disponivel,
+    "EZDXF_AVAILABLE": lambda: EZDXF.disponivel,
+    "PYMUPDF_AVAILABLE": lambda: FITZ.disponivel,
+    "FILE_HANDLERS": get_file_handlers,
+}
 
-        self._is_interrupted = True
 
-    # pylint: disable=broad-except
-    def run(self) -> None:  # type: ignore[override]
-        """Percorre as listas e emite sinais conforme o progresso."""
+def __getattr__(nome: str) -> Any:
+    """Avalia as flags legadas (``*_AVAILABLE`` etc.) apenas quando lidas."""
+    if nome in _NOMES_PREGUICOSOS:
+        return _NOMES_PREGUICOSOS[nome]()
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
 
-        try:
-            max_count = max(len(self.files_a), len(self.files_b))
-            if max_count == 0:
-                self.comparison_finished.emit(self._is_interrupted)
-                return
 
-            for index in range(max_count):
-                if self._is_interrupted:
-                    break
+class ComparisonSteps:
+    """Extração de propriedades e comparação de um par de arquivos, sem Qt.
 
-                path_a = self.files_a[index] if index < len(self.files_a) else None
-                path_b = self.files_b[index] if index < len(self.files_b) else None
+    Fica separada de ``ComparisonWorker`` para que as linhas possam ser
+    comparadas em processos auxiliares. Hashes e propriedades já conhecidos
+    (impressões lidas de ``CacheImpressoes``) são reaproveitados; os calculados
+    aqui ficam em ``alteradas`` para o chamador gravá-los no cache.
 
-                if path_a and path_b:
-                    hash_a = self._get_file_hash(path_a)
-                    hash_b = self._get_file_hash(path_b)
-                    if hash_a is not None and hash_a == hash_b:
-                        props = ("Hash idêntico",)
-                        self.row_compared.emit(index, props, "OK", props, "OK", True)
-                        self.progress_updated.emit(int(((index + 1) / max_count) * 100))
-                        continue
-
-                props_a, status_a = (
-                    self._get_file_properties(path_a, self.file_type)
-                    if path_a
-                    else (None, "Sem par")
-                )
-                props_b, status_b = (
-                    self._get_file_properties(path_b, self.file_type)
-                    if path_b
-                    else (None, "Sem par")
-                )
-                are_equal = (props_a == props_b) if props_a and props_b else None
-                self.row_compared.emit(
-                    index, props_a, status_a, props_b, status_b, are_equal
-                )
-                self.progress_updated.emit(int(((index + 1) / max_count) * 100))
-        except Exception as exc:  # pragma: no cover - salvaguarda
-            logging.error("Ocorreu um erro inesperado na thread de comparação.")
-            logging.error(traceback.format_exc())
-            self.error_occurred.emit(f"Ocorreu um erro crítico na comparação:\n{exc}")
-        finally:
-            self.comparison_finished.emit(self._is_interrupted)
+    DXF com propriedades diferentes são comparados entidade a entidade
+    (``diferenca_dxf``); com ``pasta_sobreposicao``, cada par diferente gera
+    ali um PDF com as duas versões sobrepostas.
+    """
+
+    def __init__(
+        self,
+        conhecidas: Optional[Dict[str, Dict[str, Any]]] = None,
+        pasta_sobreposicao: Optional[str] = None,
+    ):
+        """Recebe as impressões já conhecidas, indexadas pelo caminho."""
+        self.impressoes: Dict[str, Dict[str, Any]] = dict(conhecidas or {})
+        self.alteradas: Dict[str, Dict[str, Any]] = {}
+        self.pasta_sobreposicao = pasta_sobreposicao
+        self._entidades_dxf: Dict[str, List[EntidadeGeometrica]] = {}
+
+    def em_cache(
+        self, path_a: Optional[str], path_b: Optional[str], file_type: str
+    ) -> bool:
+        """Indica se a linha pode ser comparada sem ler os arquivos."""
+        if path_a and path_b:
+            imp_a, imp_b = (self.impressoes.get(path) for path in (path_a, path_b))
+            if not imp_a or not imp_b or not imp_a["chave"] or not imp_b["chave"]:
+                return False
+            if imp_a["chave"][1] == imp_b["chave"][1]:
+                if not imp_a.get("hash") or not imp_b.get("hash"):
+                    return False
+                if imp_a["hash"] == imp_b["hash"]:
+                    return True
+        props = [self._props_conhecidas(path, file_type) for path in (path_a, path_b)]
+        if any(p is None for path, p in zip((path_a, path_b), props) if path):
+            return False
+        # DXF diferentes ainda passam pela comparação de entidades
+        return not (file_type == "DXF" and path_a and path_b and props[0] != props[1])
+
+    def conhecidas(self, *paths: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """Impressões já conhecidas dos arquivos, para repassar a outra etapa."""
+        return {
+            path: self.impressoes[path] for path in paths if path in self.impressoes
+        }
+
+    def hash_conteudo(self, file_path: str) -> Optional[str]:
+        """Hash do conteúdo do arquivo, reaproveitado entre pareamento e linhas."""
+        return self._get_file_hash(file_path)
+
+    def _impressao(self, file_path: str) -> Dict[str, Any]:
+        """Impressão do arquivo, criada (com a chave atual) se ainda não existir."""
+        impressao = self.impressoes.get(file_path)
+        if impressao is None:
+            impressao = {
+                "chave": chave_arquivo(file_path),
+                "hash": None,
+                "tipo": None,
+                "props": None,
+            }
+            self.impressoes[file_path] = impressao
+        return impressao
+
+    def _registrar(self, file_path: str, **valores: Any) -> None:
+        """Atualiza a impressão do arquivo e a marca para gravação no cache."""
+        impressao = self._impressao(file_path)
+        impressao.update(valores)
+        if impressao["chave"] is not None:
+            self.alteradas[file_path] = impressao
+
+    def _props_conhecidas(self, file_path: str, file_type: str) -> Optional[tuple]:
+        """Propriedades do arquivo já extraídas para este tipo, se houver."""
+        impressao = self.impressoes.get(file_path) or {}
+        if file_type == "DWG" and impressao.get("hash"):
+            return (impressao["hash"],)
+        if impressao.get("tipo") == file_type:
+            return impressao.get("props")
+        return None
+
+    def comparar(
+        self, path_a: Optional[str], path_b: Optional[str], file_type: str
+    ) -> ResultadoComparacao:
+        """Compara dois arquivos (qualquer um pode faltar) de uma linha."""
+        if path_a and path_b and self._conteudo_identico(path_a, path_b):
+            props = ("Hash idêntico",)
+            return props, "OK", props, "OK", True
+
+        props_a, status_a = (
+            self._get_file_properties(path_a, file_type)
+            if path_a
+            else (None, "Sem par")
+        )
+        props_b, status_b = (
+            self._get_file_properties(path_b, file_type)
+            if path_b
+            else (None, "Sem par")
+        )
+        are_equal = (props_a == props_b) if props_a and props_b else None
+        if file_type == "DXF" and are_equal is False:
+            return self._comparar_entidades_dxf(path_a, path_b, props_a, props_b)
+        return props_a, status_a, props_b, status_b, are_equal
+
+    def _comparar_entidades_dxf(
+        self, path_a: str, path_b: str, props_a: tuple, props_b: tuple
+    ) -> ResultadoComparacao:
+        """Refina a comparação de dois DXF com propriedades diferentes.
+
+        Se todas as entidades casarem dentro da tolerância, os arquivos são
+        equivalentes; senão, o resumo da diferença (e o caminho da
+        sobreposição, se gerada) é anexado às propriedades dos dois.
+        """
+        com_contornos = self.pasta_sobreposicao is not None
+        entidades = []
+        for path in (path_a, path_b):
+            try:
+                lidas = self._entidades_dxf.pop(path, None)
+                if lidas is None:
+                    lidas = ler_entidades(path, com_contornos=com_contornos)
+                entidades.append(lidas)
+            except (IOError, EZDXF.ezdxf.DXFStructureError, TypeError) as exc:
+                logging.warning("Exceção ao ler entidades do DXF '%s': %s", path, exc)
+                return props_a, "OK", props_b, "OK", False
+
+        diferenca = diferenciar(entidades[0], entidades[1])
+        if diferenca.sem_diferencas:
+            return props_a, "OK", props_b, "OK", True
+
+        resumo = diferenca.resumo()
+        if self.pasta_sobreposicao:
+            nomes = [os.path.splitext(os.path.basename(p))[0] for p in (path_a, path_b)]
+            destino = gerar_sobreposicao_pdf(
+                diferenca,
+                os.path.join(
+                    self.pasta_sobreposicao, f"{nomes[0]}_x_{nomes[1]}_diferencas.pdf"
+                ),
+                titulo=f"A: {nomes[0]}  B: {nomes[1]}",
+            )
+            if destino:
+                resumo += f"\n    Sobreposição: {destino}"
+        return props_a + (resumo,), "OK", props_b + (resumo,), "OK", False
+
+    def _conteudo_identico(self, path_a: str, path_b: str) -> bool:
+        """Verifica se os arquivos têm o mesmo conteúdo.
+
+        Vai do teste mais barato (tamanho) ao mais caro (hash completo),
+        parando na primeira diferença.
+        """
+        imp_a, imp_b = self._impressao(path_a), self._impressao(path_b)
+        if imp_a["chave"] is None or imp_b["chave"] is None:
+            return False
+        if imp_a["chave"][1] != imp_b["chave"][1]:
+            return False
+        if imp_a["chave"][1] > 2 * TAMANHO_AMOSTRA and not (
+            imp_a["hash"] and imp_b["hash"]
+        ):
+            try:
+                if hash_amostra(path_a) != hash_amostra(path_b):
+                    return False
+            except OSError as exc:
+                logging.warning("Falha ao ler amostra para comparação: %s", exc)
+                return False
+        hash_a = self._get_file_hash(path_a)
+        return hash_a is not None and hash_a == self._get_file_hash(path_b)
 
     def _get_file_hash(self, file_path: str) -> Optional[str]:
-        """Calcula o hash SHA256 do arquivo informado."""
+        """Calcula (ou reaproveita) o hash do conteúdo do arquivo informado."""
+
+        impressao = self._impressao(file_path)
+        if impressao["hash"]:
+            return impressao["hash"]
 
-        sha256 = hashlib.sha256()
         try:
-            with open(file_path, "rb") as handle:
-                for chunk in iter(lambda: handle.read(4096), b""):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
-        except IOError as exc:
+            self._registrar(file_path, hash=hash_completo(file_path))
+            return impressao["hash"]
+        except OSError as exc:
             logging.warning(
                 "Não foi possível calcular o hash para '%s': %s", file_path, exc
             )
@@ -197,16 +336,29 @@ class ComparisonWorker(QThread):
 
     def _get_file_properties(
         self, file_path: str, file_type: str
+    ) -> Tuple[Optional[tuple], str]:
+        """Retorna as propriedades conhecidas ou as extrai do arquivo."""
+
+        props = self._props_conhecidas(file_path, file_type)
+        if props is not None:
+            return props, "OK"
+        props, status = self._extrair_propriedades(file_path, file_type)
+        if props is not None and status == "OK" and file_type != "DWG":
+            self._registrar(file_path, tipo=file_type, props=props)
+        return props, status
+
+    def _extrair_propriedades(
+        self, file_path: str, file_type: str
     ) -> Tuple[Optional[tuple], str]:
         """Encaminha para o extrator apropriado conforme o tipo."""
 
         handlers: dict[str, tuple] = {}
-        if PYTHON_OCC_AVAILABLE and STEPControl_Reader is not None:
-            handlers["STEP"] = (self._get_cad_properties, STEPControl_Reader)
-            handlers["IGES"] = (self._get_cad_properties, IGESControl_Reader)
-        if EZDXF_AVAILABLE and ezdxf is not None:
+        if OCC.disponivel:
+            handlers["STEP"] = (self._get_cad_properties, OCC.STEPControl_Reader)
+            handlers["IGES"] = (self._get_cad_properties, OCC.IGESControl_Reader)
+        if EZDXF.disponivel:
             handlers["DXF"] = (self._get_dxf_properties,)
-        if PYMUPDF_AVAILABLE and fitz is not None:
+        if FITZ.disponivel:
             handlers["PDF"] = (self._get_pdf_properties,)
 
         if file_type in handlers:
@@ -228,7 +380,7 @@ class ComparisonWorker(QThread):
     ) -> Tuple[Optional[tuple], str]:
         """Extrai propriedades geométricas de STEP/IGES."""
 
-        if not PYTHON_OCC_AVAILABLE or reader_class is None or brepgprop is None:
+        if not OCC.disponivel or reader_class is None:
             return None, "Biblioteca python-occ-core indisponível"
 
         try:
@@ -243,22 +395,22 @@ class ComparisonWorker(QThread):
                 return None, "Nenhuma geometria encontrada"
 
             num_faces = num_edges = num_vertices = 0
-            explorer = TopExp_Explorer(shape, TopAbs_FACE)  # type: ignore[arg-type]
+            explorer = OCC.TopExp_Explorer(shape, OCC.TopAbs_FACE)
             while explorer.More():
                 num_faces += 1
                 explorer.Next()
-            explorer.Init(shape, TopAbs_EDGE)
+            explorer.Init(shape, OCC.TopAbs_EDGE)
             while explorer.More():
                 num_edges += 1
                 explorer.Next()
-            explorer.Init(shape, TopAbs_VERTEX)
+            explorer.Init(shape, OCC.TopAbs_VERTEX)
             while explorer.More():
                 num_vertices += 1
                 explorer.Next()
 
-            props_vol, props_surf = GProp_GProps(), GProp_GProps()
-            brepgprop.VolumeProperties(shape, props_vol)
-            brepgprop.SurfaceProperties(shape, props_surf)
+            props_vol, props_surf = OCC.GProp_GProps(), OCC.GProp_GProps()
+            OCC.brepgprop.VolumeProperties(shape, props_vol)
+            OCC.brepgprop.SurfaceProperties(shape, props_surf)
             centre = props_vol.CentreOfMass()
             moments = props_vol.PrincipalProperties().Moments()
 
@@ -276,12 +428,17 @@ class ComparisonWorker(QThread):
     def _get_dxf_properties(self, file_path: str) -> Tuple[Optional[tuple], str]:
         """Extrai propriedades de um DXF."""
 
-        if not EZDXF_AVAILABLE or ezdxf is None or BoundingBox is None:
+        if not EZDXF.disponivel:
             return None, "Biblioteca ezdxf indisponível"
+        ezdxf, ezdxf_bbox = EZDXF.ezdxf, EZDXF.bbox
 
         try:
             doc = ezdxf.readfile(file_path)
             msp = doc.modelspace()
+            entidades = extrair_entidades(
+                msp, com_contornos=self.pasta_sobreposicao is not None
+            )
+            self._entidades_dxf[file_path] = entidades
             bbox = None
             if ezdxf_bbox is not None:
                 try:
@@ -293,7 +450,7 @@ class ComparisonWorker(QThread):
                         exc,
                     )
             if bbox is None or not getattr(bbox, "has_data", False):
-                bbox = BoundingBox()
+                bbox = EZDXF.BoundingBox()
                 for entity in msp:
                     try:
                         entity_bbox = (
@@ -314,15 +471,21 @@ class ComparisonWorker(QThread):
                 f"{len(msp)} entidades",
                 f"({extmin[0]:.3f}, {extmin[1]:.3f})",
                 f"({extmax[0]:.3f}, {extmax[1]:.3f})",
+                impressao_geometrica(entidades),
             ), "OK"
         except (IOError, ezdxf.DXFStructureError, TypeError) as exc:
             logging.warning("Exceção ao processar arquivo DXF '%s': %s", file_path, exc)
             return None, f"Exceção: {exc}"
 
     def _get_pdf_properties(self, file_path: str) -> Tuple[Optional[tuple], str]:
-        """Extrai propriedades do PDF, incluindo hashes de texto e imagens."""
+        """Extrai propriedades do PDF, incluindo hashes de texto e imagens.
+
+        O hash do arquivo inteiro não faz parte das propriedades: ele já foi
+        comparado em ``_conteudo_identico`` e as tornaria sempre diferentes.
+        """
 
-        if not PYMUPDF_AVAILABLE or fitz is None:
+        fitz = FITZ.fitz
+        if fitz is None:
             return None, "Biblioteca PyMuPDF ausente"
 
         try:
@@ -348,7 +511,6 @@ class ComparisonWorker(QThread):
                             image_hash.update(image_bytes)
                             image_count += 1
 
-                file_hash = self._get_file_hash(file_path) or ""
                 props = (
                     doc.page_count,
                     metadata.get("author", "N/A"),
@@ -356,7 +518,6 @@ class ComparisonWorker(QThread):
                     text_hash.hexdigest(),
                     image_count,
                     image_hash.hexdigest() if image_count else "",
-                    file_hash,
                 )
                 return props, "OK"
         except (RuntimeError, ValueError, IOError) as exc:
@@ -364,3 +525,246 @@ class ComparisonWorker(QThread):
             return None, f"Erro: {exc}"
 
         return None, "Erro desconhecido"
+
+
+def _comparar_linhas(
+    file_type: str,
+    pares: List[Tuple[Optional[str], Optional[str]]],
+    conhecidas: Optional[Dict[str, Dict[str, Any]]] = None,
+    pasta_sobreposicao: Optional[str] = None,
+) -> Tuple[List[ResultadoComparacao], List[Dict[str, Any]]]:
+    """Compara os pares informados (alvo dos pools de execução).
+
+    Returns:
+        Tuple (resultado de cada par, impressões calculadas para o cache).
+    """
+    etapas = ComparisonSteps(conhecidas, pasta_sobreposicao)
+    resultados = [
+        etapas.comparar(path_a, path_b, file_type) for path_a, path_b in pares
+    ]
+    return resultados, list(etapas.alteradas.values())
+
+
+class ComparisonWorker(QThread):  # pylint: disable=too-many-instance-attributes
+    """Executa a comparação de arquivos em segundo plano, com linhas em paralelo.
+
+    STEP, IGES, DXF e PDF são lidos em um pool de processos; DWG (só hash) em
+    um pool de threads. Com ``parear_arquivos``, os arquivos das listas são
+    casados por nome e conteúdo (``pareamento_arquivos``); sem ele, a linha N
+    de A é comparada com a linha N de B. Cada par é emitido em ``pair_compared``
+    (linhas de A e B, -1 para o lado ausente) à medida que termina, não
+    necessariamente na ordem da tabela; ``row_compared`` continua sendo
+    emitido na comparação por posição. Com ``pasta_sobreposicao``, pares de
+    DXF diferentes geram ali um PDF com a sobreposição das entidades.
+    """
+
+    progress_updated = Signal(int)
+    row_compared = Signal(int, object, str, object, str, object)
+    pair_compared = Signal(int, int, object, str, object, str, object)
+    comparison_finished = Signal(bool)
+    error_occurred = Signal(str)
+
+    def __init__(
+        self,
+        files_a: List[str],
+        files_b: List[str],
+        file_type: str,
+        parent: Optional[QObject] = None,
+        max_workers: Optional[int] = None,
+        parear_arquivos: bool = False,
+        pasta_sobreposicao: Optional[str] = None,
+    ) -> None:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        super().__init__(parent)
+        self.files_a = files_a
+        self.files_b = files_b
+        self.file_type = file_type
+        self.max_workers = max(1, max_workers or MAX_COMPARACOES_PARALELAS)
+        self.parear_arquivos = parear_arquivos
+        self.pasta_sobreposicao = pasta_sobreposicao
+        self._is_interrupted = False
+        self._novas_impressoes: Dict[str, Dict[str, Any]] = {}
+
+    def stop(self) -> None:
+        """Sinaliza à thread que o processamento deve ser interrompido."""
+
+        self._is_interrupted = True
+
+    # pylint: disable=broad-except
+    def run(self) -> None:  # type: ignore[override]
+        """Percorre as listas e emite sinais conforme o progresso."""
+
+        try:
+            total = len(self.files_a) + len(self.files_b)
+            if total == 0:
+                self.comparison_finished.emit(self._is_interrupted)
+                return
+
+            cache = self._abrir_cache()
+            conhecidas = (
+                cache.obter_muitas(set(self.files_a) | set(self.files_b))
+                if cache is not None
+                else {}
+            )
+            etapas_cache = ComparisonSteps(conhecidas, self.pasta_sobreposicao)
+            concluidos = 0
+            try:
+                for (row_a, row_b), resultado in self._comparar(
+                    self._linhas(etapas_cache), etapas_cache
+                ):
+                    self.pair_compared.emit(row_a, row_b, *resultado)
+                    if not self.parear_arquivos:
+                        self.row_compared.emit(max(row_a, row_b), *resultado)
+                    concluidos += (row_a >= 0) + (row_b >= 0)
+                    self.progress_updated.emit(int((concluidos / total) * 100))
+            finally:
+                self._acumular_impressoes(list(etapas_cache.alteradas.values()))
+                if cache is not None:
+                    cache.gravar_muitas(self._novas_impressoes.values())
+                    cache.close()
+        except Exception as exc:  # pragma: no cover - salvaguarda
+            logging.error("Ocorreu um erro inesperado na thread de comparação.")
+            logging.error(traceback.format_exc())
+            self.error_occurred.emit(f"Ocorreu um erro crítico na comparação:\n{exc}")
+        finally:
+            self.comparison_finished.emit(self._is_interrupted)
+
+    @staticmethod
+    def _abrir_cache() -> Optional[CacheImpressoes]:
+        """Abre o cache de impressões; sem ele, todos os arquivos são lidos."""
+        try:
+            return CacheImpressoes()
+        except (sqlite3.Error, OSError) as exc:
+            logging.warning("Cache de comparação indisponível: %s", exc)
+            return None
+
+    def _linhas(self, etapas_cache: ComparisonSteps) -> Iterator[LinhaComparacao]:
+        """Produz as linhas a comparar, por pareamento ou por posição."""
+        if not self.parear_arquivos:
+            for index in range(max(len(self.files_a), len(self.files_b))):
+                path_a = self.files_a[index] if index < len(self.files_a) else None
+                path_b = self.files_b[index] if index < len(self.files_b) else None
+                yield (
+                    index if path_a else -1,
+                    index if path_b else -1,
+                    path_a,
+                    path_b,
+                )
+            return
+
+        for index_a, index_b, criterio in parear(
+            self.files_a, self.files_b, etapas_cache.hash_conteudo
+        ):
+            if self._is_interrupted:
+                return
+            path_a = self.files_a[index_a] if index_a is not None else None
+            path_b = self.files_b[index_b] if index_b is not None else None
+            if criterio:
+                logging.debug("Par por %s: '%s' x '%s'", criterio, path_a, path_b)
+            yield (
+                -1 if index_a is None else index_a,
+                -1 if index_b is None else index_b,
+                path_a,
+                path_b,
+            )
+
+    def _comparar(
+        self, linhas: Iterable[LinhaComparacao], etapas_cache: ComparisonSteps
+    ) -> Iterator[Tuple[Tuple[int, int], ResultadoComparacao]]:
+        """Compara as linhas, produzindo os resultados à medida que terminam.
+
+        As linhas são enviadas ao pool conforme chegam (o pareamento por
+        conteúdo pode demorar). Linhas cujos arquivos não mudaram desde a
+        última comparação são resolvidas pelo cache, sem ler os arquivos; no
+        pareamento, arquivos sem correspondente nem são lidos.
+        """
+        # Uma única linha não compensa o custo de iniciar um pool
+        em_linha = (
+            self.max_workers <= 1 or max(len(self.files_a), len(self.files_b)) <= 1
+        )
+        em_processo = _FILE_TYPES.get(self.file_type, {}).get("em_processo", False)
+        executor_cls = ProcessPoolExecutor if em_processo else ThreadPoolExecutor
+        executor = None
+        futuros: Dict[Future, Tuple[int, int]] = {}
+        try:
+            for row_a, row_b, path_a, path_b in linhas:
+                if self._is_interrupted:
+                    return
+                linha = (row_a, row_b)
+                if self.parear_arquivos and not (path_a and path_b):
+                    yield linha, (
+                        None,
+                        "OK" if path_a else "Sem par",
+                        None,
+                        "OK" if path_b else "Sem par",
+                        None,
+                    )
+                elif etapas_cache.em_cache(path_a, path_b, self.file_type):
+                    yield linha, etapas_cache.comparar(path_a, path_b, self.file_type)
+                elif em_linha:
+                    resultados, novas = _comparar_linhas(
+                        self.file_type,
+                        [(path_a, path_b)],
+                        etapas_cache.conhecidas(path_a, path_b),
+                        self.pasta_sobreposicao,
+                    )
+                    self._acumular_impressoes(novas)
+                    yield linha, resultados[0]
+                else:
+                    if executor is None:
+                        executor = executor_cls(max_workers=self.max_workers)
+                    futuro = executor.submit(
+                        _comparar_linhas,
+                        self.file_type,
+                        [(path_a, path_b)],
+                        etapas_cache.conhecidas(path_a, path_b),
+                        self.pasta_sobreposicao,
+                    )
+                    futuros[futuro] = linha
+                    yield from self._concluidos(futuros, bloquear=False)
+            while futuros and not self._is_interrupted:
+                yield from self._concluidos(futuros, bloquear=True)
+        finally:
+            if executor is not None:
+                # Ao cancelar, não espera as leituras em andamento (STEP/IGES
+                # podem levar minutos); os resultados delas são descartados
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _concluidos(
+        self, futuros: Dict[Future, Tuple[int, int]], bloquear: bool
+    ) -> Iterator[Tuple[Tuple[int, int], ResultadoComparacao]]:
+        """Retira de ``futuros`` as tarefas concluídas e produz seus resultados.
+
+        Com ``bloquear``, aguarda no máximo ``INTERVALO_CANCELAMENTO`` para que
+        o chamador volte a verificar o cancelamento.
+        """
+        feitos, _ = wait(
+            futuros,
+            timeout=INTERVALO_CANCELAMENTO if bloquear else 0,
+            return_when=FIRST_COMPLETED,
+        )
+        for futuro in feitos:
+            yield futuros.pop(futuro), self._resultado(futuro)
+
+    def _acumular_impressoes(self, novas: List[Dict[str, Any]]) -> None:
+        """Junta as impressões calculadas pelas tarefas para gravar no cache.
+
+        O mesmo arquivo pode aparecer em várias linhas, cada uma conhecendo só
+        parte da impressão (ex.: apenas o hash); os campos são combinados.
+        """
+        for nova in novas:
+            atual = self._novas_impressoes.setdefault(nova["chave"][0], {})
+            if atual.get("chave") != nova["chave"]:
+                atual.clear()
+            atual.update({campo: v for campo, v in nova.items() if v is not None})
+
+    def _resultado(self, futuro: Future) -> ResultadoComparacao:
+        """Obtém o resultado da linha, tratando a queda do processo auxiliar."""
+        try:
+            resultados, novas = futuro.result()
+            self._acumular_impressoes(novas)
+            return resultados[0]
+        except BrokenProcessPool as exc:
+            logging.error("Processo de comparação encerrado inesperadamente: %s", exc)
+            status = f"Processo de comparação encerrado: {exc}"
+            return None, status, None, status, None
@@ -20,7 +20,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from src.config import globals as g
 from src.models.models import Canal, Espessura, Material
 from src.utils import operacoes_crud
-from src.utils.banco_dados import get_session
+from src.utils.banco_dados import get_read_session, get_session
 from src.utils.calculos import buscar_deducao_por_parametros
 from src.utils.interface import (
     FormWidgetUpdater,
@@ -300,7 +300,7 @@ def buscar(tipo):
     table_widget.setRowCount(0)
 
     try:
-        with get_session() as session:
+        with get_read_session() as session:
             query = session.query(config["modelo"])
             if tipo == "dedução":
                 query = query.join(Material).join(Espessura).join(Canal)
@@ -8,6 +8,13 @@ entidades públicas originais de ``src.converters.worker``.
 
 from __future__ import annotations
 
-from src.converters import CONVERSION_HANDLERS, ConversionWorker
+from src.converters import ConversionWorker, get_conversion_handlers
 
-__all__ = ["CONVERSION_HANDLERS", "ConversionWorker"]
+__all__ = ["ConversionWorker", "get_conversion_handlers"]
+
+
+def __getattr__(nome: str):
+    """Resolve ``CONVERSION_HANDLERS`` apenas quando lido."""
+    if nome == "CONVERSION_HANDLERS":
+        return get_conversion_handlers()
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
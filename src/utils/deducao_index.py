@@ -0,0 +1,222 @@
+"""Índice em memória das deduções.
+
+Carrega de uma só vez a tabela de deduções (com material, espessura e canal
+já resolvidos) e a geometria dos canais, permitindo que os cálculos obtenham
+dedução, força e dados do canal com uma única consulta a dicionário, sem
+executar joins no banco a cada alteração da interface.
+
+Também mantém as adjacências usadas pelos comboboxes em cascata do cabeçalho:
+material -> espessuras e (material, espessura) -> canais que possuem dedução.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.models.models import Canal, Deducao, Espessura, Material
+from src.utils.banco_dados import get_read_session
+
+ChaveDeducao = Tuple[str, float, str]
+
+# Segundos sem nova tentativa de carga após uma falha do banco
+INTERVALO_NOVA_TENTATIVA = 10.0
+
+
+class DeducaoIndex:  # pylint: disable=too-many-instance-attributes
+    """Mapeia (material, espessura, canal) para dedução, força e canal."""
+
+    def __init__(self):
+        """Inicializa o índice vazio; a carga ocorre sob demanda."""
+        self._lock = threading.RLock()
+        self._deducoes: Dict[ChaveDeducao, Dict[str, Any]] = {}
+        self._canais: Dict[str, Dict[str, Any]] = {}
+        self._espessuras_por_material: Dict[str, List[float]] = {}
+        self._canais_por_material_espessura: Dict[Tuple[str, float], List[str]] = {}
+        self._loaded = False
+        self._stale = True
+        self._ultima_falha: Optional[float] = None
+        self.logger = logging.getLogger("deducao_index")
+
+    @staticmethod
+    def _chave(material_nome: str, espessura_valor: float, canal_valor: str):
+        """Normaliza os parâmetros de busca em uma chave do índice."""
+        return (str(material_nome), float(espessura_valor), str(canal_valor))
+
+    @staticmethod
+    def _canal_para_dict(canal) -> Dict[str, Any]:
+        """Converte uma linha de canal em dicionário de geometria."""
+        return {
+            "id": canal.id,
+            "valor": canal.valor,
+            "largura": canal.largura,
+            "altura": canal.altura,
+            "comprimento_total": canal.comprimento_total,
+            "observacao": canal.observacao,
+        }
+
+    def load(self) -> bool:
+        """(Re)constrói o índice com duas consultas ao banco.
+
+        Returns:
+            bool: True se o índice foi carregado; False se o banco falhou
+            (neste caso os dados anteriores, se houver, são mantidos).
+        """
+        try:
+            with get_read_session() as session:
+                canais = {
+                    c.valor: self._canal_para_dict(c)
+                    for c in session.query(
+                        Canal.id,
+                        Canal.valor,
+                        Canal.largura,
+                        Canal.altura,
+                        Canal.comprimento_total,
+                        Canal.observacao,
+                    )
+                }
+                linhas = (
+                    session.query(
+                        Deducao.id,
+                        Deducao.material_id,
+                        Deducao.espessura_id,
+                        Deducao.canal_id,
+                        Deducao.valor,
+                        Deducao.observacao,
+                        Deducao.forca,
+                        Material.nome.label("material_nome"),
+                        Espessura.valor.label("espessura_valor"),
+                        Canal.valor.label("canal_valor"),
+                    )
+                    .select_from(Deducao)
+                    .join(Material, Deducao.material_id == Material.id)
+                    .join(Espessura, Deducao.espessura_id == Espessura.id)
+                    .join(Canal, Deducao.canal_id == Canal.id)
+                    .all()
+                )
+        except SQLAlchemyError as e:
+            self.logger.warning("Falha ao carregar índice de deduções: %s", e)
+            return False
+
+        deducoes: Dict[ChaveDeducao, Dict[str, Any]] = {}
+        for d in linhas:
+            chave = self._chave(d.material_nome, d.espessura_valor, d.canal_valor)
+            deducoes[chave] = {
+                "id": d.id,
+                "material_id": d.material_id,
+                "espessura_id": d.espessura_id,
+                "canal_id": d.canal_id,
+                "valor": d.valor,
+                "observacao": d.observacao,
+                "forca": d.forca,
+                "canal": canais.get(d.canal_valor),
+            }
+
+        espessuras_por_material, canais_por_par = self._montar_adjacencias(deducoes)
+
+        with self._lock:
+            self._deducoes = deducoes
+            self._canais = canais
+            self._espessuras_por_material = espessuras_por_material
+            self._canais_por_material_espessura = canais_por_par
+            self._loaded = True
+            self._stale = False
+
+        self.logger.info(
+            "Índice de deduções carregado: %d deduções, %d canais",
+            len(deducoes),
+            len(canais),
+        )
+        return True
+
+    @staticmethod
+    def _montar_adjacencias(deducoes: Dict[ChaveDeducao, Dict[str, Any]]):
+        """Agrupa as chaves de dedução em listas ordenadas para os comboboxes."""
+        espessuras: Dict[str, set] = {}
+        canais: Dict[Tuple[str, float], set] = {}
+        for material, espessura, canal in deducoes:
+            espessuras.setdefault(material, set()).add(espessura)
+            canais.setdefault((material, espessura), set()).add(canal)
+        return (
+            {m: sorted(valores) for m, valores in espessuras.items()},
+            {par: sorted(valores) for par, valores in canais.items()},
+        )
+
+    def ensure_loaded(self) -> bool:
+        """Garante que o índice esteja atualizado, recarregando se necessário.
+
+        Após uma falha de carga (banco bloqueado ou inacessível), novas
+        tentativas só ocorrem depois de ``INTERVALO_NOVA_TENTATIVA``; até lá
+        os dados anteriores, se houver, continuam sendo servidos, para que
+        cada busca não espere o timeout do banco.
+
+        Returns:
+            bool: True se há dados disponíveis no índice.
+        """
+        with self._lock:
+            if not self._stale:
+                return True
+            if (
+                self._ultima_falha is not None
+                and time.monotonic() - self._ultima_falha < INTERVALO_NOVA_TENTATIVA
+            ):
+                return self._loaded
+        carregado = self.load()
+        with self._lock:
+            self._ultima_falha = None if carregado else time.monotonic()
+            return carregado or self._loaded
+
+    def invalidate(self):
+        """Marca o índice como desatualizado; a próxima busca o reconstrói."""
+        with self._lock:
+            self._stale = True
+            self._ultima_falha = None
+
+    def get_deducao(
+        self, material_nome: str, espessura_valor: float, canal_valor: str
+    ) -> Optional[Dict[str, Any]]:
+        """Retorna a entrada (valor, observação, força, canal) ou None."""
+        if not self.ensure_loaded():
+            return None
+        with self._lock:
+            return self._deducoes.get(
+                self._chave(material_nome, espessura_valor, canal_valor)
+            )
+
+    def get_canal(self, canal_valor: str) -> Optional[Dict[str, Any]]:
+        """Retorna a geometria do canal pelo seu valor ou None."""
+        if not self.ensure_loaded():
+            return None
+        with self._lock:
+            return self._canais.get(str(canal_valor))
+
+    def get_espessuras_material(self, material_nome: str) -> Optional[List[float]]:
+        """Espessuras (ordenadas) com dedução para o material; None sem índice."""
+        if not self.ensure_loaded():
+            return None
+        with self._lock:
+            return list(self._espessuras_por_material.get(str(material_nome), []))
+
+    def get_canais_material_espessura(
+        self, material_nome: str, espessura_valor: float
+    ) -> Optional[List[str]]:
+        """Canais (ordenados) com dedução para o par; None sem índice."""
+        if not self.ensure_loaded():
+            return None
+        with self._lock:
+            return list(
+                self._canais_por_material_espessura.get(
+                    (str(material_nome), float(espessura_valor)), []
+                )
+            )
+
+    @property
+    def loaded(self) -> bool:
+        """Indica se o índice já foi carregado ao menos uma vez."""
+        return self._loaded
+
+
+# Instância global do índice
+deducao_index = DeducaoIndex()
@@ -0,0 +1,208 @@
+"""Carregamento sob demanda das bibliotecas opcionais pesadas.
+
+ezdxf (e seus addons de desenho), Matplotlib, PyMuPDF, Pillow e pythonOCC
+levam segundos para importar e só são usados pelos formulários de conversão e
+comparação de arquivos. Cada dependência é descrita por uma função que faz os
+imports e retorna os símbolos necessários; a função só é executada na primeira
+consulta (``disponivel`` ou acesso a um símbolo), e o resultado fica em cache.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+logger = logging.getLogger("dependencias")
+
+
+class DependenciaOpcional:
+    """Dependência opcional importada apenas na primeira consulta.
+
+    Os símbolos retornados pela função de carga ficam acessíveis como atributos
+    (ex.: ``EZDXF.ezdxf``); se a biblioteca não estiver instalada, todos eles
+    valem None e ``disponivel`` é False.
+    """
+
+    def __init__(
+        self,
+        nome: str,
+        carregar: Callable[[], Dict[str, Any]],
+        requer: Sequence["DependenciaOpcional"] = (),
+    ):
+        """Registra a dependência sem importá-la.
+
+        Args:
+            nome: Nome exibido nos logs.
+            carregar: Função que importa a biblioteca e retorna seus símbolos.
+            requer: Dependências que precisam estar disponíveis antes desta.
+        """
+        self.nome = nome
+        self._carregar = carregar
+        self._requer = tuple(requer)
+        self._simbolos: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self.tempo_carga: Optional[float] = None
+
+    def _garantir(self) -> Dict[str, Any]:
+        """Executa a carga (uma única vez) e retorna os símbolos obtidos."""
+        if self._simbolos is not None:
+            return self._simbolos
+        with self._lock:
+            if self._simbolos is None:
+                inicio = time.perf_counter()
+                simbolos: Dict[str, Any] = {}
+                if all(dep.disponivel for dep in self._requer):
+                    try:
+                        simbolos = dict(self._carregar())
+                    except ImportError as e:
+                        logger.info("Dependência '%s' indisponível: %s", self.nome, e)
+                self.tempo_carga = time.perf_counter() - inicio
+                logger.debug(
+                    "Dependência '%s' carregada em %.1f ms (disponível: %s)",
+                    self.nome,
+                    self.tempo_carga * 1000,
+                    bool(simbolos),
+                )
+                self._simbolos = simbolos
+        return self._simbolos
+
+    @property
+    def disponivel(self) -> bool:
+        """Importa a biblioteca, se preciso, e indica se ela está instalada."""
+        return bool(self._garantir())
+
+    @property
+    def carregada(self) -> bool:
+        """Indica se a carga já foi tentada, sem dispará-la."""
+        return self._simbolos is not None
+
+    def __getattr__(self, item: str) -> Any:
+        """Retorna o símbolo importado, ou None se a biblioteca faltar."""
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return self._garantir().get(item)
+
+
+def _carregar_ezdxf() -> Dict[str, Any]:
+    # pylint: disable=import-outside-toplevel
+    import ezdxf  # type: ignore[import]
+    from ezdxf import bbox, path, recover  # type: ignore[attr-defined]
+    from ezdxf.math import BoundingBox  # type: ignore[attr-defined]
+
+    return {
+        "ezdxf": ezdxf,
+        "bbox": bbox,
+        "path": path,
+        "recover": recover,
+        "BoundingBox": BoundingBox,
+    }
+
+
+def _carregar_ezdxf_desenho() -> Dict[str, Any]:
+    # pylint: disable=import-outside-toplevel
+    from ezdxf.addons.drawing import Frontend, RenderContext  # type: ignore[import]
+    from ezdxf.addons.drawing.config import (  # type: ignore[import]
+        BackgroundPolicy,
+        ColorPolicy,
+    )
+    from ezdxf.addons.drawing.layout import (  # type: ignore[import]
+        BoundingBox2d,
+        Margins,
+        Page,
+        Settings,
+        Units,
+    )
+
+    return {
+        "Frontend": Frontend,
+        "RenderContext": RenderContext,
+        "BackgroundPolicy": BackgroundPolicy,
+        "ColorPolicy": ColorPolicy,
+        "BoundingBox2d": BoundingBox2d,
+        "Margins": Margins,
+        "Page": Page,
+        "Settings": Settings,
+        "Units": Units,
+    }
+
+
+def _carregar_backend_matplotlib() -> Dict[str, Any]:
+    # pylint: disable=import-outside-toplevel
+    import matplotlib.pyplot as plt  # type: ignore[import]
+    from ezdxf.addons.drawing.matplotlib import (  # type: ignore[import]
+        MatplotlibBackend,
+    )
+
+    return {"MatplotlibBackend": MatplotlibBackend, "plt": plt}
+
+
+def _carregar_backend_pymupdf() -> Dict[str, Any]:
+    # pylint: disable=import-outside-toplevel
+    from ezdxf.addons.drawing.pymupdf import PyMuPdfBackend  # type: ignore[import]
+
+    return {"PyMuPdfBackend": PyMuPdfBackend}
+
+
+def _carregar_fitz() -> Dict[str, Any]:
+    # pylint: disable=import-outside-toplevel
+    import fitz  # type: ignore[import]
+
+    return {"fitz": fitz}
+
+
+def _carregar_pil() -> Dict[str, Any]:
+    # pylint: disable=import-outside-toplevel
+    from PIL import Image, ImageSequence, UnidentifiedImageError
+
+    return {
+        "Image": Image,
+        "ImageSequence": ImageSequence,
+        "UnidentifiedImageError": UnidentifiedImageError,
+    }
+
+
+def _carregar_occ() -> Dict[str, Any]:
+    # pylint: disable=import-outside-toplevel
+    from OCC.Core.BRepGProp import brepgprop  # type: ignore[attr-defined]
+    from OCC.Core.GProp import GProp_GProps  # type: ignore[attr-defined]
+    from OCC.Core.IGESControl import IGESControl_Reader  # type: ignore[attr-defined]
+    from OCC.Core.STEPControl import STEPControl_Reader  # type: ignore[attr-defined]
+    from OCC.Core.TopAbs import (  # type: ignore[attr-defined]
+        TopAbs_EDGE,
+        TopAbs_FACE,
+        TopAbs_VERTEX,
+    )
+    from OCC.Core.TopExp import TopExp_Explorer  # type: ignore[attr-defined]
+
+    return {
+        "brepgprop": brepgprop,
+        "GProp_GProps": GProp_GProps,
+        "IGESControl_Reader": IGESControl_Reader,
+        "STEPControl_Reader": STEPControl_Reader,
+        "TopAbs_EDGE": TopAbs_EDGE,
+        "TopAbs_FACE": TopAbs_FACE,
+        "TopAbs_VERTEX": TopAbs_VERTEX,
+        "TopExp_Explorer": TopExp_Explorer,
+    }
+
+
+EZDXF = DependenciaOpcional("ezdxf", _carregar_ezdxf)
+EZDXF_DESENHO = DependenciaOpcional(
+    "ezdxf.addons.drawing", _carregar_ezdxf_desenho, requer=(EZDXF,)
+)
+BACKEND_MATPLOTLIB = DependenciaOpcional(
+    "backend Matplotlib", _carregar_backend_matplotlib, requer=(EZDXF_DESENHO,)
+)
+BACKEND_PYMUPDF = DependenciaOpcional(
+    "backend PyMuPDF", _carregar_backend_pymupdf, requer=(EZDXF_DESENHO,)
+)
+FITZ = DependenciaOpcional("PyMuPDF", _carregar_fitz)
+PIL = DependenciaOpcional("Pillow", _carregar_pil)
+OCC = DependenciaOpcional("pythonOCC", _carregar_occ)
+
+
+def cad_render_disponivel() -> bool:
+    """Indica se há ezdxf com ao menos um backend de renderização para PDF."""
+    return EZDXF_DESENHO.disponivel and (
+        BACKEND_PYMUPDF.disponivel or BACKEND_MATPLOTLIB.disponivel
+    )
@@ -0,0 +1,633 @@
+"""Diferença entre dois DXF no nível das entidades.
+
+Cada entidade do model space vira uma ``EntidadeGeometrica`` com a geometria
+quantizada pela tolerância: uma ``ancora`` (ponto de referência em células
+inteiras da grade) e uma ``forma`` (tipo, camada e geometria relativa à
+âncora, portanto independente da posição). As entidades são casadas por
+dicionários de hash espacial, em vez de comparar todas contra todas:
+
+1. mesma forma na mesma célula (ou em uma vizinha, para absorver o
+   arredondamento na borda das células): inalterada;
+2. nas sobras, medidas reais iguais dentro da tolerância e âncora numa célula
+   vizinha: inalterada (o arredondamento na borda também altera a forma);
+3. mesma forma em outra posição: movida, casando cada entidade com a mais
+   próxima ainda livre por uma busca em anéis numa grade mais grossa;
+4. o que sobra é removido (só em A) ou adicionado (só em B).
+
+O custo é linear no número de entidades (mais a ordenação da impressão
+geométrica), viável para planificações com dezenas de milhares de entidades.
+"""
+
+import hashlib
+import logging
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.dependencias import EZDXF, FITZ
+
+# pylint: disable=R0911,R0914
+
+# Tolerância (unidades do desenho) abaixo da qual duas medidas são iguais
+TOLERANCIA_PADRAO = 1e-3
+
+# Casas decimais de ângulos (graus), escalas e bulges nas formas
+CASAS_ANGULO = 3
+CASAS_FATOR = 6
+
+# Desvio máximo, em unidades do desenho, ao aproximar curvas na sobreposição
+DESVIO_CONTORNO = 0.05
+
+# Página A3 paisagem (pt) e margem da sobreposição em PDF
+TAMANHO_PAGINA = (1190.0, 842.0)
+MARGEM_PAGINA = 36.0
+
+# Cores (RGB 0-1) da sobreposição
+COR_INALTERADA = (0.75, 0.75, 0.75)
+COR_REMOVIDA = (0.85, 0.1, 0.1)
+COR_ADICIONADA = (0.1, 0.6, 0.1)
+COR_MOVIDA = (0.1, 0.3, 0.9)
+
+Celula = Tuple[int, int]
+Ponto = Tuple[float, float]
+
+
+@dataclass(eq=False)
+class EntidadeGeometrica:
+    """Entidade do DXF reduzida à geometria quantizada usada na comparação."""
+
+    tipo: str
+    handle: str
+    ancora: Celula
+    forma: tuple
+    posicao: Ponto
+    contornos: List[List[Ponto]] = field(default_factory=list)
+    # Valores sem quantizar (coordenadas absolutas), na ordem da forma
+    medidas: Tuple[float, ...] = ()
+
+
+@dataclass
+class DiferencaDxf:
+    """Resultado da comparação de entidades entre os arquivos A e B."""
+
+    inalteradas: List[EntidadeGeometrica] = field(default_factory=list)
+    removidas: List[EntidadeGeometrica] = field(default_factory=list)
+    adicionadas: List[EntidadeGeometrica] = field(default_factory=list)
+    movidas: List[Tuple[EntidadeGeometrica, EntidadeGeometrica]] = field(
+        default_factory=list
+    )
+
+    @property
+    def sem_diferencas(self) -> bool:
+        """Indica se todas as entidades foram casadas na mesma posição."""
+        return not (self.removidas or self.adicionadas or self.movidas)
+
+    def resumo(self) -> str:
+        """Texto curto com a contagem de cada categoria."""
+        return (
+            f"{len(self.adicionadas)} adicionada(s), {len(self.removidas)}"
+            f" removida(s), {len(self.movidas)} movida(s),"
+            f" {len(self.inalteradas)} inalterada(s)"
+        )
+
+
+def _q(valor: float, tolerancia: float) -> int:
+    return round(valor / tolerancia)
+
+
+def _xy(vetor) -> Ponto:
+    return float(vetor[0]), float(vetor[1])
+
+
+def _antes(ponto: Ponto, outro: Ponto, tolerancia: float) -> bool:
+    """Ordem lexicográfica em que coordenadas até a tolerância são iguais."""
+    for valor, referencia in zip(ponto, outro):
+        if abs(valor - referencia) > tolerancia:
+            return valor < referencia
+    return False
+
+
+def _pontos_relativos(
+    pontos: List[Ponto],
+    fechado: bool,
+    tolerancia: float,
+    extras: Optional[List[float]] = None,
+) -> Tuple[Celula, tuple, Tuple[float, ...]]:
+    """Âncora, coordenadas relativas quantizadas e medidas de uma sequência.
+
+    Linhas abertas são orientadas do menor para o maior extremo; nas fechadas,
+    a sequência começa no menor vértice. A ordem usa as coordenadas reais, com
+    tolerância, para que ruído abaixo dela não inverta a orientação (como
+    aconteceria comparando células). ``extras`` acompanha cada vértice (ex.:
+    bulge do segmento que parte dele).
+    """
+    extras = extras or [0.0] * len(pontos)
+    if fechado and pontos:
+        inicio = 0
+        for indice in range(1, len(pontos)):
+            if _antes(pontos[indice], pontos[inicio], tolerancia):
+                inicio = indice
+        pontos = pontos[inicio:] + pontos[:inicio]
+        extras = extras[inicio:] + extras[:inicio]
+    elif (
+        len(pontos) > 1
+        and _antes(pontos[-1], pontos[0], tolerancia)
+        and not any(extras)
+    ):
+        pontos = pontos[::-1]
+    celulas = [(_q(x, tolerancia), _q(y, tolerancia)) for x, y in pontos]
+    ancora = celulas[0] if celulas else (0, 0)
+    relativos = tuple(
+        (x - ancora[0], y - ancora[1], round(extra, CASAS_FATOR))
+        for (x, y), extra in zip(celulas, extras)
+    )
+    medidas = tuple(
+        valor for (x, y), extra in zip(pontos, extras) for valor in (x, y, extra)
+    )
+    return ancora, relativos, medidas
+
+
+def _geometria(entidade, tolerancia: float) -> Tuple[Celula, tuple, Tuple[float, ...]]:
+    """Âncora, forma (sem tipo e camada) e medidas de uma entidade do ezdxf."""
+    tipo = entidade.dxftype()
+    dxf = entidade.dxf
+
+    def q(valor: float) -> int:
+        return _q(valor, tolerancia)
+
+    def celula(vetor) -> Celula:
+        x, y = _xy(vetor)
+        return q(x), q(y)
+
+    if tipo == "LINE":
+        return _pontos_relativos([_xy(dxf.start), _xy(dxf.end)], False, tolerancia)
+    if tipo == "CIRCLE":
+        return celula(dxf.center), (q(dxf.radius),), (*_xy(dxf.center), dxf.radius)
+    if tipo == "ARC":
+        inicio, fim = dxf.start_angle % 360.0, dxf.end_angle % 360.0
+        return (
+            celula(dxf.center),
+            (q(dxf.radius), round(inicio, CASAS_ANGULO), round(fim, CASAS_ANGULO)),
+            (*_xy(dxf.center), dxf.radius, inicio, fim),
+        )
+    if tipo == "LWPOLYLINE":
+        vertices = list(entidade.get_points("xyb"))
+        ancora, relativos, medidas = _pontos_relativos(
+            [_xy(v) for v in vertices],
+            bool(entidade.closed),
+            tolerancia,
+            [float(v[2]) for v in vertices],
+        )
+        return ancora, (bool(entidade.closed), relativos), medidas
+    if tipo == "POLYLINE":
+        fechado = bool(entidade.is_closed)
+        ancora, relativos, medidas = _pontos_relativos(
+            [_xy(v) for v in entidade.points()], fechado, tolerancia
+        )
+        return ancora, (fechado, relativos), medidas
+    if tipo == "POINT":
+        return celula(dxf.location), (), _xy(dxf.location)
+    if tipo == "TEXT":
+        return (
+            celula(dxf.insert),
+            (dxf.text, q(dxf.height), round(dxf.rotation, CASAS_ANGULO)),
+            (*_xy(dxf.insert), dxf.height, dxf.rotation),
+        )
+    if tipo == "MTEXT":
+        return (
+            celula(dxf.insert),
+            (entidade.text, q(dxf.char_height), round(dxf.rotation, CASAS_ANGULO)),
+            (*_xy(dxf.insert), dxf.char_height, dxf.rotation),
+        )
+    if tipo == "INSERT":
+        return (
+            celula(dxf.insert),
+            (
+                dxf.name,
+                round(dxf.xscale, CASAS_FATOR),
+                round(dxf.yscale, CASAS_FATOR),
+                round(dxf.rotation, CASAS_ANGULO),
+            ),
+            (*_xy(dxf.insert), dxf.xscale, dxf.yscale, dxf.rotation),
+        )
+    if tipo == "ELLIPSE":
+        return (
+            celula(dxf.center),
+            (
+                celula(dxf.major_axis),
+                round(dxf.ratio, CASAS_FATOR),
+                round(dxf.start_param, CASAS_FATOR),
+                round(dxf.end_param, CASAS_FATOR),
+            ),
+            (
+                *_xy(dxf.center),
+                *_xy(dxf.major_axis),
+                dxf.ratio,
+                dxf.start_param,
+                dxf.end_param,
+            ),
+        )
+    if tipo == "SPLINE":
+        pontos = list(entidade.control_points) or list(entidade.fit_points)
+        ancora, relativos, medidas = _pontos_relativos(
+            [_xy(p) for p in pontos], False, tolerancia
+        )
+        return ancora, (dxf.degree, relativos), medidas
+
+    # Demais entidades: pelo retângulo envolvente, quando calculável
+    caixa = EZDXF.bbox.extents([entidade]) if EZDXF.bbox is not None else None
+    if caixa is None or not caixa.has_data:
+        return (0, 0), (), ()
+    ancora = celula(caixa.extmin)
+    maximo = celula(caixa.extmax)
+    return (
+        ancora,
+        (maximo[0] - ancora[0], maximo[1] - ancora[1]),
+        (*_xy(caixa.extmin), *_xy(caixa.extmax)),
+    )
+
+
+def _contornos(entidade, posicao: Ponto) -> List[List[Ponto]]:
+    """Polilinhas que aproximam a entidade, para desenhar a sobreposição."""
+    try:
+        caminho = EZDXF.path.make_path(entidade)
+        pontos = [_xy(v) for v in caminho.flattening(DESVIO_CONTORNO)]
+    except (TypeError, ValueError, AttributeError):
+        pontos = []
+    if len(pontos) > 1:
+        return [pontos]
+    # Texto, bloco ou ponto: uma pequena cruz na posição
+    x, y = posicao
+    d = 1.0
+    return [[(x - d, y), (x + d, y)], [(x, y - d), (x, y + d)]]
+
+
+def extrair_entidades(
+    msp,
+    tolerancia: float = TOLERANCIA_PADRAO,
+    com_contornos: bool = False,
+) -> List[EntidadeGeometrica]:
+    """Converte as entidades do model space em ``EntidadeGeometrica``.
+
+    Args:
+        msp: Model space de um documento do ezdxf.
+        tolerancia: Tamanho da célula da grade de quantização.
+        com_contornos: Se True, guarda também os contornos para a sobreposição.
+    """
+    entidades = []
+    for entidade in msp:
+        tipo = entidade.dxftype()
+        try:
+            ancora, geometria, medidas = _geometria(entidade, tolerancia)
+        except (AttributeError, TypeError, ValueError) as exc:
+            logging.debug("Entidade %s ignorada na geometria: %s", tipo, exc)
+            ancora, geometria, medidas = (0, 0), (), ()
+        posicao = (ancora[0] * tolerancia, ancora[1] * tolerancia)
+        entidades.append(
+            EntidadeGeometrica(
+                tipo=tipo,
+                handle=str(entidade.dxf.get("handle", "")),
+                ancora=ancora,
+                forma=(tipo, entidade.dxf.get("layer", "0"), geometria),
+                posicao=posicao,
+                contornos=_contornos(entidade, posicao) if com_contornos else [],
+                medidas=tuple(float(valor) for valor in medidas),
+            )
+        )
+    return entidades
+
+
+def ler_entidades(
+    path: str, tolerancia: float = TOLERANCIA_PADRAO, com_contornos: bool = False
+) -> List[EntidadeGeometrica]:
+    """Lê o DXF e retorna as entidades do model space.
+
+    Raises:
+        IOError, ezdxf.DXFStructureError: Se o arquivo não puder ser lido.
+    """
+    doc = EZDXF.ezdxf.readfile(path)
+    return extrair_entidades(doc.modelspace(), tolerancia, com_contornos)
+
+
+def impressao_geometrica(entidades: Iterable[EntidadeGeometrica]) -> str:
+    """Hash das entidades independente da ordem em que aparecem no arquivo.
+
+    Impressões iguais garantem entidades equivalentes, mas o arredondamento na
+    borda das células pode mudar a impressão sem diferença real; impressões
+    diferentes devem ser confirmadas com ``diferenciar``.
+    """
+    resumo = hashlib.blake2b(digest_size=16)
+    for linha in sorted(repr((e.forma, e.ancora)) for e in entidades):
+        resumo.update(linha.encode("utf-8"))
+        resumo.update(b"\n")
+    return resumo.hexdigest()
+
+
+def _vizinhas(celula: Celula, raio: int) -> Iterator[Celula]:
+    """Células no anel de Chebyshev de ``raio`` em torno de ``celula``."""
+    return _anel(celula, raio, (-math.inf, math.inf, -math.inf, math.inf))
+
+
+def _anel(
+    celula: Celula, raio: int, limites: Tuple[float, float, float, float]
+) -> Iterator[Celula]:
+    """Células do anel de ``raio`` em torno de ``celula`` dentro dos limites.
+
+    ``limites`` é (x mínimo, x máximo, y mínimo, y máximo) em células; o
+    recorte mantém o custo de cada anel proporcional ao tamanho da grade,
+    mesmo quando a origem está longe dela.
+    """
+    cx, cy = celula
+    x0, x1, y0, y1 = limites
+    if raio == 0:
+        if x0 <= cx <= x1 and y0 <= cy <= y1:
+            yield celula
+        return
+    xs = range(int(max(cx - raio, x0)), int(min(cx + raio, x1)) + 1)
+    for y in (cy - raio, cy + raio):
+        if y0 <= y <= y1:
+            for x in xs:
+                yield x, y
+    ys = range(int(max(cy - raio + 1, y0)), int(min(cy + raio - 1, y1)) + 1)
+    for x in (cx - raio, cx + raio):
+        if x0 <= x <= x1:
+            for y in ys:
+                yield x, y
+
+
+def _mais_proximas(
+    origem: List[EntidadeGeometrica], destino: List[EntidadeGeometrica]
+) -> Iterator[Tuple[EntidadeGeometrica, EntidadeGeometrica]]:
+    """Casa cada entidade de ``origem`` com a mais próxima livre em ``destino``.
+
+    O destino é indexado numa grade com cerca de uma entidade por célula; a
+    busca percorre anéis de células em torno da origem, a partir do primeiro
+    que alcança a grade, até que nenhum anel restante possa conter uma
+    entidade mais próxima que a melhor encontrada.
+    """
+    xs = [e.ancora[0] for e in destino]
+    ys = [e.ancora[1] for e in destino]
+    extensao = max(max(xs) - min(xs), max(ys) - min(ys), 1)
+    lado = max(1, int(extensao / math.sqrt(len(destino))))
+    grade: Dict[Celula, List[int]] = {}
+    for indice, entidade in enumerate(destino):
+        celula = (entidade.ancora[0] // lado, entidade.ancora[1] // lado)
+        grade.setdefault(celula, []).append(indice)
+    limites = (min(xs) // lado, max(xs) // lado, min(ys) // lado, max(ys) // lado)
+
+    livres = len(destino)
+    for entidade in origem:
+        if not livres:
+            return
+        ax, ay = entidade.ancora
+        cx, cy = ax // lado, ay // lado
+        raio_minimo = max(
+            limites[0] - cx, cx - limites[1], limites[2] - cy, cy - limites[3], 0
+        )
+        raio_maximo = max(
+            abs(cx - limites[0]),
+            abs(cx - limites[1]),
+            abs(cy - limites[2]),
+            abs(cy - limites[3]),
+        )
+        melhor_dist = math.inf
+        melhor: Optional[Tuple[int, Celula]] = None
+        for raio in range(raio_minimo, raio_maximo + 1):
+            for celula in _anel((cx, cy), raio, limites):
+                for indice in grade.get(celula, ()):
+                    bx, by = destino[indice].ancora
+                    distancia = (bx - ax) ** 2 + (by - ay) ** 2
+                    if distancia < melhor_dist:
+                        melhor_dist, melhor = distancia, (indice, celula)
+            # Entidades em anéis seguintes estão a pelo menos raio * lado
+            if melhor_dist <= (raio * lado) ** 2:
+                break
+        if melhor is None:
+            return
+        indice, celula = melhor
+        grade[celula].remove(indice)
+        livres -= 1
+        yield entidade, destino[indice]
+
+
+def _esqueleto(forma: tuple) -> tuple:
+    """Forma sem os valores numéricos (restam tipo, camada, textos, nomes...)."""
+    esqueleto = []
+    for valor in forma:
+        if isinstance(valor, tuple):
+            valor = _esqueleto(valor)
+        elif isinstance(valor, (int, float)) and not isinstance(valor, bool):
+            valor = None
+        esqueleto.append(valor)
+    return tuple(esqueleto)
+
+
+def _dentro_tolerancia(
+    entidade: EntidadeGeometrica, outra: EntidadeGeometrica, tolerancia: float
+) -> bool:
+    """Indica se as medidas reais das duas entidades diferem até a tolerância."""
+    return len(entidade.medidas) == len(outra.medidas) and all(
+        abs(a - b) <= tolerancia for a, b in zip(entidade.medidas, outra.medidas)
+    )
+
+
+def diferenciar(
+    entidades_a: List[EntidadeGeometrica],
+    entidades_b: List[EntidadeGeometrica],
+    tolerancia: float = TOLERANCIA_PADRAO,
+) -> DiferencaDxf:
+    """Casa as entidades de A e B e classifica as diferenças.
+
+    ``tolerancia`` deve ser a mesma usada na leitura das entidades.
+    """
+    diferenca = DiferencaDxf()
+
+    por_posicao: Dict[Tuple[tuple, Celula], List[EntidadeGeometrica]] = {}
+    for entidade in entidades_b:
+        por_posicao.setdefault((entidade.forma, entidade.ancora), []).append(entidade)
+
+    def casar(entidade: EntidadeGeometrica, celula: Celula) -> bool:
+        candidatas = por_posicao.get((entidade.forma, celula))
+        if not candidatas:
+            return False
+        candidatas.pop()
+        diferenca.inalteradas.append(entidade)
+        return True
+
+    sobras_a = [e for e in entidades_a if not casar(e, e.ancora)]
+    sobras_a = [
+        e
+        for e in sobras_a
+        if not any(casar(e, celula) for celula in _vizinhas(e.ancora, 1))
+    ]
+
+    # Perto da borda das células, ruído abaixo da tolerância muda também as
+    # coordenadas relativas (e a forma); as sobras são confirmadas pelas
+    # medidas reais, entre âncoras vizinhas de mesmo esqueleto
+    proximas: Dict[Tuple[tuple, Celula], List[EntidadeGeometrica]] = {}
+    for (forma, celula), candidatas in por_posicao.items():
+        if candidatas:
+            proximas.setdefault((_esqueleto(forma), celula), []).extend(candidatas)
+    casadas_proximas = set()
+
+    def casar_proxima(entidade: EntidadeGeometrica) -> bool:
+        esqueleto = _esqueleto(entidade.forma)
+        for raio in (0, 1):
+            for celula in _vizinhas(entidade.ancora, raio):
+                candidatas = proximas.get((esqueleto, celula), [])
+                for indice, candidata in enumerate(candidatas):
+                    if _dentro_tolerancia(entidade, candidata, tolerancia):
+                        casadas_proximas.add(id(candidatas.pop(indice)))
+                        diferenca.inalteradas.append(entidade)
+                        return True
+        return False
+
+    if proximas:
+        sobras_a = [e for e in sobras_a if not casar_proxima(e)]
+
+    sobras_b: Dict[tuple, List[EntidadeGeometrica]] = {}
+    for (forma, _), candidatas in por_posicao.items():
+        sobras_b.setdefault(forma, []).extend(
+            e for e in candidatas if id(e) not in casadas_proximas
+        )
+    por_forma: Dict[tuple, List[EntidadeGeometrica]] = {}
+    for entidade in sobras_a:
+        por_forma.setdefault(entidade.forma, []).append(entidade)
+
+    for forma, origem in por_forma.items():
+        destino = sobras_b.pop(forma, [])
+        casadas_b = set()
+        casadas_a = set()
+        if destino:
+            for entidade_a, entidade_b in _mais_proximas(origem, destino):
+                diferenca.movidas.append((entidade_a, entidade_b))
+                casadas_a.add(id(entidade_a))
+                casadas_b.add(id(entidade_b))
+        diferenca.removidas.extend(e for e in origem if id(e) not in casadas_a)
+        diferenca.adicionadas.extend(e for e in destino if id(e) not in casadas_b)
+    for restantes in sobras_b.values():
+        diferenca.adicionadas.extend(restantes)
+    return diferenca
+
+
+def comparar_arquivos(
+    path_a: str,
+    path_b: str,
+    tolerancia: float = TOLERANCIA_PADRAO,
+    com_contornos: bool = False,
+) -> DiferencaDxf:
+    """Lê os dois DXF e retorna a diferença entre suas entidades."""
+    return diferenciar(
+        ler_entidades(path_a, tolerancia, com_contornos),
+        ler_entidades(path_b, tolerancia, com_contornos),
+        tolerancia,
+    )
+
+
+def _operadores_sobreposicao(
+    camadas: List[Tuple[Tuple[float, float, float], List[EntidadeGeometrica]]],
+    movidas: List[Tuple[EntidadeGeometrica, EntidadeGeometrica]],
+    transformar,
+) -> bytes:
+    """Fluxo de conteúdo PDF com os contornos de cada camada e os deslocamentos.
+
+    Montado como texto de uma vez: desenhar dezenas de milhares de polilinhas
+    pela API de formas do PyMuPDF cresce de forma quadrática.
+    """
+
+    def trecho(pontos: List[Ponto]) -> str:
+        (x, y), *resto = (transformar(p) for p in pontos)
+        return f"{x:.2f} {y:.2f} m " + " ".join(f"{x:.2f} {y:.2f} l" for x, y in resto)
+
+    linhas = ["q 1 J 1 j 0.4 w"]
+    for (r, g, b), entidades in camadas:
+        linhas.append(f"{r:.3f} {g:.3f} {b:.3f} RG")
+        linhas.extend(
+            trecho(contorno) + " S"
+            for entidade in entidades
+            for contorno in entidade.contornos
+            if len(contorno) > 1
+        )
+    r, g, b = COR_MOVIDA
+    linhas.append(f"{r:.3f} {g:.3f} {b:.3f} RG 0.3 w [2] 0 d")
+    linhas.extend(
+        trecho([entidade_a.posicao, entidade_b.posicao]) + " S"
+        for entidade_a, entidade_b in movidas
+    )
+    linhas.append("Q")
+    return "\n".join(linhas).encode("ascii")
+
+
+def gerar_sobreposicao_pdf(
+    diferenca: DiferencaDxf, path_destino: str, titulo: str = ""
+) -> Optional[str]:
+    """Desenha as entidades de A e B sobrepostas em um PDF de uma página.
+
+    Inalteradas em cinza, removidas em vermelho, adicionadas em verde e
+    movidas em azul (na posição de B, com um traço até a posição de A). As
+    entidades precisam ter sido lidas com ``com_contornos``.
+
+    Returns:
+        O caminho do PDF gerado, ou None se o PyMuPDF faltar ou a gravação
+        falhar.
+    """
+    fitz = FITZ.fitz
+    if fitz is None:
+        return None
+
+    camadas = [
+        (COR_INALTERADA, diferenca.inalteradas),
+        (COR_REMOVIDA, diferenca.removidas),
+        (COR_ADICIONADA, diferenca.adicionadas),
+        (COR_MOVIDA, [b for _, b in diferenca.movidas]),
+    ]
+    pontos = [
+        p
+        for _, entidades in camadas
+        for entidade in entidades
+        for contorno in entidade.contornos
+        for p in contorno
+    ]
+    if not pontos:
+        return None
+    xmin = min(p[0] for p in pontos)
+    ymin = min(p[1] for p in pontos)
+    largura = max(max(p[0] for p in pontos) - xmin, 1e-9)
+    altura = max(max(p[1] for p in pontos) - ymin, 1e-9)
+    pagina_l, pagina_a = TAMANHO_PAGINA
+    escala = min(
+        (pagina_l - 2 * MARGEM_PAGINA) / largura,
+        (pagina_a - 3 * MARGEM_PAGINA) / altura,
+    )
+
+    def transformar(ponto: Ponto) -> Ponto:
+        # Espaço padrão do PDF: origem no canto inferior esquerdo, Y para cima
+        return (
+            MARGEM_PAGINA + (ponto[0] - xmin) * escala,
+            MARGEM_PAGINA + (ponto[1] - ymin) * escala,
+        )
+
+    try:
+        with fitz.open() as doc:
+            pagina = doc.new_page(width=pagina_l, height=pagina_a)
+            xref = doc.get_new_xref()
+            doc.update_object(xref, "<< >>")
+            doc.update_stream(
+                xref, _operadores_sobreposicao(camadas, diferenca.movidas, transformar)
+            )
+            pagina.set_contents(xref)
+            legenda = (
+                f"{titulo}  —  cinza: inalteradas  vermelho: removidas"
+                f"  verde: adicionadas  azul: movidas  ({diferenca.resumo()})"
+            )
+            pagina.insert_text(
+                (MARGEM_PAGINA, MARGEM_PAGINA), legenda.strip(" —"), fontsize=8
+            )
+            doc.save(path_destino, garbage=3, deflate=True)
+        return path_destino
+    except (RuntimeError, ValueError, OSError) as exc:
+        logging.warning("Falha ao gerar a sobreposição '%s': %s", path_destino, exc)
+        if os.path.exists(path_destino):
+            os.remove(path_destino)
+        return None
@@ -413,6 +413,30 @@ def _get_line_edit_style(theme: str = "light") -> str:
     QLineEdit:focus {{
         border: 1px solid palette(highlight);
     }}
+
+    QLineEdit[estado="erro"] {{
+        color: red;
+    }}
+
+    QLineEdit[estado="invalida"] {{
+        color: white;
+        background-color: red;
+    }}
+
+    QLineEdit[estado="invalida"]:hover,
+    QLineEdit[estado="invalida"]:focus {{
+        border: 1px solid darkred;
+    }}
+
+    QLineEdit[estado="alerta"] {{
+        color: red;
+    }}
+
+    /* Tooltips das abas seguem o tema, qualquer que seja o estado da aba */
+    QToolTip {{
+        color: palette(text);
+        background-color: palette(base);
+    }}
     """
 
 
@@ -430,6 +454,22 @@ def _get_label_style() -> str:
         font-weight: bold;
     }}
 
+    QLabel[estado="erro"] {{
+        color: red;
+    }}
+
+    QLabel[estado="aviso"] {{
+        color: orange;
+    }}
+
+    QLabel[estado="info"] {{
+        color: blue;
+    }}
+
+    QLabel[estado="copiado"] {{
+        color: green;
+    }}
+
     QLabel#label_titulo {{
         font-size: 10pt;
         color: palette(window-text);
@@ -0,0 +1,98 @@
+"""Grafo de cálculo incremental com rastreamento de dependências.
+
+Cada nó declara as entradas (fontes ou outros nós) de que depende e só é
+reavaliado quando alguma delas muda de valor. Fontes recebem valores de fora
+(ex.: o texto de um campo da interface); nós calculam a partir dos valores
+atuais do grafo. Nós marcados como externos dependem também de dados fora do
+grafo (banco, índice de deduções) e podem ser invalidados em conjunto.
+
+Os nós devem ser adicionados depois das suas entradas, de modo que a ordem de
+inserção já é uma ordem topológica válida.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Set
+
+
+class GrafoCalculo:
+    """Avalia apenas os nós afetados pelas fontes alteradas."""
+
+    def __init__(self):
+        """Inicializa o grafo vazio."""
+        self._valores: Dict[str, Any] = {}
+        self._fontes: Set[str] = set()
+        self._nos: Dict[str, Callable[[Mapping[str, Any]], Any]] = {}
+        self._dependentes: Dict[str, List[str]] = {}
+        self._externos: Set[str] = set()
+        self._sujos: Set[str] = set()
+
+    def adicionar_fonte(self, nome: str, valor: Any = None):
+        """Registra uma fonte de dados com seu valor inicial."""
+        self._fontes.add(nome)
+        self._valores[nome] = valor
+        self._dependentes.setdefault(nome, [])
+
+    def adicionar_no(
+        self,
+        nome: str,
+        entradas: Sequence[str],
+        funcao: Callable[[Mapping[str, Any]], Any],
+        externo: bool = False,
+    ):
+        """Registra um nó calculado; ele é avaliado na próxima chamada a ``avaliar``.
+
+        Args:
+            nome: Nome do nó.
+            entradas: Fontes ou nós (já registrados) lidos pela função.
+            funcao: Recebe os valores atuais do grafo e retorna o valor do nó.
+            externo: Se True, o nó é reavaliado por ``invalidar_externos``.
+        """
+        for entrada in entradas:
+            if entrada not in self._dependentes:
+                raise KeyError(f"Entrada desconhecida para o nó '{nome}': {entrada}")
+            self._dependentes[entrada].append(nome)
+        self._nos[nome] = funcao
+        self._dependentes.setdefault(nome, [])
+        if externo:
+            self._externos.add(nome)
+        self._sujos.add(nome)
+
+    def definir(self, nome: str, valor: Any) -> bool:
+        """Atualiza o valor de uma fonte.
+
+        Returns:
+            bool: True se o valor mudou (e os dependentes foram marcados).
+        """
+        if nome not in self._fontes:
+            raise KeyError(f"Fonte desconhecida: {nome}")
+        if self._valores.get(nome) == valor:
+            return False
+        self._valores[nome] = valor
+        self._sujos.update(self._dependentes[nome])
+        return True
+
+    def invalidar_externos(self):
+        """Marca para reavaliação os nós que dependem de dados externos."""
+        self._sujos.update(self._externos)
+
+    def valor(self, nome: str) -> Any:
+        """Retorna o valor atual de uma fonte ou nó."""
+        return self._valores.get(nome)
+
+    def avaliar(self) -> List[str]:
+        """Reavalia, em ordem topológica, os nós cujas entradas mudaram.
+
+        Returns:
+            List[str]: Nós cujo valor mudou nesta avaliação.
+        """
+        alterados = []
+        for nome, funcao in self._nos.items():
+            if nome not in self._sujos:
+                continue
+            novo = funcao(self._valores)
+            self._sujos.discard(nome)
+            if nome in self._valores and self._valores[nome] == novo:
+                continue
+            self._valores[nome] = novo
+            self._sujos.update(self._dependentes[nome])
+            alterados.append(nome)
+        return alterados
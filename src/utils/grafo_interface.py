@@ -0,0 +1,528 @@
+"""
+Grafo de cálculo da calculadora principal.
+
+Liga os widgets do cabeçalho e das colunas de dobras ao ``GrafoCalculo``:
+cada resultado da interface (dedução, fator K, aba mínima, Z mínimo, razão
+RI/E, força e medidas de dobra) é um nó reavaliado apenas quando as suas
+entradas mudam.
+"""
+
+import logging
+import traceback
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.config import globals as g
+from src.utils import calculos
+from src.utils.grafo_calculo import GrafoCalculo
+from src.utils.utilitarios import obter_caminho_asset
+from src.utils.widget import WidgetDiffUpdater, WidgetManager
+
+# pylint: disable=R0902
+
+
+@dataclass
+class UIData:
+    """Estrutura para armazenar os dados coletados da interface."""
+
+    material_nome: str
+    espessura_str: str
+    canal_str: str
+    raio_interno_str: str
+    comprimento_str: str
+    deducao_espec_str: str
+    espessura: float
+    raio_interno: float
+    comprimento: float
+    deducao_espec: float
+    deducao_usada: float = 0.0
+
+
+# Fontes do grafo de cálculo lidas dos widgets do cabeçalho
+FONTES_CABECALHO = {
+    "material": "MAT_COMB",
+    "espessura": "ESP_COMB",
+    "canal": "CANAL_COMB",
+    "raio_interno": "RI_ENTRY",
+    "comprimento": "COMPR_ENTRY",
+    "deducao_espec": "DED_ESPEC_ENTRY",
+}
+
+
+def coletar_dados_entrada() -> UIData:
+    """Coleta todos os dados de entrada da UI."""
+    return _dados_do_grafo(
+        {
+            nome: WidgetManager.get_widget_value(getattr(g, widget_nome, None))
+            for nome, widget_nome in FONTES_CABECALHO.items()
+        }
+    )
+
+
+def _dados_do_grafo(valores) -> UIData:
+    """Monta os dados de entrada a partir dos valores das fontes do grafo."""
+    return UIData(
+        material_nome=valores["material"],
+        espessura_str=valores["espessura"],
+        canal_str=valores["canal"],
+        raio_interno_str=valores["raio_interno"],
+        comprimento_str=valores["comprimento"],
+        deducao_espec_str=valores["deducao_espec"],
+        espessura=calculos.converter_para_float(valores["espessura"]),
+        raio_interno=calculos.converter_para_float(valores["raio_interno"]),
+        comprimento=calculos.converter_para_float(valores["comprimento"]),
+        deducao_espec=calculos.converter_para_float(valores["deducao_espec"]),
+    )
+
+
+def _atualizar_label(
+    label,
+    valor,
+    formato="{:.2f}",
+    estado_sucesso="",
+    estado_erro="erro",
+):
+    """Função genérica para atualizar um QLineEdit ou QLabel.
+
+    Os estados são valores da propriedade dinâmica ``estado`` (ver
+    ``WidgetDiffUpdater``); o Qt só é acionado quando texto ou estado mudam.
+    """
+    if not WidgetManager.is_widget_valid(label):
+        return
+    if valor is None or valor == "":
+        texto, estado = "", estado_sucesso
+    elif isinstance(valor, str) and valor == "N/A":
+        texto, estado = "N/A", estado_erro
+    else:
+        try:
+            texto = formato.format(float(valor))
+        except (ValueError, TypeError):
+            texto = str(valor)
+        estado = estado_sucesso
+    WidgetDiffUpdater.set_text(label, texto)
+    WidgetDiffUpdater.set_state(label, estado)
+
+
+def _atualizar_deducao_ui(data: UIData) -> float:
+    """Busca a dedução no DB, atualiza a UI e retorna a dedução a ser usada."""
+    res_db = calculos.CalculoDeducaoDB().buscar(
+        data.material_nome, data.espessura_str, data.canal_str
+    )
+    deducao_db_valor = ""
+    if res_db:
+        valor = (
+            res_db.get("valor")
+            if hasattr(res_db, "get")
+            else getattr(res_db, "valor", None)
+        )
+        obs = (
+            res_db.get("obs", "")
+            if hasattr(res_db, "get")
+            else getattr(res_db, "obs", "")
+        )
+        _atualizar_label(g.DED_LBL, valor, formato="{:.2f}")
+        if g.OBS_LBL:
+            WidgetDiffUpdater.set_text(g.OBS_LBL, obs)
+        deducao_db_valor = str(valor or "")
+    else:
+        _atualizar_label(g.DED_LBL, None)
+        if g.OBS_LBL:
+            WidgetDiffUpdater.set_text(g.OBS_LBL, "")
+
+    return (
+        data.deducao_espec
+        if data.deducao_espec > 0
+        else calculos.converter_para_float(deducao_db_valor)
+    )
+
+
+def estilo_fator_k(data: UIData):
+    """Define o tooltip do Fator K e retorna o estado visual dos seus labels."""
+    if not g.K_LBL or g.K_LBL.text() == "":
+        if g.K_LBL:
+            WidgetDiffUpdater.set_tooltip(
+                g.K_LBL,
+                "Fator K calculado com base no raio interno. Clique para copiar.",
+            )
+        return ""
+    if data.deducao_espec > 0:
+        WidgetDiffUpdater.set_tooltip(
+            g.K_LBL, "Fator K calculado com dedução específica. Clique para copiar."
+        )
+        return "info"
+    if not data.canal_str:
+        WidgetDiffUpdater.set_tooltip(
+            g.K_LBL,
+            "Fator K teórico com base na tabela Raio/Espessura. Clique para copiar.",
+        )
+        return "aviso"
+    WidgetDiffUpdater.set_tooltip(
+        g.K_LBL, "Fator K calculado com base no raio interno. Clique para copiar."
+    )
+    return ""
+
+
+def _atualizar_k_offset_ui(data: UIData, deducao_usada: float):
+    """Calcula e atualiza os campos de Fator K e Offset."""
+    res_k = (
+        calculos.CalculoFatorK().calcular(
+            data.espessura, data.raio_interno, deducao_usada, data.material_nome
+        )
+        if data.espessura > 0 and data.raio_interno > 0
+        else None
+    )
+    estado = estilo_fator_k(data)
+    _atualizar_label(
+        g.K_LBL,
+        (
+            res_k.get("fator_k")
+            if res_k
+            else ("N/A" if data.espessura > 0 and data.raio_interno > 0 else None)
+        ),
+        estado_sucesso=estado,
+    )
+    _atualizar_label(
+        g.OFFSET_LBL,
+        (
+            res_k.get("offset")
+            if res_k
+            else ("N/A" if data.espessura > 0 and data.raio_interno > 0 else None)
+        ),
+        estado_sucesso=estado,
+    )
+
+
+def _atualizar_aba_minima_ui(data: UIData) -> float:
+    """Calcula e atualiza a Aba Mínima e retorna o seu valor."""
+    aba_min = calculos.CalculoAbaMinima().calcular(data.canal_str, data.espessura)
+    _atualizar_label(
+        g.ABA_EXT_LBL,
+        aba_min if data.canal_str and data.espessura > 0 else None,
+        formato="{:.0f}",
+    )
+    return float(aba_min) if aba_min is not None else 0.0
+
+
+def _atualizar_z_minimo_ui(data: UIData, deducao_usada: float):
+    """Calcula e atualiza o Z Mínimo."""
+    z_min = calculos.CalculoZMinimo().calcular(
+        data.espessura, deducao_usada, data.canal_str
+    )
+    _atualizar_label(
+        g.Z_EXT_LBL,
+        z_min if data.espessura > 0 and data.canal_str else None,
+        formato="{:.0f}",
+    )
+
+
+def _atualizar_razao_rie_ui(data: UIData):
+    """Calcula e atualiza a Razão RI/E."""
+    razao = calculos.CalculoRazaoRIE().calcular(data.espessura, data.raio_interno)
+    _atualizar_label(
+        g.RAZAO_RIE_LBL,
+        razao if data.espessura > 0 and data.raio_interno > 0 else None,
+        formato="{:.1f}",
+    )
+
+
+def _atualizar_forca_ui(data: UIData):
+    """Calcula e atualiza o campo de Força."""
+    if data.material_nome and data.espessura_str and data.canal_str:
+        res_forca = calculos.CalculoForca().calcular(
+            data.comprimento, data.espessura, data.material_nome, data.canal_str
+        )
+        forca_valor = res_forca.get("forca") if res_forca else "N/A"
+        _atualizar_label(g.FORCA_LBL, forca_valor, formato="{:.0f}")
+
+        # Aplicar cor baseada no valor da força
+        if WidgetManager.is_widget_valid(g.FORCA_LBL):
+            estado = ""  # Cor original (também se inválido ou N/A)
+            if forca_valor != "N/A":
+                try:
+                    forca_num = float(forca_valor)
+                    if 250 < forca_num <= 280:
+                        estado = "aviso"
+                    elif forca_num > 280:
+                        estado = "erro"
+                except (ValueError, TypeError):
+                    pass
+            WidgetDiffUpdater.set_state(g.FORCA_LBL, estado)
+
+        compr_total = res_forca.get("comprimento_total") if res_forca else None
+        excedido = (
+            data.comprimento > 0
+            and compr_total is not None
+            and data.comprimento >= compr_total
+        )
+        if g.COMPR_ENTRY:
+            WidgetDiffUpdater.set_state(g.COMPR_ENTRY, "erro" if excedido else "")
+    else:
+        _atualizar_label(g.FORCA_LBL, None)
+        if g.COMPR_ENTRY:
+            WidgetDiffUpdater.set_state(g.COMPR_ENTRY, "")
+
+
+def _ler_valores_coluna(w: int):
+    """Lê os valores das abas de uma coluna de dobras."""
+    return [
+        calculos.converter_para_float(
+            WidgetManager.get_widget_value(getattr(g, f"aba{i}_entry_{w}", None))
+        )
+        for i in range(1, g.N)
+    ]
+
+
+def _calcular_colunas_dobras(
+    colunas: Sequence[int],
+    matriz: Sequence[Sequence[float]],
+    deducao_usada: float,
+    aba_min: float,
+):
+    """Calcula várias colunas de dobras em um único lote e atualiza a UI."""
+    lote = calculos.CalculoDobraLote()
+    resultado = lote.calcular(matriz, deducao_usada)
+    for linha, (w, valores) in enumerate(zip(colunas, matriz)):
+        _atualizar_coluna_dobras_ui(
+            w, valores, lote.resultado_linha(resultado, linha), aba_min
+        )
+
+
+@lru_cache(maxsize=1)
+def _tooltip_bandeja() -> str:
+    """Tooltip (HTML com imagem) do alerta de alívio de dobra para bandeja."""
+    img_path = obter_caminho_asset("assets/canto_bandeja.PNG").replace("\\", "/")
+    return (
+        "<html><table width='200'><tr><td align='center'>"
+        "Se necessário o uso da ferramenta <b>'bigode'</b>, "
+        "adicionar alívio de dobra "
+        "se aba <b><span style='color:red;'>maior que 20mm</span></b>.<br>"
+        f"<img src='{img_path}' width='200'></td></tr></table></html>"
+    )
+
+
+# pylint: disable=R0914
+
+
+def _atualizar_coluna_dobras_ui(w: int, valores, res, aba_min: float):
+    """Atualiza uma coluna inteira de dobras na UI com o resultado calculado."""
+    total_abas = res.get("total_abas", 0) if res else 0
+    blank = res.get("blank_total", 0) if res else 0
+
+    # Verifica status das abas para lógica de bandeja
+    abas_1_3_preenchidas = len(valores) >= 3 and all(v > 0 for v in valores[:3])
+    abas_1_5_preenchidas = len(valores) >= 5 and all(v > 0 for v in valores[:5])
+
+    for i in range(1, g.N):
+        medida = res["resultados"][i - 1].get("medida") if res else None
+        metade = res["resultados"][i - 1].get("metade") if res else None
+        _atualizar_label(getattr(g, f"medidadobra{i}_label_{w}", None), medida)
+        _atualizar_label(getattr(g, f"metadedobra{i}_label_{w}", None), metade)
+
+        entry = getattr(g, f"aba{i}_entry_{w}", None)
+        if WidgetManager.is_widget_valid(entry):
+            val = valores[i - 1]
+            invalida = aba_min is not None and 0 < val < aba_min
+
+            # Alerta de bandeja: Apenas Aba 1 (se 1-3 estiverem ok)
+            # e Aba 5 (se 1-5 estiverem ok), se valor > 20
+            alerta_bandeja = val > 20 and (
+                (i == 1 and abas_1_3_preenchidas) or (i == 5 and abas_1_5_preenchidas)
+            )
+
+            if invalida:
+                estado = "invalida"
+                tooltip = (
+                    f"Aba <b><span style='background-color:red; color:white;'>"
+                    f"{val:.0f}mm</span></b> menor que a mínima <b>{aba_min:.0f}mm</b>."
+                )
+            elif alerta_bandeja:
+                estado = "alerta"
+                tooltip = _tooltip_bandeja()
+            else:
+                estado = ""
+                tooltip = f"Digite o valor da medida externa para a dobra {i} (Use ↑↓ para navegar)"
+            WidgetDiffUpdater.set_state(entry, estado)
+            WidgetDiffUpdater.set_tooltip(entry, tooltip)
+
+    _atualizar_label(
+        getattr(g, f"total_abas_label_{w}", None),
+        total_abas if total_abas > 0 else None,
+    )
+    _atualizar_label(
+        getattr(g, f"medida_blank_label_{w}", None), blank if blank > 0 else None
+    )
+    _atualizar_label(
+        getattr(g, f"metade_blank_label_{w}", None), blank / 2 if blank > 0 else None
+    )
+
+
+class GrafoInterface:
+    """Grafo de cálculo incremental da calculadora principal.
+
+    Fontes: campos do cabeçalho e cada aba de cada coluna de dobras. Nós:
+    dedução, fator K/offset, aba mínima, Z mínimo, razão RI/E, força, uma
+    coluna de dobras por valor de W e o nó ``dobras``, que recalcula em um só
+    lote as colunas cujas entradas mudaram. Editar uma aba reavalia apenas a
+    sua coluna; nós que consultam o índice de deduções são reavaliados a cada
+    ``calcular_valores`` completo.
+    """
+
+    def __init__(self):
+        """Inicializa sem grafo; ele é montado na primeira avaliação."""
+        self._grafo: Optional[GrafoCalculo] = None
+        self._estrutura = None
+        self._geracao = 0
+        self._colunas: Dict[Any, tuple] = {}
+
+    def invalidar(self):
+        """Descarta o grafo atual; chamado quando a interface é recriada."""
+        self._geracao += 1
+
+    def _estrutura_atual(self):
+        """Identifica o conjunto de widgets atual (muda ao recarregar a interface)."""
+        return (
+            tuple(getattr(g, "VALORES_W", []) or []),
+            getattr(g, "N", 0),
+            self._geracao,
+        )
+
+    def _montar(self) -> GrafoCalculo:
+        """Cria as fontes e os nós para os widgets atuais."""
+        self._colunas = {}
+        grafo = GrafoCalculo()
+        for nome in FONTES_CABECALHO:
+            grafo.adicionar_fonte(nome, "")
+
+        grafo.adicionar_no(
+            "deducao_usada",
+            ["material", "espessura", "canal", "deducao_espec"],
+            lambda v: _atualizar_deducao_ui(_dados_do_grafo(v)),
+            externo=True,
+        )
+        grafo.adicionar_no(
+            "fator_k",
+            ["material", "espessura", "canal", "raio_interno", "deducao_espec"]
+            + ["deducao_usada"],
+            lambda v: _atualizar_k_offset_ui(_dados_do_grafo(v), v["deducao_usada"]),
+            externo=True,
+        )
+        grafo.adicionar_no(
+            "aba_min",
+            ["canal", "espessura"],
+            lambda v: _atualizar_aba_minima_ui(_dados_do_grafo(v)),
+        )
+        grafo.adicionar_no(
+            "z_min",
+            ["espessura", "canal", "deducao_usada"],
+            lambda v: _atualizar_z_minimo_ui(_dados_do_grafo(v), v["deducao_usada"]),
+            externo=True,
+        )
+        grafo.adicionar_no(
+            "razao_rie",
+            ["espessura", "raio_interno"],
+            lambda v: _atualizar_razao_rie_ui(_dados_do_grafo(v)),
+        )
+        grafo.adicionar_no(
+            "forca",
+            ["material", "espessura", "canal", "comprimento"],
+            lambda v: _atualizar_forca_ui(_dados_do_grafo(v)),
+            externo=True,
+        )
+
+        colunas = list(getattr(g, "VALORES_W", []) or [])
+        for w in colunas:
+            abas = [f"aba{i}_{w}" for i in range(1, g.N)]
+            for nome in abas:
+                grafo.adicionar_fonte(nome, 0.0)
+            grafo.adicionar_no(
+                f"coluna_{w}",
+                abas,
+                partial(GrafoInterface._valores_coluna, abas),
+            )
+        grafo.adicionar_no(
+            "dobras",
+            [f"coluna_{w}" for w in colunas] + ["deducao_usada", "aba_min"],
+            partial(self._avaliar_dobras, colunas),
+        )
+        return grafo
+
+    @staticmethod
+    def _valores_coluna(abas: List[str], valores) -> tuple:
+        """Nó de uma coluna: lê as abas do grafo, não dos widgets."""
+        return tuple(valores[nome] for nome in abas)
+
+    def _avaliar_dobras(self, colunas: List[Any], valores) -> Dict[Any, tuple]:
+        """Recalcula, em um único lote, as colunas cujas entradas mudaram."""
+        deducao_usada, aba_min = valores["deducao_usada"], valores["aba_min"]
+        entradas = {
+            w: (valores[f"coluna_{w}"], deducao_usada, aba_min) for w in colunas
+        }
+        sujas = [w for w in colunas if self._colunas.get(w) != entradas[w]]
+        if sujas:
+            _calcular_colunas_dobras(
+                sujas,
+                [list(entradas[w][0]) for w in sujas],
+                deducao_usada,
+                aba_min,
+            )
+            self._colunas.update({w: entradas[w] for w in sujas})
+        return entradas
+
+    def grafo(self) -> GrafoCalculo:
+        """Retorna o grafo, remontando-o se os widgets foram recriados."""
+        estrutura = self._estrutura_atual()
+        if self._grafo is None or estrutura != self._estrutura:
+            self._grafo = self._montar()
+            self._estrutura = estrutura
+        return self._grafo
+
+    def calcular_tudo(self):
+        """Sincroniza todas as fontes com os widgets e reavalia o necessário."""
+        grafo = self.grafo()
+        for nome, widget_nome in FONTES_CABECALHO.items():
+            grafo.definir(
+                nome, WidgetManager.get_widget_value(getattr(g, widget_nome, None))
+            )
+        for w in getattr(g, "VALORES_W", []) or []:
+            for i, valor in enumerate(_ler_valores_coluna(w), start=1):
+                grafo.definir(f"aba{i}_{w}", valor)
+        grafo.invalidar_externos()
+        grafo.avaliar()
+
+    def atualizar_aba(self, w, i: int, texto: str):
+        """Atualiza uma única aba e reavalia apenas a sua coluna."""
+        if self._grafo is None or self._estrutura != self._estrutura_atual():
+            # Grafo novo: as fontes ainda não refletem os widgets
+            self.calcular_tudo()
+            return
+        grafo = self._grafo
+        nome = f"aba{i}_{w}"
+        if grafo.valor(nome) is None:
+            return
+        if grafo.definir(nome, calculos.converter_para_float(texto)):
+            grafo.avaliar()
+
+
+grafo_interface = GrafoInterface()
+
+
+def calcular_valores():
+    """Função principal que orquestra todos os cálculos e atualizações da UI.
+
+    O grafo de cálculo reavalia apenas os resultados cujas entradas mudaram.
+    """
+    try:
+        grafo_interface.calcular_tudo()
+    except (AttributeError, ValueError, TypeError, SQLAlchemyError) as e:
+        logging.error("Erro em calcular_valores: %s\n%s", e, traceback.format_exc())
+
+
+def atualizar_aba(w, i: int, texto: str):
+    """Recalcula somente a coluna da aba editada (conectado a ``textChanged``)."""
+    try:
+        grafo_interface.atualizar_aba(w, i, texto)
+    except (AttributeError, ValueError, TypeError, SQLAlchemyError) as e:
+        logging.error("Erro em atualizar_aba: %s\n%s", e, traceback.format_exc())
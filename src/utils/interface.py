@@ -3,15 +3,13 @@ Módulo de Interface para o Aplicativo de Dobras.
 
 Este módulo contém funções que interagem diretamente com a interface gráfica
 (widgets PySide6). Ele é responsável por:
-- Orquestrar os cálculos do módulo `calculos`.
+- Orquestrar os cálculos do módulo `grafo_interface`.
 - Ler os dados da UI, chamar a lógica de cálculo e atualizar os widgets com os resultados.
 - Gerenciar a aparência (estilos, tooltips) dos widgets.
 - Lidar com ações diretas na interface, como limpeza de campos e cópia de valores.
 """
 
 import logging
-import traceback
-from dataclasses import dataclass
 from functools import partial
 from typing import Any, Dict, Optional
 
@@ -21,32 +19,19 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from src.config import globals as g
 from src.models.models import Canal, Deducao, Espessura, Material, Usuario
-from src.utils import calculos
-from src.utils.banco_dados import get_session
+from src.utils.banco_dados import get_read_session
 from src.utils.cache_manager import cache_manager
-from src.utils.utilitarios import obter_caminho_asset
-from src.utils.widget import WidgetManager, append_row
+from src.utils.grafo_interface import (  # noqa: F401  # pylint: disable=unused-import
+    atualizar_aba,
+    calcular_valores,
+    coletar_dados_entrada,
+    estilo_fator_k,
+)
+from src.utils.widget import WidgetDiffUpdater, WidgetManager, append_row
 
 # pylint: disable=R0902
 
 
-@dataclass
-class UIData:
-    """Estrutura para armazenar os dados coletados da interface."""
-
-    material_nome: str
-    espessura_str: str
-    canal_str: str
-    raio_interno_str: str
-    comprimento_str: str
-    deducao_espec_str: str
-    espessura: float
-    raio_interno: float
-    comprimento: float
-    deducao_espec: float
-    deducao_usada: float = 0.0
-
-
 class CopyManager:
     """Gerencia operações de cópia de valores dos widgets."""
 
@@ -87,8 +72,8 @@ class CopyManager:
             return
 
         pyperclip.copy(texto_original)
-        label.setText("Copiado!")
-        label.setStyleSheet("QLabel { color: green; }")
+        WidgetDiffUpdater.set_text(label, "Copiado!")
+        WidgetDiffUpdater.set_state(label, "copiado")
         QTimer.singleShot(500, partial(self._restaurar_label, label, texto_original))
 
     def _restaurar_label(self, label, texto):
@@ -96,11 +81,11 @@ class CopyManager:
         if not WidgetManager.is_widget_valid(label):
             return
 
-        data = _coletar_dados_entrada()
-        estilo = _estilo(data)
+        data = coletar_dados_entrada()
+        estado = estilo_fator_k(data)
         if "Copiado!" in label.text():
-            label.setText(texto)
-            label.setStyleSheet(estilo)
+            WidgetDiffUpdater.set_text(label, texto)
+            WidgetDiffUpdater.set_state(label, estado)
 
 
 copiar = CopyManager().copiar
@@ -125,7 +110,7 @@ class ListManager:
 
         table_widget.setRowCount(0)
         try:
-            with get_session() as session:
+            with get_read_session() as session:
                 if tipo == "dedução":
                     itens = (
                         session.query(config["modelo"])
@@ -238,13 +223,22 @@ class WidgetUpdater:
             )
 
     def _atualizar_espessura(self):
-        """Atualiza combobox de espessuras baseado no material selecionado."""
+        """Atualiza combobox de espessuras baseado no material selecionado.
+
+        Usa as adjacências do índice de deduções; consulta o banco apenas se o
+        índice estiver indisponível.
+        """
         material_nome = WidgetManager.get_widget_value(g.MAT_COMB)
         if not material_nome:
             if g.ESP_COMB:
                 g.ESP_COMB.clear()
             return
 
+        espessuras = cache_manager.get_espessuras_material(material_nome)
+        if espessuras is not None:
+            self._preencher_combobox_direto(g.ESP_COMB, [str(e) for e in espessuras])
+            return
+
         self._preencher_combobox(
             g.ESP_COMB,
             lambda s: [
@@ -259,7 +253,11 @@ class WidgetUpdater:
         )
 
     def _atualizar_canal(self):
-        """Atualiza combobox de canais baseado no material e espessura selecionados."""
+        """Atualiza combobox de canais baseado no material e espessura selecionados.
+
+        Usa as adjacências do índice de deduções; consulta o banco apenas se o
+        índice estiver indisponível.
+        """
         material_nome = WidgetManager.get_widget_value(g.MAT_COMB)
         espessura_valor = WidgetManager.get_widget_value(g.ESP_COMB)
         if not (material_nome and espessura_valor):
@@ -268,6 +266,11 @@ class WidgetUpdater:
             return
         try:
             esp_val = float(espessura_valor)
+            canais = cache_manager.get_canais_material_espessura(material_nome, esp_val)
+            if canais is not None:
+                self._preencher_combobox_direto(g.CANAL_COMB, [str(c) for c in canais])
+                return
+
             self._preencher_combobox(
                 g.CANAL_COMB,
                 lambda s: [
@@ -295,7 +298,7 @@ class WidgetUpdater:
         try:
             if usar_cache or callable(items_ou_query_func):
                 if callable(items_ou_query_func):
-                    with get_session() as session:
+                    with get_read_session() as session:
                         items = items_ou_query_func(session)
                 else:
                     items = items_ou_query_func
@@ -375,7 +378,7 @@ class FormWidgetUpdater:
         current_text = WidgetManager.get_widget_value(combo)
         WidgetManager.clear_widget(combo)
         try:
-            with get_session() as session:
+            with get_read_session() as session:
                 items = query_func(session)
                 try:
                     combo.addItems(items)
@@ -503,7 +506,7 @@ def obter_material_props(nome: str):
     if not nome:
         return None
     try:
-        with get_session() as session:
+        with get_read_session() as session:
             mat = session.query(Material).filter(Material.nome == nome).first()
             if not mat:
                 return None
@@ -539,314 +542,6 @@ def limpar_tudo():
     limpar_dobras()
 
 
-def _coletar_dados_entrada() -> UIData:
-    """Coleta todos os dados de entrada da UI."""
-    return UIData(
-        material_nome=WidgetManager.get_widget_value(g.MAT_COMB),
-        espessura_str=WidgetManager.get_widget_value(g.ESP_COMB),
-        canal_str=WidgetManager.get_widget_value(g.CANAL_COMB),
-        raio_interno_str=WidgetManager.get_widget_value(g.RI_ENTRY),
-        comprimento_str=WidgetManager.get_widget_value(g.COMPR_ENTRY),
-        deducao_espec_str=WidgetManager.get_widget_value(g.DED_ESPEC_ENTRY),
-        espessura=calculos.converter_para_float(
-            WidgetManager.get_widget_value(g.ESP_COMB)
-        ),
-        raio_interno=calculos.converter_para_float(
-            WidgetManager.get_widget_value(g.RI_ENTRY)
-        ),
-        comprimento=calculos.converter_para_float(
-            WidgetManager.get_widget_value(g.COMPR_ENTRY)
-        ),
-        deducao_espec=calculos.converter_para_float(
-            WidgetManager.get_widget_value(g.DED_ESPEC_ENTRY)
-        ),
-    )
-
-
-def _atualizar_label(
-    label,
-    valor,
-    formato="{:.2f}",
-    estilo_sucesso="",
-    estilo_erro="QLabel {color: red;}",
-):
-    """Função genérica para atualizar um QLineEdit ou QLabel."""
-    if not WidgetManager.is_widget_valid(label):
-        return
-    if valor is None or valor == "":
-        label.setText("")
-        label.setStyleSheet(estilo_sucesso)
-        return
-    if isinstance(valor, str) and valor == "N/A":
-        label.setText("N/A")
-        label.setStyleSheet(estilo_erro)
-        return
-    try:
-        label.setText(formato.format(float(valor)))
-        label.setStyleSheet(estilo_sucesso)
-    except (ValueError, TypeError):
-        label.setText(str(valor))
-        label.setStyleSheet(estilo_sucesso)
-
-
-def _atualizar_deducao_ui(data: UIData) -> float:
-    """Busca a dedução no DB, atualiza a UI e retorna a dedução a ser usada."""
-    res_db = calculos.CalculoDeducaoDB().buscar(
-        data.material_nome, data.espessura_str, data.canal_str
-    )
-    deducao_db_valor = ""
-    if res_db:
-        valor = (
-            res_db.get("valor")
-            if hasattr(res_db, "get")
-            else getattr(res_db, "valor", None)
-        )
-        obs = (
-            res_db.get("obs", "")
-            if hasattr(res_db, "get")
-            else getattr(res_db, "obs", "")
-        )
-        _atualizar_label(g.DED_LBL, valor, formato="{:.2f}")
-        if g.OBS_LBL:
-            g.OBS_LBL.setText(obs)
-        deducao_db_valor = str(valor or "")
-    else:
-        _atualizar_label(g.DED_LBL, None)
-        if g.OBS_LBL:
-            g.OBS_LBL.setText("")
-
-    return (
-        data.deducao_espec
-        if data.deducao_espec > 0
-        else calculos.converter_para_float(deducao_db_valor)
-    )
-
-
-def _estilo(data: UIData):
-    if not g.K_LBL or g.K_LBL.text() == "":
-        if g.K_LBL:
-            g.K_LBL.setToolTip(
-                "Fator K calculado com base no raio interno. Clique para copiar."
-            )
-        return "QLabel {color: palette(text);}"
-    if data.deducao_espec > 0:
-        g.K_LBL.setToolTip(
-            "Fator K calculado com dedução específica. Clique para copiar."
-        )
-        return "QLabel {color: blue;}"
-    if not data.canal_str:
-        g.K_LBL.setToolTip(
-            "Fator K teórico com base na tabela Raio/Espessura. Clique para copiar."
-        )
-        return "QLabel {color: orange;}"
-    g.K_LBL.setToolTip(
-        "Fator K calculado com base no raio interno. Clique para copiar."
-    )
-    return "QLabel {color: palette(text);}"
-
-
-def _atualizar_k_offset_ui(data: UIData, deducao_usada: float):
-    """Calcula e atualiza os campos de Fator K e Offset."""
-    res_k = (
-        calculos.CalculoFatorK().calcular(
-            data.espessura, data.raio_interno, deducao_usada
-        )
-        if data.espessura > 0 and data.raio_interno > 0
-        else None
-    )
-    estilo = _estilo(data)
-    _atualizar_label(
-        g.K_LBL,
-        (
-            res_k.get("fator_k")
-            if res_k
-            else ("N/A" if data.espessura > 0 and data.raio_interno > 0 else None)
-        ),
-        estilo_sucesso=estilo,
-    )
-    _atualizar_label(
-        g.OFFSET_LBL,
-        (
-            res_k.get("offset")
-            if res_k
-            else ("N/A" if data.espessura > 0 and data.raio_interno > 0 else None)
-        ),
-        estilo_sucesso=estilo,
-    )
-
-
-def _atualizar_parametros_auxiliares_ui(data: UIData, deducao_usada: float) -> float:
-    """Calcula e atualiza Aba Mínima, Z Mínimo, Razão RI/E e retorna a aba mínima."""
-    aba_min = calculos.CalculoAbaMinima().calcular(data.canal_str, data.espessura)
-    _atualizar_label(
-        g.ABA_EXT_LBL,
-        aba_min if data.canal_str and data.espessura > 0 else None,
-        formato="{:.0f}",
-    )
-    z_min = calculos.CalculoZMinimo().calcular(
-        data.espessura, deducao_usada, data.canal_str
-    )
-    _atualizar_label(
-        g.Z_EXT_LBL,
-        z_min if data.espessura > 0 and data.canal_str else None,
-        formato="{:.0f}",
-    )
-    razao = calculos.CalculoRazaoRIE().calcular(data.espessura, data.raio_interno)
-    _atualizar_label(
-        g.RAZAO_RIE_LBL,
-        razao if data.espessura > 0 and data.raio_interno > 0 else None,
-        formato="{:.1f}",
-    )
-    return float(aba_min) if aba_min is not None else 0.0
-
-
-def _atualizar_forca_ui(data: UIData):
-    """Calcula e atualiza o campo de Força."""
-    if data.material_nome and data.espessura_str and data.canal_str:
-        res_forca = calculos.CalculoForca().calcular(
-            data.comprimento, data.espessura, data.material_nome, data.canal_str
-        )
-        forca_valor = res_forca.get("forca") if res_forca else "N/A"
-        _atualizar_label(g.FORCA_LBL, forca_valor, formato="{:.0f}")
-
-        # Aplicar cor baseada no valor da força
-        if WidgetManager.is_widget_valid(g.FORCA_LBL) and forca_valor != "N/A":
-            try:
-                forca_num = float(forca_valor)
-                if forca_num <= 250:
-                    g.FORCA_LBL.setStyleSheet(
-                        "QLabel { color: palette(text); }"
-                    )  # Cor original
-                elif 250 < forca_num <= 280:
-                    g.FORCA_LBL.setStyleSheet("QLabel { color: orange; }")
-                else:  # acima de 280
-                    g.FORCA_LBL.setStyleSheet("QLabel { color: red; }")
-            except (ValueError, TypeError):
-                # Fallback para cor original
-                g.FORCA_LBL.setStyleSheet("QLabel { color: palette(text); }")
-        else:
-            # Cor original se inválido ou N/A
-            g.FORCA_LBL.setStyleSheet("QLabel { color: palette(text); }")
-
-        compr_total = res_forca.get("comprimento_total") if res_forca else None
-        excedido = (
-            data.comprimento > 0
-            and compr_total is not None
-            and data.comprimento >= compr_total
-        )
-        if g.COMPR_ENTRY:
-            g.COMPR_ENTRY.setStyleSheet("QLineEdit {color: red;}" if excedido else "")
-    else:
-        _atualizar_label(g.FORCA_LBL, None)
-        if WidgetManager.is_widget_valid(g.FORCA_LBL):
-            g.FORCA_LBL.setStyleSheet("")  # Cor original
-        if g.COMPR_ENTRY:
-            g.COMPR_ENTRY.setStyleSheet("QLineEdit{color: palette(window-text);}")
-
-# pylint: disable=R0914
-
-
-def _atualizar_coluna_dobras_ui(w: int, deducao_usada: float, aba_min: float):
-    """Calcula e atualiza uma coluna inteira de dobras na UI."""
-    valores = [
-        calculos.converter_para_float(
-            WidgetManager.get_widget_value(getattr(g, f"aba{i}_entry_{w}", None))
-        )
-        for i in range(1, g.N)
-    ]
-    res = calculos.CalculoDobra().calcular_coluna(valores, deducao_usada)
-    total_abas = res.get("total_abas", 0) if res else 0
-    blank = res.get("blank_total", 0) if res else 0
-
-    # Verifica status das abas para lógica de bandeja
-    abas_1_3_preenchidas = len(valores) >= 3 and all(v > 0 for v in valores[:3])
-    abas_1_5_preenchidas = len(valores) >= 5 and all(v > 0 for v in valores[:5])
-
-    for i in range(1, g.N):
-        medida = res["resultados"][i - 1].get("medida") if res else None
-        metade = res["resultados"][i - 1].get("metade") if res else None
-        _atualizar_label(getattr(g, f"medidadobra{i}_label_{w}", None), medida)
-        _atualizar_label(getattr(g, f"metadedobra{i}_label_{w}", None), metade)
-
-        entry = getattr(g, f"aba{i}_entry_{w}", None)
-        if WidgetManager.is_widget_valid(entry):
-            val = valores[i - 1]
-            invalida = aba_min is not None and 0 < val < aba_min
-
-            # Alerta de bandeja: Apenas Aba 1 (se 1-3 estiverem ok)
-            # e Aba 5 (se 1-5 estiverem ok), se valor > 20
-            alerta_bandeja = (
-                val > 20
-                and (
-                    (i == 1 and abas_1_3_preenchidas)
-                    or (i == 5 and abas_1_5_preenchidas)
-                )
-            )
-
-            if invalida:
-                entry.setStyleSheet(
-                    "QLineEdit { color: white; background-color: red; } "
-                    "QLineEdit:hover { border: 1px solid darkred; } "
-                    "QLineEdit:focus { border: 1px solid darkred; }"
-                    "QToolTip { color: palette(text); background-color: palette(base); }"
-                )
-                entry.setToolTip(
-                    f"Aba <b><span style='background-color:red; color:white;'>"
-                    f"{val:.0f}mm</span></b> menor que a mínima <b>{aba_min:.0f}mm</b>."
-                )
-            elif alerta_bandeja:
-                entry.setStyleSheet(
-                    "QLineEdit { color: red; background-color: palette(base); font-weight: bold; }"
-                    "QToolTip { color: palette(text); background-color: palette(base); }"
-                )
-                img_path = obter_caminho_asset(
-                    "assets/canto_bandeja.PNG").replace("\\", "/")
-                entry.setToolTip(
-                    f"<html><table width='200'><tr><td align='center'>"
-                    f"Se necessário o uso da ferramenta <b>'bigode'</b>, adicionar alívio de dobra "
-                    f"se aba <b><span style='color:red;'>maior que 20mm</span></b>.<br>"
-                    f"<img src='{img_path}' width='200'></td></tr></table></html>"
-                )
-            else:
-                entry.setStyleSheet(
-                    "QLineEdit { color: palette(text); background-color: palette(base); }"
-                    "QToolTip { color: palette(text); background-color: palette(base); }"
-                )
-                entry.setToolTip(
-                    f"Digite o valor da medida externa para a dobra {i} (Use ↑↓ para navegar)"
-                )
-
-    _atualizar_label(
-        getattr(g, f"total_abas_label_{w}", None),
-        total_abas if total_abas > 0 else None,
-    )
-    _atualizar_label(
-        getattr(g, f"medida_blank_label_{w}", None), blank if blank > 0 else None
-    )
-    _atualizar_label(
-        getattr(g, f"metade_blank_label_{w}", None), blank / 2 if blank > 0 else None
-    )
-
-
-def calcular_valores():
-    """Função principal que orquestra todos os cálculos e atualizações da UI.
-
-    SISTEMA OTIMIZADO: Execução direta sem delay desnecessário.
-    """
-    try:
-        ui_data = _coletar_dados_entrada()
-        deducao_usada = _atualizar_deducao_ui(ui_data)
-        _atualizar_k_offset_ui(ui_data, deducao_usada)
-        aba_min = _atualizar_parametros_auxiliares_ui(ui_data, deducao_usada)
-        _atualizar_forca_ui(ui_data)
-
-        if hasattr(g, "VALORES_W"):
-            for w in g.VALORES_W:
-                _atualizar_coluna_dobras_ui(w, deducao_usada, aba_min)
-    except (AttributeError, ValueError, TypeError, SQLAlchemyError) as e:
-        logging.error("Erro em calcular_valores: %s\n%s", e, traceback.format_exc())
-
-
 def todas_funcoes():
     """Executa a atualização completa da interface, incluindo comboboxes.
 
@@ -916,7 +611,7 @@ def canal_tooltip():
                     f"Obs: {obs}"
                 )
             else:
-                with get_session() as session:
+                with get_read_session() as session:
                     canal_obj = session.query(Canal).filter_by(valor=canal_str).first()
                     if canal_obj:
                         largura = (
@@ -12,6 +12,7 @@ from src.components.avisos import AvisosWidget
 from src.components.cabecalho import cabecalho
 from src.components.dobra_90 import dobras
 from src.config import globals as g
+from src.utils.grafo_interface import grafo_interface
 from src.utils.interface import calcular_valores, todas_funcoes
 from src.utils.utilitarios import WIDGET_CABECALHO, tem_configuracao_dobras_valida
 from src.utils.widget import widget_state_manager
@@ -99,6 +100,7 @@ def _preparar_interface_reload(layout):
 
     safe_clear_layout(layout)
     clear_global_widget_references()
+    grafo_interface.invalidar()
     safe_process_events()
 
 
@@ -18,7 +18,7 @@ try:
     import psutil
 except ModuleNotFoundError:  # pragma: no cover - optional dep
     psutil = None  # pylint: disable=invalid-name
-from src.utils.utilitarios import CACHE_DIR, COMMAND_DIR, RUNTIME_DIR, SESSION_DIR
+from src.utils.caminhos import CACHE_DIR, COMMAND_DIR, RUNTIME_DIR, SESSION_DIR
 
 FILE_ATTRIBUTE_HIDDEN = 0x02
 
@@ -48,6 +48,8 @@ def _hide_path(path: str) -> None:
 # Arquivos de Sinalização (Signal Files) para atualizações em tempo real
 SIGNAL_DIR = os.path.join(RUNTIME_DIR, "signals")
 AVISOS_SIGNAL_FILE = os.path.join(SIGNAL_DIR, "avisos_updated.signal")
+# Sinal de escrita em materiais/espessuras/canais/deduções (invalidação de cache)
+DADOS_SIGNAL_FILE = os.path.join(SIGNAL_DIR, "dados_updated.signal")
 
 
 def ensure_ipc_dirs_exist() -> None:
@@ -67,10 +69,11 @@ def ensure_ipc_dirs_exist() -> None:
             os.makedirs(CACHE_DIR, exist_ok=True)
             os.makedirs(SIGNAL_DIR, exist_ok=True)
 
-        # Garante a existência do arquivo de sinal
-        if not os.path.exists(AVISOS_SIGNAL_FILE):
-            with open(AVISOS_SIGNAL_FILE, 'w', encoding="utf-8") as f:
-                f.write(str(time.time()))
+        # Garante a existência dos arquivos de sinal
+        for signal_file in (AVISOS_SIGNAL_FILE, DADOS_SIGNAL_FILE):
+            if not os.path.exists(signal_file):
+                with open(signal_file, 'w', encoding="utf-8") as f:
+                    f.write(str(time.time()))
 
     except OSError as e:
         logging.critical("Não foi possível criar os diretórios de IPC: %s", e)
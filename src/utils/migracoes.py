@@ -0,0 +1,94 @@
+"""Executor de migrações versionadas do esquema do banco de dados.
+
+``Base.metadata.create_all`` só cria tabelas inexistentes; índices e outras
+alterações em bancos já existentes são aplicados aqui. A versão do esquema fica
+registrada na tabela ``system_control`` (chave ``SCHEMA_VERSION``) e cada
+migração pendente é executada uma única vez, em ordem, na sua própria transação.
+"""
+
+import logging
+from typing import Callable, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+
+from src.models.models import Base, SystemControl
+
+CHAVE_VERSAO = "SCHEMA_VERSION"
+
+
+def _criar_indices(conn: Connection):
+    """Cria os índices declarados nos modelos que ainda não existem no banco."""
+    for tabela in Base.metadata.sorted_tables:
+        for indice in tabela.indexes:
+            indice.create(bind=conn, checkfirst=True)
+
+
+# Lista ordenada de migrações: (versão, descrição, função)
+MIGRACOES: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "Índices de busca e de deduções", _criar_indices),
+]
+
+
+def obter_versao_esquema(conn: Connection) -> int:
+    """Lê a versão atual do esquema (0 se nunca foi registrada)."""
+    tabela = SystemControl.__table__
+    valor = conn.execute(
+        tabela.select()
+        .with_only_columns(tabela.c.value)
+        .where(tabela.c.key == CHAVE_VERSAO)
+    ).scalar()
+    try:
+        return int(valor) if valor is not None else 0
+    except ValueError:
+        logging.warning("Versão de esquema inválida no banco: %r", valor)
+        return 0
+
+
+def _gravar_versao_esquema(conn: Connection, versao: int):
+    """Grava a versão do esquema na tabela de controle do sistema."""
+    tabela = SystemControl.__table__
+    atualizadas = conn.execute(
+        tabela.update().where(tabela.c.key == CHAVE_VERSAO).values(value=str(versao))
+    ).rowcount
+    if not atualizadas:
+        conn.execute(
+            tabela.insert().values(type="CONFIG", key=CHAVE_VERSAO, value=str(versao))
+        )
+
+
+def executar_migracoes(engine: Engine) -> int:
+    """Aplica as migrações pendentes e atualiza as estatísticas do SQLite.
+
+    Returns:
+        int: Quantidade de migrações aplicadas.
+    """
+    with engine.connect() as conn:
+        versao_atual = obter_versao_esquema(conn)
+
+    pendentes = [m for m in MIGRACOES if m[0] > versao_atual]
+    if not pendentes:
+        return 0
+
+    for versao, descricao, funcao in pendentes:
+        try:
+            with engine.begin() as conn:
+                # Revalida dentro da transação: outra estação pode ter migrado
+                if obter_versao_esquema(conn) >= versao:
+                    continue
+                logging.info("Aplicando migração %d: %s", versao, descricao)
+                funcao(conn)
+                _gravar_versao_esquema(conn, versao)
+        except SQLAlchemyError as e:
+            logging.error("Falha na migração %d (%s): %s", versao, descricao, e)
+            raise
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+    except OperationalError as e:
+        logging.warning("Não foi possível executar ANALYZE: %s", e)
+
+    logging.info("Esquema do banco atualizado para a versão %d", pendentes[-1][0])
+    return len(pendentes)
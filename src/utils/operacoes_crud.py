@@ -15,7 +15,7 @@ from typing import Any, Dict, Optional, Tuple
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.config import globals as g
-from src.models.models import Canal, Deducao, Espessura, Material
+from src.models.models import Canal, Deducao, Espessura, FatorK, Material
 from src.utils.banco_dados import get_session, registrar_log
 
 
@@ -64,7 +64,7 @@ def criar_material(dados: Dict[str, Any]) -> Tuple[bool, str, Optional[Material]
                 cache_manager,
             )
 
-            cache_manager.invalidate_cache(["materiais"])
+            cache_manager.notificar_alteracao(["materiais"])
             logging.info("Cache de materiais invalidado após adição")
         except (ImportError, AttributeError, RuntimeError) as e:
             logging.warning("Erro ao invalidar cache de materiais: %s", e)
@@ -107,7 +107,7 @@ def criar_espessura(valor: str) -> Tuple[bool, str, Optional[Espessura]]:
                     cache_manager,
                 )
 
-                cache_manager.invalidate_cache(["espessuras"])
+                cache_manager.notificar_alteracao(["espessuras"])
                 logging.info("Cache de espessuras invalidado após adição")
             except (ImportError, AttributeError, RuntimeError) as e:
                 logging.warning("Erro ao invalidar cache de espessuras: %s", e)
@@ -153,7 +153,7 @@ def criar_canal(dados: Dict[str, Any]) -> Tuple[bool, str, Optional[Canal]]:
                 cache_manager,
             )
 
-            cache_manager.invalidate_cache(["canais"])
+            cache_manager.notificar_alteracao(["canais"])
             logging.info("Cache de canais invalidado após adição")
         except (ImportError, AttributeError, RuntimeError) as e:
             logging.warning("Erro ao invalidar cache de canais: %s", e)
@@ -232,7 +232,7 @@ def criar_deducao(dados: Dict[str, Any]) -> Tuple[bool, str, Optional[Deducao]]:
                 cache_manager,
             )
 
-            cache_manager.invalidate_cache(["deducoes"])
+            cache_manager.notificar_alteracao(["deducoes"])
             logging.info("Cache de deduções invalidado após adição")
         except (ImportError, AttributeError, RuntimeError) as e:
             logging.warning("Erro ao invalidar cache de deduções: %s", e)
@@ -255,6 +255,7 @@ def excluir_objeto(obj_id: int, obj_type: type) -> Tuple[bool, str]:
 
             if isinstance(obj, Material):
                 session.query(Deducao).filter(Deducao.material_id == obj.id).delete()
+                session.query(FatorK).filter(FatorK.material_id == obj.id).delete()
             elif isinstance(obj, Espessura):
                 session.query(Deducao).filter(Deducao.espessura_id == obj.id).delete()
             elif isinstance(obj, Canal):
@@ -293,7 +294,7 @@ def excluir_objeto(obj_id: int, obj_type: type) -> Tuple[bool, str]:
 
             keys_to_invalidate = cache_keys.get(obj_type, [])
             if keys_to_invalidate:
-                cache_manager.invalidate_cache(keys_to_invalidate)
+                cache_manager.notificar_alteracao(keys_to_invalidate)
                 logging.info("Cache invalidado após exclusão: %s", keys_to_invalidate)
 
         except (ImportError, AttributeError, RuntimeError) as e:
@@ -393,7 +394,7 @@ def editar_objeto(  # pylint: disable=too-many-locals,too-many-branches
 
             keys_to_invalidate = cache_keys.get(type(obj), [])
             if keys_to_invalidate:
-                cache_manager.invalidate_cache(keys_to_invalidate)
+                cache_manager.notificar_alteracao(keys_to_invalidate)
                 logging.info("Cache invalidado após edição: %s", keys_to_invalidate)
 
         except (ImportError, AttributeError, RuntimeError) as e:
@@ -0,0 +1,182 @@
+"""Pareamento dos arquivos das listas A e B para a comparação.
+
+Em vez de comparar a linha N de uma lista com a linha N da outra, os arquivos
+são casados em etapas, da mais barata à mais cara:
+
+1. nome idêntico (sem extensão, sem diferenciar maiúsculas);
+2. nome sem sufixos de revisão (``_rev2``, ``-R03``, `` v2``, `` (1)``...);
+3. conteúdo idêntico (mesmo tamanho e mesmo hash), para arquivos renomeados.
+
+Os pares são produzidos à medida que são resolvidos, para que a comparação
+comece antes de terminar o pareamento; arquivos sem correspondente saem por
+último, com o outro lado vazio.
+"""
+
+import os
+import re
+from collections import deque
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# (índice na lista A, índice na lista B, critério); um dos índices pode faltar
+Par = Tuple[Optional[int], Optional[int], str]
+
+# Índices ainda sem par; dicionário (valores ``None``) usado como conjunto
+# ordenado, para remover em O(1) sem perder a ordem das listas
+Restantes = Dict[int, None]
+
+CRITERIO_NOME = "nome"
+CRITERIO_REVISAO = "nome sem revisão"
+CRITERIO_CONTEUDO = "conteúdo"
+CRITERIO_SEM_PAR = ""
+
+# Sufixo de revisão ou de cópia no fim do nome (aplicado repetidamente); depois
+# de "rev" só aceita número ou uma letra, para não cortar "_review", "_reverb"...
+_SUFIXO_REVISAO = re.compile(
+    r"(?:\s*\(\d+\)"
+    r"|[\s_.-]+rev(?:is[aã]o)?[\s_.-]*(?:\d{1,3}|[a-z])"
+    r"|[\s_.-]+[rv]\d{1,3})$",
+    re.IGNORECASE,
+)
+
+
+def nome_exato(path: str) -> str:
+    """Nome do arquivo sem extensão, normalizado para comparação."""
+    return os.path.splitext(os.path.basename(path))[0].strip().casefold()
+
+
+def nome_sem_revisao(path: str) -> str:
+    """Nome do arquivo sem extensão e sem sufixos de revisão ou de cópia."""
+    nome = nome_exato(path)
+    while True:
+        reduzido = _SUFIXO_REVISAO.sub("", nome)
+        if reduzido == nome or not reduzido:
+            return nome
+        nome = reduzido
+
+
+def expandir_pastas(paths: Iterable[str], extensoes: Sequence[str]) -> List[str]:
+    """Substitui as pastas pelos arquivos (com as extensões) de toda a árvore.
+
+    Args:
+        paths: Arquivos e pastas informados pelo usuário.
+        extensoes: Extensões aceitas (ex.: ``(".step", ".stp")``); vazio aceita
+            qualquer arquivo.
+    """
+    sufixos = tuple(ext.lower() for ext in extensoes)
+    arquivos: List[str] = []
+    for path in paths:
+        if not os.path.isdir(path):
+            arquivos.append(path)
+            continue
+        for raiz, pastas, nomes in os.walk(path):
+            pastas.sort(key=str.casefold)
+            arquivos.extend(
+                os.path.join(raiz, nome)
+                for nome in sorted(nomes, key=str.casefold)
+                if not sufixos or nome.lower().endswith(sufixos)
+            )
+    return arquivos
+
+
+def _parear_por_chave(
+    files_a: Sequence[str],
+    files_b: Sequence[str],
+    restantes_a: Restantes,
+    restantes_b: Restantes,
+    chave: Callable[[str], str],
+) -> Iterator[Tuple[int, int]]:
+    """Casa os restantes cuja chave coincide, na ordem das listas."""
+    indice_b: Dict[str, Deque[int]] = {}
+    for ib in restantes_b:
+        indice_b.setdefault(chave(files_b[ib]), deque()).append(ib)
+    for ia in list(restantes_a):
+        candidatos = indice_b.get(chave(files_a[ia]))
+        if candidatos:
+            ib = candidatos.popleft()
+            del restantes_a[ia]
+            del restantes_b[ib]
+            yield ia, ib
+
+
+def _tamanho(path: str) -> Optional[int]:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def _parear_por_conteudo(
+    files_a: Sequence[str],
+    files_b: Sequence[str],
+    restantes_a: Restantes,
+    restantes_b: Restantes,
+    obter_hash: Callable[[str], Optional[str]],
+) -> Iterator[Tuple[int, int]]:
+    """Casa os restantes de mesmo conteúdo; só calcula hash com tamanho igual."""
+    por_tamanho: Dict[int, Restantes] = {}
+    for ib in restantes_b:
+        tamanho = _tamanho(files_b[ib])
+        if tamanho is not None:
+            por_tamanho.setdefault(tamanho, {})[ib] = None
+
+    for ia in list(restantes_a):
+        candidatos = por_tamanho.get(_tamanho(files_a[ia]))
+        if not candidatos:
+            continue
+        hash_a = obter_hash(files_a[ia])
+        if hash_a is None:
+            continue
+        for ib in candidatos:
+            if obter_hash(files_b[ib]) == hash_a:
+                del candidatos[ib]
+                del restantes_a[ia]
+                del restantes_b[ib]
+                yield ia, ib
+                break
+
+
+def parear(
+    files_a: Sequence[str],
+    files_b: Sequence[str],
+    obter_hash: Optional[Callable[[str], Optional[str]]] = None,
+) -> Iterator[Par]:
+    """Produz os pares (índice A, índice B, critério) das duas listas.
+
+    Args:
+        files_a: Arquivos da lista A.
+        files_b: Arquivos da lista B.
+        obter_hash: Função que retorna o hash do conteúdo de um arquivo; sem
+            ela, arquivos renomeados não são casados pelo conteúdo.
+    """
+    restantes_a: Restantes = dict.fromkeys(range(len(files_a)))
+    restantes_b: Restantes = dict.fromkeys(range(len(files_b)))
+
+    for criterio, chave in (
+        (CRITERIO_NOME, nome_exato),
+        (CRITERIO_REVISAO, nome_sem_revisao),
+    ):
+        for ia, ib in _parear_por_chave(
+            files_a, files_b, restantes_a, restantes_b, chave
+        ):
+            yield ia, ib, criterio
+
+    if obter_hash is not None and restantes_a and restantes_b:
+        for ia, ib in _parear_por_conteudo(
+            files_a, files_b, restantes_a, restantes_b, obter_hash
+        ):
+            yield ia, ib, CRITERIO_CONTEUDO
+
+    for ia in restantes_a:
+        yield ia, None, CRITERIO_SEM_PAR
+    for ib in restantes_b:
+        yield None, ib, CRITERIO_SEM_PAR
@@ -0,0 +1,117 @@
+"""Modo de diagnóstico que mede o tempo de importação de cada módulo.
+
+Ativado pela variável de ambiente ``CALCULADORA_DOBRA_PERFIL_IMPORTS=1``
+(inclusive no executável empacotado, onde ``python -X importtime`` não está
+disponível). Um finder no início de ``sys.meta_path`` envolve o loader de cada
+módulo e registra o tempo próprio e o acumulado (com submódulos) de sua
+execução; ao encerrar o programa, os módulos mais lentos são enviados ao log.
+"""
+
+import atexit
+import importlib.abc
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Tuple
+
+VARIAVEL_AMBIENTE = "CALCULADORA_DOBRA_PERFIL_IMPORTS"
+
+# Quantidade de módulos listados no relatório
+TOP_MODULOS = 30
+
+# {módulo: (tempo próprio, tempo acumulado)} em segundos
+_tempos: Dict[str, Tuple[float, float]] = {}
+_local = threading.local()
+
+
+class _LoaderCronometrado(importlib.abc.Loader):
+    """Envolve um loader e mede a execução do módulo."""
+
+    def __init__(self, loader, nome: str):
+        self._loader = loader
+        self._nome = nome
+
+    def __getattr__(self, item):
+        # Repassa get_resource_reader, get_data etc. ao loader original
+        return getattr(self._loader, item)
+
+    def create_module(self, spec):
+        """Delega a criação do módulo ao loader original."""
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        """Executa o módulo, descontando do tempo próprio o de seus imports."""
+        pilha = getattr(_local, "pilha", None)
+        if pilha is None:
+            pilha = _local.pilha = []
+        pilha.append(0.0)
+        inicio = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = time.perf_counter() - inicio
+            filhos = pilha.pop()
+            if pilha:
+                pilha[-1] += total
+            _tempos[self._nome] = (total - filhos, total)
+
+
+class _FinderCronometrado(importlib.abc.MetaPathFinder):
+    """Delegação aos demais finders, trocando o loader pelo cronometrado."""
+
+    def find_spec(self, fullname, path, target=None):
+        """Localiza o módulo pelos demais finders e cronometra o seu loader."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _LoaderCronometrado(spec.loader, fullname)
+            return spec
+        return None
+
+
+def relatorio(limite: int = TOP_MODULOS) -> List[Tuple[str, float, float]]:
+    """Retorna os módulos mais lentos como (nome, próprio, acumulado) em ms."""
+    ordenados = sorted(_tempos.items(), key=lambda item: item[1][0], reverse=True)
+    return [
+        (nome, proprio * 1000, acumulado * 1000)
+        for nome, (proprio, acumulado) in ordenados[:limite]
+    ]
+
+
+def _registrar_relatorio():
+    """Envia ao log o relatório de importações (executado na saída)."""
+    logger = logging.getLogger("perfil_importacao")
+    linhas = [
+        f"{proprio:9.1f} {acumulado:9.1f}  {nome}"
+        for nome, proprio, acumulado in relatorio()
+    ]
+    logger.info(
+        "Tempo de importação (ms) de %d módulos:\n%9s %9s  %s\n%s",
+        len(_tempos),
+        "próprio",
+        "acumulado",
+        "módulo",
+        "\n".join(linhas),
+    )
+
+
+def ativar() -> bool:
+    """Instala o finder cronometrado, se ainda não estiver ativo."""
+    if any(isinstance(f, _FinderCronometrado) for f in sys.meta_path):
+        return False
+    sys.meta_path.insert(0, _FinderCronometrado())
+    atexit.register(_registrar_relatorio)
+    return True
+
+
+def ativar_se_configurado() -> bool:
+    """Ativa o perfil quando a variável de ambiente estiver definida como 1."""
+    if os.environ.get(VARIAVEL_AMBIENTE) == "1":
+        return ativar()
+    return False
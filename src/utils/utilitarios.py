@@ -22,6 +22,18 @@ from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QInputDialog, QLayout, QLineEdit, QMessageBox, QWidget
 
 from src.config import globals as g
+from src.utils.caminhos import (  # noqa: F401  # pylint: disable=unused-import
+    APPDATA_DIR,
+    BASE_DIR,
+    CACHE_DIR,
+    COMMAND_DIR,
+    DATABASE_DIR,
+    DB_PATH,
+    LOG_DIR,
+    RUNTIME_DIR,
+    SESSION_DIR,
+    obter_dir_base,
+)
 from src.utils.janelas import Janela
 
 FILE_OPEN_EXCEPTIONS = (
@@ -39,22 +51,6 @@ _OPS = {ast.Add: op.add, ast.Sub: op.sub, ast.Mult: op.mul, ast.Div: op.truediv}
 # --- 1. LÓGICA CENTRALIZADA DE CAMINHOS ---
 
 
-def obter_dir_base() -> str:
-    """Retorna o diretório base da aplicação de forma consistente.
-
-    Verifica se a aplicação está rodando como um script ou como um executável
-    "congelado" para determinar o caminho raiz correto.
-
-    Returns:
-        str: O caminho absoluto para o diretório raiz da aplicação.
-    """
-    if getattr(sys, "frozen", False):
-        return os.path.dirname(sys.executable)
-    # Em modo de script, assume-se que este arquivo está em 'src/utils',
-    # então o diretório base está dois níveis acima.
-    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-
-
 def obter_caminho_asset(path_relativo: str) -> str:
     """Retorna o caminho absoluto de um asset (arquivo estático).
 
@@ -132,32 +128,9 @@ def obter_dir_help_content() -> Path:
 
 # --- Constantes de Caminhos Globais ---
 
-
-BASE_DIR = obter_dir_base()
-
-# Diretório de banco de dados
-DATABASE_DIR = os.path.join(BASE_DIR, "database")
-DB_PATH = os.path.join(DATABASE_DIR, "tabela_de_dobra.db")
-
 # Ícone da aplicação
 ICON_PATH = obter_dir_icone()
 
-# Diretório de logs
-LOG_DIR = os.path.join(BASE_DIR, "logs")
-
-# Configuração de AppData para dados do usuário
-APPDATA_DIR = os.environ.get(
-    "APPDATA", os.path.join(os.environ["USERPROFILE"], "AppData", "Roaming")
-)
-
-# Diretórios para comunicação entre processos (IPC) - mantidos no diretório base
-RUNTIME_DIR = os.path.join(BASE_DIR, ".runtime", "calculadora_dobra")
-SESSION_DIR = os.path.join(RUNTIME_DIR, "sessions")
-COMMAND_DIR = os.path.join(RUNTIME_DIR, "commands")
-
-# Cache movido para AppData
-CACHE_DIR = os.path.join(APPDATA_DIR, "Calculadora de Dobra", "cache")
-
 
 # Margens e espaçamentos padrão para layouts
 MARGEM_PADRAO = 5
@@ -464,6 +437,31 @@ def run_trusted_command(
     )
 
 
+def start_trusted_process(
+    command: Sequence[str],
+    *,
+    description: str,
+    **kwargs,
+) -> subprocess.Popen:
+    """Inicia, sem aguardar, um processo externo conhecido (ex.: sessões --shell)."""
+    if not command:
+        raise ValueError("Comando externo não pode ser vazio.")
+
+    executable, *args = command
+    resolved_executable = _resolve_executable(executable)
+    normalized_args = [str(arg) for arg in args]
+    LOGGER.debug(
+        "Iniciando processo confiável (%s): %s %s",
+        description,
+        resolved_executable,
+        " ".join(normalized_args),
+    )
+    return subprocess.Popen(  # nosec B603 - comando controlado e validado
+        [resolved_executable, *normalized_args],
+        **kwargs,
+    )
+
+
 def open_file_with_default_app(file_path: str) -> None:
     """Abre um arquivo usando o aplicativo padrão do sistema operacional."""
     resolved_path = Path(file_path).expanduser().resolve(strict=True)
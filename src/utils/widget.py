@@ -92,6 +92,7 @@ class WidgetManager:
                 widget.setCurrentText(value)
             elif hasattr(widget, "setText"):
                 widget.setText(value)
+            WidgetDiffUpdater.invalidate(widget, "text")
         except (AttributeError, RuntimeError):
             pass
 
@@ -105,10 +106,66 @@ class WidgetManager:
                 widget.clear()
             elif isinstance(widget, QLabel):
                 widget.setText("")
+            WidgetDiffUpdater.invalidate(widget, "text")
         except (AttributeError, RuntimeError):
             pass
 
 
+class WidgetDiffUpdater:
+    """Aplica texto, estado visual e tooltip apenas quando mudam.
+
+    O último estado aplicado fica guardado no próprio widget, então o Qt só é
+    acionado quando algo realmente muda. Variações de estilo usam a
+    propriedade dinâmica ``estado`` (ex.: ``"erro"``, ``"aviso"``), tratada
+    pelos seletores do estilo global, em vez de folhas de estilo por widget;
+    trocar de estado só exige repolir o widget.
+    """
+
+    _ATRIBUTO = "_ui_state"
+
+    @classmethod
+    def _state(cls, widget) -> Dict[str, Any]:
+        state = getattr(widget, cls._ATRIBUTO, None)
+        if state is None:
+            state = {}
+            setattr(widget, cls._ATRIBUTO, state)
+        return state
+
+    @classmethod
+    def invalidate(cls, widget, chave: str):
+        """Esquece o último valor aplicado (ex.: após uma escrita direta no Qt)."""
+        state = getattr(widget, cls._ATRIBUTO, None)
+        if state:
+            state.pop(chave, None)
+
+    @classmethod
+    def set_text(cls, widget, text: str):
+        """Define o texto do widget se for diferente do último aplicado."""
+        state = cls._state(widget)
+        if state.get("text") != text:
+            widget.setText(text)
+            state["text"] = text
+
+    @classmethod
+    def set_state(cls, widget, estado: str = ""):
+        """Define a propriedade dinâmica ``estado`` e repole o widget se mudou."""
+        state = cls._state(widget)
+        if state.get("estado", "") != estado:
+            widget.setProperty("estado", estado)
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+            state["estado"] = estado
+
+    @classmethod
+    def set_tooltip(cls, widget, tooltip: str):
+        """Define o tooltip do widget se for diferente do último aplicado."""
+        state = cls._state(widget)
+        if state.get("tooltip") != tooltip:
+            widget.setToolTip(tooltip)
+            state["tooltip"] = tooltip
+
+
 class WidgetStateManager:
     """Gerenciador de estado dos widgets."""
 